@@ -0,0 +1 @@
+# Shared components (3개 앱 공용)
\ No newline at end of file
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+from typing import Callable, Hashable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# 배치 조회(?ids=) 1회 요청당 최대 id 수
+BATCH_MAX_IDS = int(os.getenv("BATCH_MAX_IDS", "100"))
+
+
+def parse_ids(ids: str, kind: Callable[[str], Hashable] = int, max_ids: int = BATCH_MAX_IDS) -> list:
+    """"3,1,3" -> [3, 1, 3] (요청 순서와 중복 유지, 형식이 잘못되거나 너무 많으면 ValueError)"""
+    values = [value.strip() for value in ids.split(",") if value.strip()]
+    if not values:
+        raise ValueError("ids must not be empty")
+    if len(values) > max_ids:
+        raise ValueError(f"Too many ids (max {max_ids})")
+    try:
+        return [kind(value) for value in values]
+    except ValueError:
+        raise ValueError("Invalid ids")
+
+
+def unique_ids(ids: Iterable[Hashable]) -> list:
+    """DB 에 보낼 id 목록 (중복 제거, 순서 유지)"""
+    return list(dict.fromkeys(ids))
+
+
+def in_request_order(
+    ids: Iterable[Hashable],
+    rows: Iterable[T],
+    key: Callable[[T], Hashable] = lambda row: row.id,
+) -> List[Optional[T]]:
+    """조회 결과를 요청 id 순서로 정렬 (없는 id 는 None)"""
+    by_id = {key(row): row for row in rows}
+    return [by_id.get(id_) for id_ in ids]
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import os
+from operator import attrgetter
+from typing import Sequence, Tuple
+
+from pydantic_core import to_json
+
+# 목록 응답을 응답 모델 없이 조회 행에서 바로 직렬화 (같은 JSON, 행당 할당 감소)
+COMPACT_RESPONSES = os.getenv("COMPACT_RESPONSES", "0") == "1"
+
+
+def dump_rows(rows: Sequence, fields: Tuple[str, ...]) -> bytes:
+    """조회 행을 [{field: value}, ...] JSON 으로 직렬화
+
+    행은 속성으로 필드를 읽는 튜플형 객체(SQLAlchemy Row, gel.Object) 또는 dict(Tortoise .values()).
+    ORM 인스턴스 -> 응답 모델 -> response_model 재검증 -> dict 대신 행당 임시 dict 1개만 만든다.
+    """
+    if rows and isinstance(rows[0], dict):
+        return to_json(rows)
+    values = attrgetter(*fields) if len(fields) > 1 else (lambda row: (getattr(row, fields[0]),))
+    return to_json([dict(zip(fields, values(row))) for row in rows])
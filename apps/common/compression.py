@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+# 응답 압축 설정
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "0") == "1"
+# 서버 선호 순서 (설치되지 않은 인코딩은 무시)
+COMPRESSION_ENCODINGS = [
+    encoding.strip() for encoding in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",") if encoding.strip()
+]
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))  # 이보다 작은 응답은 압축하지 않음 (bytes)
+# 인코딩별 기본 레벨: "gzip=6,br=4,zstd=3"
+COMPRESSION_LEVELS: Dict[str, int] = {
+    name.strip(): int(level)
+    for name, level in (
+        item.split("=") for item in os.getenv("COMPRESSION_LEVELS", "").split(",") if item.strip()
+    )
+}
+# 엔드포인트별 레벨 재정의: "get_posts=1,get_users=6" (인코딩별 범위로 잘라서 적용)
+COMPRESSION_ROUTE_LEVELS: Dict[str, int] = {
+    name.strip(): int(level)
+    for name, level in (
+        item.split("=") for item in os.getenv("COMPRESSION_ROUTE_LEVELS", "").split(",") if item.strip()
+    )
+}
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+class GzipCodec:
+    name = "gzip"
+    default_level = 6
+    level_range = (1, 9)
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        # 스트리밍 중에는 청크마다 sync flush 해서 클라이언트가 바로 디코딩할 수 있게 함
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class BrotliCodec:
+    name = "br"
+    default_level = 4
+    level_range = (0, 11)
+
+    def __init__(self, level: int) -> None:
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+class ZstdCodec:
+    name = "zstd"
+    default_level = 3
+    level_range = (1, 22)
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+CODECS = {
+    codec.name: codec
+    for codec, available in ((GzipCodec, True), (BrotliCodec, brotli is not None), (ZstdCodec, zstandard is not None))
+    if available
+}
+
+
+def codec_level(codec, level: Optional[int]) -> int:
+    """요청 레벨을 인코딩별 허용 범위로 제한"""
+    if level is None:
+        level = COMPRESSION_LEVELS.get(codec.name, codec.default_level)
+    low, high = codec.level_range
+    return min(high, max(low, level))
+
+
+def negotiate(accept_encoding: str, encodings: Iterable[str]) -> Optional[str]:
+    """Accept-Encoding 과 서버 선호 순서로 인코딩 선택 (q=0 은 거부)"""
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                continue
+        accepted[name.strip().lower()] = quality
+
+    for encoding in encodings:
+        if encoding in CODECS and accepted.get(encoding, accepted.get("*", 0)) > 0:
+            return encoding
+    return None
+
+
+class CompressionStats:
+    """엔드포인트/인코딩별 압축 비용 집계 (CPU 시간은 이벤트 루프를 막은 시간과 같음)"""
+
+    def __init__(self) -> None:
+        self._stats: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    def record(self, endpoint: str, encoding: str, bytes_in: int, bytes_out: int, cpu: float, latency: float) -> None:
+        entry = self._stats.setdefault(
+            (endpoint, encoding),
+            {"responses": 0, "bytes_in": 0, "bytes_out": 0, "cpu_s": 0.0, "latency_s": 0.0},
+        )
+        entry["responses"] += 1
+        entry["bytes_in"] += bytes_in
+        entry["bytes_out"] += bytes_out
+        entry["cpu_s"] += cpu
+        entry["latency_s"] += latency
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        """메트릭 스냅샷 (응답당 평균 압축 CPU 시간과 전체 지연시간을 함께 보고)"""
+        return [
+            {
+                "endpoint": endpoint,
+                "encoding": encoding,
+                "responses": int(entry["responses"]),
+                "ratio": round(entry["bytes_out"] / entry["bytes_in"], 3) if entry["bytes_in"] else None,
+                "avg_bytes_in": int(entry["bytes_in"] / entry["responses"]),
+                "avg_bytes_out": int(entry["bytes_out"] / entry["responses"]),
+                "avg_compress_ms": round(entry["cpu_s"] / entry["responses"] * 1000, 3),
+                "avg_latency_ms": round(entry["latency_s"] / entry["responses"] * 1000, 3),
+            }
+            for (endpoint, encoding), entry in sorted(self._stats.items())
+        ]
+
+
+class CompressionMiddleware:
+    """gzip / brotli / zstd 응답 압축 ASGI 미들웨어
+
+    - 단일 본문 응답: min_size 이상이면 한 번에 압축하고 Content-Length 재계산
+    - 스트리밍 응답 (more_body): 청크 단위로 압축해 흘려보냄 (크기를 미리 알 수 없으므로 항상 압축)
+    - 레벨은 엔드포인트 이름(COMPRESSION_ROUTE_LEVELS)으로 재정의
+    - 압축에 쓴 CPU 시간은 Server-Timing 헤더(단일 본문)와 metrics_path 로 보고
+    """
+
+    def __init__(
+        self,
+        app,
+        encodings: Iterable[str] = COMPRESSION_ENCODINGS,
+        min_size: int = COMPRESSION_MIN_SIZE,
+        route_levels: Optional[Dict[str, int]] = None,
+        metrics_path: str = "/metrics/compression",
+    ) -> None:
+        self.app = app
+        self.encodings = [encoding for encoding in encodings if encoding in CODECS]
+        self.min_size = min_size
+        self.route_levels = COMPRESSION_ROUTE_LEVELS if route_levels is None else route_levels
+        self.metrics_path = metrics_path
+        self.stats = CompressionStats()
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["path"] == self.metrics_path:
+            body = json.dumps(self.stats.snapshot()).encode()
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        accept_encoding = ""
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = negotiate(accept_encoding, self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        start_message = None
+        codec = None
+        endpoint = ""
+        bytes_in = bytes_out = 0
+        cpu = 0.0
+
+        async def send_wrapper(message) -> None:
+            nonlocal start_message, codec, endpoint, bytes_in, bytes_out, cpu
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if start_message is not None:
+                # 첫 본문 메시지: 압축 여부 결정
+                start, start_message = start_message, None
+                body = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                headers = [(key.lower(), value) for key, value in start["headers"]]
+                content_type = next((value for key, value in headers if key == b"content-type"), b"").decode("latin-1")
+                if (
+                    start["status"] in (204, 304)
+                    or any(key == b"content-encoding" for key, _ in headers)
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or (not more_body and len(body) < self.min_size)
+                ):
+                    await send(start)
+                    await send(message)
+                    return
+
+                endpoint_func = scope.get("endpoint")
+                endpoint = getattr(endpoint_func, "__name__", scope["path"])
+                codec_cls = CODECS[encoding]
+                codec = codec_cls(codec_level(codec_cls, self.route_levels.get(endpoint)))
+
+                cpu_started = time.thread_time()
+                compressed = codec.compress(body) if more_body else codec.finish(body)
+                cpu += time.thread_time() - cpu_started
+                bytes_in += len(body)
+                bytes_out += len(compressed)
+
+                headers = [(key, value) for key, value in headers if key != b"content-length"]
+                headers.append((b"content-encoding", encoding.encode()))
+                headers.append((b"vary", b"Accept-Encoding"))
+                if not more_body:
+                    headers.append((b"content-length", str(len(compressed)).encode()))
+                    headers.append((b"server-timing", f"compress;dur={cpu * 1000:.3f}".encode()))
+                await send({**start, "headers": headers})
+                await send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+                if not more_body:
+                    self.stats.record(endpoint, encoding, bytes_in, bytes_out, cpu, time.perf_counter() - started)
+                return
+
+            if codec is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            cpu_started = time.thread_time()
+            compressed = codec.compress(body) if more_body else codec.finish(body)
+            cpu += time.thread_time() - cpu_started
+            bytes_in += len(body)
+            bytes_out += len(compressed)
+            await send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+            if not more_body:
+                self.stats.record(endpoint, encoding, bytes_in, bytes_out, cpu, time.perf_counter() - started)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Dict, Iterable, Optional
+
+# Adaptive concurrency 설정
+CONCURRENCY_LIMIT_ENABLED = os.getenv("CONCURRENCY_LIMIT_ENABLED", "0") == "1"
+CONCURRENCY_INITIAL_LIMIT = int(os.getenv("CONCURRENCY_INITIAL_LIMIT", "10"))
+CONCURRENCY_MIN_LIMIT = int(os.getenv("CONCURRENCY_MIN_LIMIT", "1"))
+CONCURRENCY_MAX_LIMIT = int(os.getenv("CONCURRENCY_MAX_LIMIT", "100"))
+CONCURRENCY_TARGET_LATENCY_MS = float(os.getenv("CONCURRENCY_TARGET_LATENCY_MS", "50"))
+CONCURRENCY_RETRY_AFTER = os.getenv("CONCURRENCY_RETRY_AFTER", "1")  # 503 응답의 Retry-After (초)
+
+HIGH = "high"
+LOW = "low"
+
+
+class AIMDLimiter:
+    """관측 지연시간 기반 AIMD 동시성 제한기
+
+    - 목표 지연시간 이내로 끝난 요청: limit += 1 / limit (limit 개 요청마다 약 +1)
+    - 목표 초과 또는 5xx: limit *= backoff_ratio
+    - 낮은 우선순위 요청은 limit * low_priority_ratio 까지만 허용 (읽기가 쓰기보다 우선)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = CONCURRENCY_INITIAL_LIMIT,
+        min_limit: int = CONCURRENCY_MIN_LIMIT,
+        max_limit: int = CONCURRENCY_MAX_LIMIT,
+        target_latency_ms: float = CONCURRENCY_TARGET_LATENCY_MS,
+        backoff_ratio: float = 0.9,
+        low_priority_ratio: float = 0.8,
+    ) -> None:
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency_ms / 1000
+        self.backoff_ratio = backoff_ratio
+        self.low_priority_ratio = low_priority_ratio
+        self.in_flight = 0
+        self.accepted = 0
+        self.rejected = {HIGH: 0, LOW: 0}
+
+    def try_acquire(self, priority: str = HIGH) -> bool:
+        """슬롯 획득 (대기하지 않고 즉시 성공/실패)"""
+        capacity = self.limit if priority == HIGH else self.limit * self.low_priority_ratio
+        if self.in_flight >= max(1, int(capacity)):
+            self.rejected[priority] += 1
+            return False
+        self.in_flight += 1
+        self.accepted += 1
+        return True
+
+    def release(self, latency: float, failed: bool = False) -> None:
+        """요청 완료 시 슬롯 반환 및 limit 조정"""
+        # limit 을 절반 이상 사용 중일 때만 증가 (유휴 상태에서 limit 이 무한히 커지는 것 방지)
+        saturated = self.in_flight * 2 >= self.limit
+        self.in_flight -= 1
+
+        if failed or latency > self.target_latency:
+            self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+        elif saturated:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def snapshot(self) -> Dict[str, object]:
+        """메트릭 스냅샷"""
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "accepted": self.accepted,
+            "rejected": dict(self.rejected),
+        }
+
+
+class AdaptiveConcurrencyMiddleware:
+    """in-flight 요청 수를 적응적으로 제한하는 ASGI 미들웨어
+
+    limit 을 넘는 요청은 커넥션 풀 대기열에 쌓이지 않도록 즉시 503 + Retry-After 로 거절한다.
+    우선순위는 기본적으로 GET/HEAD 가 high, 그 외(쓰기)가 low 이며 path prefix 로 재정의할 수 있다.
+    """
+
+    def __init__(
+        self,
+        app,
+        limiter: Optional[AIMDLimiter] = None,
+        priorities: Optional[Dict[str, str]] = None,
+        exempt_paths: Iterable[str] = ("/health", "/ready"),
+        metrics_path: str = "/metrics/concurrency",
+        retry_after: str = CONCURRENCY_RETRY_AFTER,
+    ) -> None:
+        self.app = app
+        self.limiter = limiter or AIMDLimiter()
+        self.priorities = priorities or {}
+        self.exempt_paths = frozenset(exempt_paths)
+        self.metrics_path = metrics_path
+        self.retry_after = retry_after.encode()
+
+    def _priority(self, scope) -> str:
+        path = scope["path"]
+        for prefix, priority in self.priorities.items():
+            if path.startswith(prefix):
+                return priority
+        return HIGH if scope["method"] in ("GET", "HEAD") else LOW
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["path"] == self.metrics_path:
+            await self._send_json(send, 200, self.limiter.snapshot())
+            return
+
+        if not self.limiter.try_acquire(self._priority(scope)):
+            await self._send_json(
+                send, 503, {"detail": "Server overloaded"}, [(b"retry-after", self.retry_after)]
+            )
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.limiter.release(time.perf_counter() - started, failed=status >= 500)
+
+    @staticmethod
+    async def _send_json(send, status: int, content, headers=()) -> None:
+        body = json.dumps(content).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                *headers,
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import os
+
+# 비정규화 카운터: users.post_count (create_post 트랜잭션에서 증가, reconcile 로 보정)
+# 기존 users 테이블에도 적용할 수 있도록 멱등 DDL 로 작성 (추가 직후에는 0 이므로 reconcile 1회 실행 필요)
+POST_COUNT_DDL = (
+    "ALTER TABLE users ADD COLUMN IF NOT EXISTS post_count INTEGER NOT NULL DEFAULT 0",
+)
+
+# reconcile 1회 트랜잭션에서 잠그는 사용자 수
+RECONCILE_BATCH_SIZE = int(os.getenv("RECONCILE_BATCH_SIZE", "10000"))
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Tuple
+
+
+def encode_cursor(*values) -> str:
+    """keyset 페이지네이션 커서 (마지막 행의 정렬 키를 URL-safe base64 JSON 으로)"""
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Tuple[type, ...]) -> list:
+    """커서 -> 정렬 키 리스트 (types 로 변환, 형식이 잘못되면 ValueError)"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError
+        return [kind(value) for kind, value in zip(types, values)]
+    except (binascii.Error, UnicodeDecodeError, TypeError, AttributeError, ValueError):
+        raise ValueError("Invalid cursor")
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+# ETag 버전 캐시 TTL (ms): 다른 워커에서의 변경은 최대 이 시간만큼 늦게 반영됨
+ETAG_CACHE_TTL_MS = int(os.getenv("ETAG_CACHE_TTL_MS", "1000"))
+
+
+class VersionCache:
+    """리소스 키별 버전 캐시 (워커 단위 LRU)
+
+    캐시된 버전이 있으면 If-None-Match 를 DB 조회 없이 판단할 수 있다.
+    ttl_ms=None 이면 만료되지 않음 (변경되지 않는 리소스용).
+    """
+
+    def __init__(self, ttl_ms: Optional[int] = ETAG_CACHE_TTL_MS, maxsize: int = 100_000) -> None:
+        self.ttl = None if ttl_ms is None else ttl_ms / 1000
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[int, float]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[int]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        version, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return version
+
+    def set(self, key: Hashable, version: int) -> None:
+        expires_at = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        self._entries[key] = (version, expires_at)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def bump(self, key: Hashable) -> None:
+        """쓰기 발생 시 버전 증가 (캐시에 없으면 다음 조회 때 DB 에서 다시 읽음)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.set(key, entry[0] + 1)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def weak_etag(*parts) -> str:
+    """W/"part1-part2-..." 형식의 weak ETag"""
+    return 'W/"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더와 weak 비교"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
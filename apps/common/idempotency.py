@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import struct
+import time
+from collections import OrderedDict
+from typing import Hashable, Iterable, Optional
+
+from .shared_cache import NOT_FOUND, SharedCache
+
+# Idempotency-Key 설정 (POST 재시도를 DB 조회 없이 저장된 응답으로 처리)
+IDEMPOTENCY_ENABLED = os.getenv("IDEMPOTENCY_ENABLED", "0") == "1"
+IDEMPOTENCY_PATHS = tuple(
+    path.strip() for path in os.getenv("IDEMPOTENCY_PATHS", "/users,/posts").split(",") if path.strip()
+)
+IDEMPOTENCY_TTL_MS = int(os.getenv("IDEMPOTENCY_TTL_MS", "600000"))  # 저장된 응답 보관 시간
+IDEMPOTENCY_PENDING_TTL_MS = int(os.getenv("IDEMPOTENCY_PENDING_TTL_MS", "30000"))  # 처리 중 표시 (워커 종료 시 자동 해제)
+# memory: 워커별 LRU, shared: 같은 호스트의 워커 공유 (shared memory, 다른 워커로 간 재시도도 처리)
+IDEMPOTENCY_STORE = os.getenv("IDEMPOTENCY_STORE", "memory")
+IDEMPOTENCY_MAXSIZE = int(os.getenv("IDEMPOTENCY_MAXSIZE", "16384"))  # memory 항목 수 / shared 슬롯 수 (shared 는 x SLOT_SIZE 바이트)
+IDEMPOTENCY_SLOT_SIZE = int(os.getenv("IDEMPOTENCY_SLOT_SIZE", "1024"))  # shared 슬롯 크기 (이보다 큰 응답은 저장하지 않음)
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+PENDING = NOT_FOUND  # 처리 중 표시 (짧은 TTL 로 저장)
+RECORD = struct.Struct("<H8s")  # status, 요청 본문 fingerprint (뒤에 응답 본문)
+
+# 같은 요청에 대해 다시 실행해도 결과가 달라질 수 있는 응답은 저장하지 않음 (5xx, 타임아웃, 과부하)
+STORED_CLIENT_ERRORS = (400, 404, 422)
+# 핸들러가 도중에 취소된 응답 (with_timeout). 커밋 이후에 취소됐을 수 있으므로 키를 해제하지 않음
+INTERRUPTED_STATUSES = (504,)
+
+
+class MemoryStore:
+    """워커 단위 TTL LRU (SharedCache 와 같은 get/set/invalidate 인터페이스)"""
+
+    def __init__(
+        self,
+        maxsize: int = IDEMPOTENCY_MAXSIZE,
+        ttl_ms: int = IDEMPOTENCY_TTL_MS,
+        pending_ttl_ms: int = IDEMPOTENCY_PENDING_TTL_MS,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl_ms / 1000
+        self.pending_ttl = pending_ttl_ms / 1000
+        self._entries: OrderedDict[Hashable, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: bytes) -> bool:
+        ttl = self.pending_ttl if value == PENDING else self.ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return True
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def idempotency_store():
+    if IDEMPOTENCY_STORE == "shared":
+        return SharedCache(
+            "idempotency",
+            slots=IDEMPOTENCY_MAXSIZE,
+            slot_size=IDEMPOTENCY_SLOT_SIZE,
+            ttl_ms=IDEMPOTENCY_TTL_MS,
+            negative_ttl_ms=IDEMPOTENCY_PENDING_TTL_MS,
+        )
+    return MemoryStore()
+
+
+def _json_response(status: int, detail: str) -> tuple[int, bytes]:
+    return status, json.dumps({"detail": detail}).encode()
+
+
+class IdempotencyMiddleware:
+    """Idempotency-Key 헤더가 있는 POST 의 응답을 저장하고 재시도에는 저장된 응답을 그대로 반환하는 ASGI 미들웨어
+
+    - 키는 경로별로 구분하고, 같은 키에 다른 본문이면 422 (클라이언트의 키 재사용 오류)
+    - 첫 요청이 처리 중일 때 들어온 재시도는 409 + Retry-After (중복 INSERT 방지)
+    - 2xx 와 재시도해도 같은 결과인 4xx 만 저장하고, 5xx / 예외 시에는 키를 해제해 재시도가 다시 실행되게 함
+    - 핸들러가 취소되면 (클라이언트 연결 종료, 504) INSERT 가 이미 커밋됐을 수 있으므로 키를 해제하지 않고
+      처리 중 표시를 PENDING_TTL 동안 유지한다. 그동안의 재시도는 409, 만료 후의 재시도는 다시 실행된다.
+    - 재시도 응답에는 Idempotent-Replayed: true 헤더
+    저장소는 크기와 TTL 이 제한되므로 오래된 키나 밀려난 키의 재시도는 새 요청으로 처리된다.
+    """
+
+    def __init__(
+        self,
+        app,
+        paths: Iterable[str] = IDEMPOTENCY_PATHS,
+        store=None,
+        metrics_path: str = "/metrics/idempotency",
+    ) -> None:
+        self.app = app
+        self.paths = frozenset(paths)
+        self.store = idempotency_store() if store is None else store
+        self.metrics_path = metrics_path
+        self.stats = {
+            "requests": 0,  # Idempotency-Key 가 있는 요청
+            "replayed": 0,  # 저장된 응답으로 처리한 중복 요청
+            "in_progress": 0,  # 첫 요청 처리 중에 들어온 중복 요청 (409)
+            "mismatch": 0,  # 같은 키, 다른 본문 (422)
+            "stored": 0,
+            "not_stored": 0,  # 5xx / 예외 / 저장 공간 부족
+            "interrupted": 0,  # 취소된 요청 (처리 중 표시를 만료까지 유지)
+        }
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["path"] == self.metrics_path:
+            await self._send(send, 200, json.dumps(self.stats).encode())
+            return
+
+        if scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        idempotency_key = None
+        for key, value in scope["headers"]:
+            if key == b"idempotency-key":
+                idempotency_key = value.decode("latin-1")
+                break
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not idempotency_key or len(idempotency_key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+            await self._send(send, *_json_response(400, "Invalid Idempotency-Key"))
+            return
+
+        # 요청 본문 버퍼링 (fingerprint 계산 후 앱에 다시 전달)
+        messages = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            messages.append(message)
+            more_body = message.get("more_body", False)
+        fingerprint = hashlib.blake2b(b"".join(m.get("body", b"") for m in messages), digest_size=8).digest()
+
+        self.stats["requests"] += 1
+        store_key = f"{scope['path']}:{idempotency_key}"
+        cached = self.store.get(store_key)
+        if cached == PENDING:
+            self.stats["in_progress"] += 1
+            await self._send(
+                send, *_json_response(409, "A request with this Idempotency-Key is in progress"), retry_after=True
+            )
+            return
+        if cached is not None:
+            status, stored_fingerprint = RECORD.unpack_from(cached)
+            if stored_fingerprint != fingerprint:
+                self.stats["mismatch"] += 1
+                await self._send(send, *_json_response(422, "Idempotency-Key was used with a different request body"))
+                return
+            self.stats["replayed"] += 1
+            await self._send(send, status, cached[RECORD.size:], replayed=True)
+            return
+
+        self.store.set(store_key, PENDING)
+
+        async def replay_receive():
+            if messages:
+                return messages.pop(0)
+            return await receive()
+
+        status = None
+        body = []
+        complete = False
+
+        async def send_wrapper(message) -> None:
+            nonlocal status, complete
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                body.append(message.get("body", b""))
+                complete = not message.get("more_body", False)
+            await send(message)
+
+        def store_response() -> bool:
+            if not complete or not (200 <= status < 300 or status in STORED_CLIENT_ERRORS):
+                return False
+            return self.store.set(store_key, RECORD.pack(status, fingerprint) + b"".join(body))
+
+        stored = False
+        interrupted = False
+        try:
+            await self.app(scope, replay_receive, send_wrapper)
+            interrupted = status in INTERRUPTED_STATUSES
+            stored = store_response()
+        except asyncio.CancelledError:
+            # 응답을 다 만든 뒤 취소됐으면 저장하고, 아니면 결과를 알 수 없으므로 처리 중 표시 유지
+            stored = store_response()
+            interrupted = not stored
+            raise
+        finally:
+            if stored:
+                self.stats["stored"] += 1
+            elif interrupted:
+                self.stats["interrupted"] += 1
+            else:
+                # 실행되지 않았거나 실패가 확실하면 처리 중 표시를 지워 재시도가 다시 실행되게 함
+                self.stats["not_stored"] += 1
+                self.store.invalidate(store_key)
+
+    @staticmethod
+    async def _send(send, status: int, body: bytes, retry_after: bool = False, replayed: bool = False) -> None:
+        headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        if retry_after:
+            headers.append((b"retry-after", b"1"))
+        if replayed:
+            headers.append((b"idempotent-replayed", b"true"))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from typing import Callable, Dict, List, Optional
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# 워커 캐시 무효화 알림 설정 (Postgres LISTEN/NOTIFY, 같은 DB 를 쓰는 모든 워커/호스트에 전달)
+CACHE_NOTIFY_ENABLED = os.getenv("CACHE_NOTIFY_ENABLED", "0") == "1"
+CACHE_NOTIFY_CHANNEL = os.getenv("CACHE_NOTIFY_CHANNEL", "cache_invalidation")
+CACHE_NOTIFY_RECONNECT_MS = int(os.getenv("CACHE_NOTIFY_RECONNECT_MS", "1000"))  # 재연결 간격
+CACHE_NOTIFY_KEEPALIVE_MS = int(os.getenv("CACHE_NOTIFY_KEEPALIVE_MS", "5000"))  # 연결 확인 간격 (SELECT 1)
+
+# 알림 payload: "<종류>:<키>"
+USERS = "users"  # 사용자 생성 (키: user id)
+POSTS = "posts"  # 게시글 생성 (키: 작성자 user id)
+
+NOTIFY_SQL = "SELECT pg_notify($1, $2)"
+
+
+def notify_payload(kind: str, key: int) -> str:
+    return f"{kind}:{key}"
+
+
+class InvalidationListener:
+    """전용 asyncpg 연결로 LISTEN 하고 알림마다 종류별 핸들러 호출 (워커당 1개)
+
+    연결이 끊긴 동안의 알림은 유실되므로 캐시는 원래 TTL 로 만료되고,
+    (재)연결 직후에는 놓친 알림이 있을 수 있어 reset 핸들러로 워커 캐시를 비운다.
+    """
+
+    def __init__(self, channel: str = CACHE_NOTIFY_CHANNEL, **connect_kwargs) -> None:
+        self.channel = channel
+        self.connect_kwargs = connect_kwargs
+        self._handlers: Dict[str, Callable[[int], None]] = {}
+        self._reset_handlers: List[Callable[[], None]] = []
+        self._task: Optional[asyncio.Task] = None
+        self.connected = False
+        self.stats = {"received": 0, "invalid": 0, "connects": 0, "keepalive_ms": None}
+
+    def on(self, kind: str, handler: Callable[[int], None]) -> None:
+        self._handlers[kind] = handler
+
+    def on_reset(self, handler: Callable[[], None]) -> None:
+        self._reset_handlers.append(handler)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def dispatch(self, payload: str) -> None:
+        kind, _, key = payload.partition(":")
+        handler = self._handlers.get(kind)
+        if handler is None or not key.isdigit():
+            self.stats["invalid"] += 1
+            return
+        self.stats["received"] += 1
+        handler(int(key))
+
+    def _notified(self, connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            self.dispatch(payload)
+        except Exception:
+            logger.exception("cache invalidation handler failed for %r", payload)
+
+    def _reset(self) -> None:
+        for handler in self._reset_handlers:
+            handler()
+
+    async def _run(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(**self.connect_kwargs)
+                lost = asyncio.Event()
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(self.channel, self._notified)
+                self.connected = True
+                self.stats["connects"] += 1
+                # LISTEN 이전의 쓰기는 알림을 받지 못했으므로 지금까지의 캐시를 버림
+                self._reset()
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), CACHE_NOTIFY_KEEPALIVE_MS / 1000)
+                    except TimeoutError:
+                        # 종료 패킷 없이 끊긴 연결(네트워크 단절)은 쿼리로만 확인 가능
+                        started = time.perf_counter()
+                        await connection.fetchval("SELECT 1", timeout=CACHE_NOTIFY_KEEPALIVE_MS / 1000)
+                        self.stats["keepalive_ms"] = round((time.perf_counter() - started) * 1000, 2)
+                logger.warning("cache invalidation listener connection closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("cache invalidation listener failed, falling back to TTL", exc_info=True)
+            finally:
+                self.connected = False
+                if connection is not None and not connection.is_closed():
+                    connection.terminate()
+            await asyncio.sleep(CACHE_NOTIFY_RECONNECT_MS / 1000)
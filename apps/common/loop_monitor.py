@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 루프 지연 모니터 설정
+LOOP_MONITOR_ENABLED = os.getenv("LOOP_MONITOR_ENABLED", "0") == "1"
+LOOP_LAG_INTERVAL_MS = float(os.getenv("LOOP_LAG_INTERVAL_MS", "50"))  # heartbeat 주기
+LOOP_BLOCK_THRESHOLD_MS = float(os.getenv("LOOP_BLOCK_THRESHOLD_MS", "100"))  # 이 이상 루프를 막으면 스택 기록
+
+LAG_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class LagHistogram:
+    """지연시간 히스토그램 (고정 버킷, 버킷 상한 기준 누적 분위수)"""
+
+    def __init__(self, buckets_ms=LAG_BUCKETS_MS) -> None:
+        self.buckets = list(buckets_ms)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        self.max = max(self.max, value_ms)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + [self.max], self.counts):
+            seen += count
+            if seen >= target:
+                return round(min(bound, self.max), 3)
+        return round(self.max, 3)
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "buckets_ms": {
+                **{str(bound): count for bound, count in zip(self.buckets, self.counts)},
+                "+Inf": self.counts[-1],
+            },
+            "count": self.count,
+            "avg_ms": round(self.total / self.count, 3) if self.count else None,
+            "p50_ms": self.quantile(0.5),
+            "p99_ms": self.quantile(0.99),
+            "max_ms": round(self.max, 3),
+        }
+
+
+class LoopMonitor:
+    """이벤트 루프 지연 측정 + 블로킹 호출 감지
+
+    - heartbeat 태스크: interval 마다 깨어나 예정보다 늦게 깨어난 시간을 lag 로 기록
+    - watchdog 스레드: heartbeat 가 threshold 이상 멈추면 그 순간 루프 스레드의 스택을 기록
+      (루프를 막고 있는 동기 코드: greenlet 안의 lazy load, 큰 Pydantic 검증, 압축 등)
+    """
+
+    def __init__(
+        self,
+        interval_ms: float = LOOP_LAG_INTERVAL_MS,
+        threshold_ms: float = LOOP_BLOCK_THRESHOLD_MS,
+        keep_stacks: int = 20,
+    ) -> None:
+        self.interval = interval_ms / 1000
+        self.threshold = threshold_ms / 1000
+        self.lag = LagHistogram()
+        self.blocked: Deque[Dict[str, object]] = deque(maxlen=keep_stacks)
+        self.blocked_count = 0
+        self._beat = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """현재 이벤트 루프에서 heartbeat 태스크와 watchdog 스레드 시작"""
+        if self.running:
+            return
+        self._beat = time.monotonic()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        threading.Thread(
+            target=self._watchdog, args=(threading.get_ident(), self._task), name="loop-watchdog", daemon=True
+        ).start()
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lag.record(max(0.0, loop.time() - scheduled) * 1000)
+            self._beat = time.monotonic()
+
+    def _watchdog(self, loop_thread: int, task: asyncio.Task) -> None:
+        reported_beat = None
+        while not task.done():
+            time.sleep(self.threshold / 2)
+            beat = self._beat
+            stalled = time.monotonic() - beat - self.interval
+            if stalled < self.threshold or beat == reported_beat:
+                continue
+            # 같은 정지 구간은 한 번만 기록 (막고 있는 코드의 스택)
+            reported_beat = beat
+            frame = sys._current_frames().get(loop_thread)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+            self.blocked_count += 1
+            self.blocked.append({"at": time.time(), "blocked_ms": round(stalled * 1000, 1), "stack": stack})
+            logger.warning("event loop blocked for %.0fms:\n%s", stalled * 1000, stack)
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "interval_ms": self.interval * 1000,
+            "threshold_ms": self.threshold * 1000,
+            "lag": self.lag.snapshot(),
+            "blocked": {"events": self.blocked_count, "recent": list(self.blocked)},
+        }
+
+
+class LoopMonitorMiddleware:
+    """LoopMonitor 를 워커 시작(lifespan) 시 가동하고 metrics_path 로 lag 히스토그램과 블로킹 스택을 보고"""
+
+    def __init__(self, app, monitor: Optional[LoopMonitor] = None, metrics_path: str = "/metrics/loop") -> None:
+        self.app = app
+        self.monitor = monitor or LoopMonitor()
+        self.metrics_path = metrics_path
+
+    async def __call__(self, scope, receive, send) -> None:
+        # lifespan 이 없는 서버/테스트 클라이언트에서는 첫 요청에서 시작
+        self.monitor.start()
+
+        if scope["type"] == "http" and scope["path"] == self.metrics_path:
+            body = json.dumps(self.monitor.snapshot()).encode()
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        await self.app(scope, receive, send)
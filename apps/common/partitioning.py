@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+import re
+from typing import List, Tuple
+
+from .search import SEARCH_VECTOR_SQL
+
+# posts 파티셔닝 (opt-in: 기존 테이블을 partition 도구로 변환, SQLAlchemy / Tortoise 가 같은 테이블 사용)
+# - hash: user_id 해시 분할. 사용자별 게시글 조회(user_id = ?)가 파티션 1개만 읽고 삽입이 파티션별 인덱스로 분산됨
+# - range: id 구간 분할. 최신 목록(ORDER BY id DESC)과 id 조회가 해당 구간만 읽고 오래된 구간 분리/보관이 쉬움
+PARTITION_STRATEGIES = ("hash", "range")
+POSTS_PARTITIONING = os.getenv("POSTS_PARTITIONING", "hash")
+POSTS_HASH_PARTITIONS = int(os.getenv("POSTS_HASH_PARTITIONS", "16"))
+POSTS_RANGE_SIZE = int(os.getenv("POSTS_RANGE_SIZE", "1000000"))  # range 파티션 1개당 id 수
+POSTS_RANGE_AHEAD = int(os.getenv("POSTS_RANGE_AHEAD", "2"))  # 현재 최대 id 이후 미리 만들어 둘 range 파티션 수
+PARTITION_COPY_BATCH_SIZE = int(os.getenv("PARTITION_COPY_BATCH_SIZE", "100000"))
+
+# 변환 중 새 테이블 / 변환 후 기존 테이블 이름
+PARTITIONED_POSTS_TABLE = "posts_partitioned"
+UNPARTITIONED_POSTS_TABLE = "posts_unpartitioned"
+
+IS_PARTITIONED_SQL = (
+    "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('{table}'))"
+)
+SERIAL_SEQUENCE_SQL = "SELECT pg_get_serial_sequence('{table}', 'id')"
+# PK 와 unique 인덱스는 파티션 키를 포함해야 하므로 새 테이블의 PRIMARY KEY 로 대신함
+SECONDARY_INDEXES_SQL = """
+SELECT i.relname AS name, pg_get_indexdef(i.oid) AS definition
+FROM pg_index x JOIN pg_class i ON i.oid = x.indexrelid
+WHERE x.indrelid = to_regclass('{table}') AND NOT x.indisunique
+"""
+ALL_INDEXES_SQL = "SELECT indexname AS name FROM pg_indexes WHERE schemaname = current_schema() AND tablename = '{table}'"
+PARTITIONS_SQL = """
+SELECT c.relname AS name
+FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+WHERE i.inhparent = to_regclass('{table}')
+"""
+
+
+def create_partitioned_posts_ddl(
+    table: str,
+    strategy: str,
+    sequence: str,
+    max_id: int = 0,
+    partitions: int = POSTS_HASH_PARTITIONS,
+    range_size: int = POSTS_RANGE_SIZE,
+    ahead: int = POSTS_RANGE_AHEAD,
+) -> List[str]:
+    """posts 와 같은 컬럼의 파티션 테이블 + 파티션 생성 DDL (id 는 기존 시퀀스를 이어서 사용)"""
+    if strategy == "hash":
+        partition_by, primary_key = "HASH (user_id)", "id, user_id"
+    elif strategy == "range":
+        partition_by, primary_key = "RANGE (id)", "id"
+    else:
+        raise ValueError(f"Unknown partitioning strategy: {strategy}")
+
+    statements = [f"""
+CREATE TABLE {table} (
+    id INTEGER NOT NULL DEFAULT nextval('{sequence}'),
+    title VARCHAR(255) NOT NULL,
+    content TEXT NOT NULL,
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED,
+    PRIMARY KEY ({primary_key})
+) PARTITION BY {partition_by}
+"""]
+    if strategy == "hash":
+        statements += [
+            f"CREATE TABLE {table}_p{remainder} PARTITION OF {table} "
+            f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+            for remainder in range(partitions)
+        ]
+    else:
+        statements += range_partitions_ddl(table, max_id, range_size, ahead)
+        # 미리 만든 구간을 넘어선 id 도 삽입이 실패하지 않도록 (비어 있어야 새 구간을 추가할 수 있음)
+        statements.append(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT")
+    return statements
+
+
+def range_partitions_ddl(
+    table: str,
+    max_id: int,
+    range_size: int = POSTS_RANGE_SIZE,
+    ahead: int = POSTS_RANGE_AHEAD,
+) -> List[str]:
+    """id 0 부터 max_id 이후 ahead 구간까지 range 파티션 생성 DDL (이미 있으면 건너뜀)"""
+    return [
+        f"CREATE TABLE IF NOT EXISTS {table}_r{low // range_size} PARTITION OF {table} "
+        f"FOR VALUES FROM ({low}) TO ({low + range_size})"
+        for low in range(0, (max_id // range_size + 1 + ahead) * range_size, range_size)
+    ]
+
+
+def copy_posts_sql(source: str, target: str, low: int, high: int) -> str:
+    """id 구간 (low, high] 복사 (이미 복사한 행은 건너뜀, search_vector 는 생성 컬럼이라 다시 계산됨)"""
+    return (
+        f"INSERT INTO {target} (id, title, content, user_id) "
+        f"SELECT id, title, content, user_id FROM {source} WHERE id > {low} AND id <= {high} "
+        f"ON CONFLICT DO NOTHING"
+    )
+
+
+def copy_index_ddl(name: str, definition: str, source: str, target: str) -> Tuple[str, str]:
+    """기존 인덱스 정의를 새 테이블용으로 변환 -> (임시 이름, DDL)"""
+    temp_name = f"{target}__{name}"[:63]
+    ddl = definition.replace(f"INDEX {name} ON", f"INDEX {temp_name} ON", 1)
+    ddl = re.sub(rf" ON (ONLY )?(\S+\.)?{source} USING ", f" ON {target} USING ", ddl, count=1)
+    return temp_name, ddl
+
+
+def swap_tables_ddl(
+    table: str,
+    target: str,
+    backup: str,
+    sequence: str,
+    old_indexes: List[str],
+    new_indexes: List[Tuple[str, str]],
+    partitions: List[str],
+) -> List[str]:
+    """기존 테이블을 backup 으로, 새 테이블을 table 로 교체 (인덱스는 기존 이름을 이어받음)
+
+    old_indexes: 기존 테이블 인덱스 이름, new_indexes: (임시 이름, 이어받을 이름), partitions: 새 테이블 파티션 이름
+    """
+    statements = [f"ALTER TABLE {table} RENAME TO {backup}"]
+    statements += [
+        f"ALTER INDEX {name} RENAME TO {(name.replace(table, backup, 1) if table in name else f'{name}_{backup}')[:63]}"
+        for name in old_indexes
+    ]
+    statements.append(f"ALTER TABLE {target} RENAME TO {table}")
+    statements += [f"ALTER INDEX {temp_name} RENAME TO {name}" for temp_name, name in new_indexes]
+    statements += [f"ALTER TABLE {name} RENAME TO {name.replace(target, table, 1)}" for name in partitions]
+    # 기존 테이블을 지워도 시퀀스가 함께 삭제되지 않도록 소유권 이전
+    statements.append(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+    return statements
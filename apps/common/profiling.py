@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+# 샘플링 프로파일러 설정 (꺼져 있으면 미들웨어 자체를 등록하지 않음)
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "0") == "1"
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "60"))
+
+IDLE = "(idle)"  # 이벤트 루프가 I/O 를 기다리는 중 (실행 중인 태스크 없음)
+UNATTRIBUTED = "(other)"  # 요청 태스크가 아닌 태스크 (백그라운드 작업, 핸들러가 만든 하위 태스크)
+
+
+def frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class StackSampler:
+    """이벤트 루프 스레드의 스택을 주기적으로 수집해 라우트별 collapsed stack 으로 집계
+
+    별도 스레드에서 sys._current_frames() 로 루프 스레드의 스택을 읽고,
+    그 순간 실행 중인 asyncio 태스크로 요청(라우트)을 찾는다.
+    """
+
+    def __init__(self, interval_ms: float = PROFILE_INTERVAL_MS) -> None:
+        self.interval = interval_ms / 1000
+        # 요청 태스크 -> ASGI scope (라우팅 후 scope["route"] 로 라우트 경로를 얻음)
+        self.requests: Dict[asyncio.Task, dict] = {}
+        self.running = False
+
+    def route_of(self, task: Optional[asyncio.Task]) -> str:
+        if task is None:
+            return IDLE
+        scope = self.requests.get(task)
+        if scope is None:
+            return UNATTRIBUTED
+        route = scope.get("route")
+        return f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+
+    def sample(self, loop: asyncio.AbstractEventLoop, loop_thread: int, seconds: float) -> Counter:
+        """seconds 동안 샘플링 (샘플러 스레드에서 실행)"""
+        stacks: Counter = Counter()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            frame = sys._current_frames().get(loop_thread)
+            task = asyncio.current_task(loop)
+            frames = []
+            while frame is not None:
+                frames.append(frame_name(frame))
+                frame = frame.f_back
+            frames.append(self.route_of(task))
+            stacks[";".join(reversed(frames))] += 1
+            time.sleep(self.interval)
+        return stacks
+
+    async def profile(self, seconds: float) -> Counter:
+        """루프를 막지 않고 seconds 동안 프로파일링 (동시에 하나만 실행)"""
+        if self.running:
+            raise RuntimeError("Profile already running")
+        self.running = True
+        try:
+            loop = asyncio.get_running_loop()
+            return await asyncio.to_thread(self.sample, loop, threading.get_ident(), seconds)
+        finally:
+            self.running = False
+
+
+def collapsed(stacks: Counter) -> str:
+    """flamegraph.pl / speedscope 용 collapsed stack ("route;frame;frame count")"""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+class ProfilingMiddleware:
+    """요청 태스크를 라우트에 연결하고 /debug/profile?seconds=N 으로 프로파일을 반환하는 ASGI 미들웨어
+
+    CancelOnDisconnectMiddleware 가 핸들러를 별도 태스크로 실행하므로 가장 안쪽에 등록해야
+    요청을 실제로 처리하는 태스크가 기록된다. 프로파일링 중이 아닐 때 요청당 비용은 dict 갱신 2회.
+    """
+
+    def __init__(self, app, sampler: Optional[StackSampler] = None, path: str = "/debug/profile") -> None:
+        self.app = app
+        self.sampler = sampler or StackSampler()
+        self.path = path
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["path"] == self.path:
+            await self.handle_profile(scope, send)
+            return
+
+        task = asyncio.current_task()
+        self.sampler.requests[task] = scope
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.sampler.requests.pop(task, None)
+
+    async def handle_profile(self, scope, send) -> None:
+        params = dict(
+            item.split("=", 1) for item in scope["query_string"].decode("latin-1").split("&") if "=" in item
+        )
+        try:
+            seconds = float(params.get("seconds", "10"))
+            if not 0 < seconds <= PROFILE_MAX_SECONDS:
+                raise ValueError
+        except ValueError:
+            await self.respond(send, 400, f"seconds must be in (0, {PROFILE_MAX_SECONDS:g}]\n".encode())
+            return
+
+        try:
+            stacks = await self.sampler.profile(seconds)
+        except RuntimeError as e:
+            await self.respond(send, 409, f"{e}\n".encode())
+            return
+        await self.respond(
+            send,
+            200,
+            collapsed(stacks).encode(),
+            [(b"x-profile-samples", str(sum(stacks.values())).encode())],
+        )
+
+    @staticmethod
+    async def respond(send, status: int, body: bytes, headers: Optional[list] = None) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+                *(headers or []),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+# PostgreSQL 전문 검색 설정 (SQLAlchemy / Tortoise 가 같은 posts 테이블을 사용)
+SEARCH_CONFIG = "english"
+
+# 제목 가중치(A)를 본문(B)보다 높게 두어 ts_rank 에 반영
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', title), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', content), 'B')"
+)
+
+# 기존 posts 테이블에도 적용할 수 있도록 멱등 DDL 로 작성
+SEARCH_DDL = (
+    f"ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_posts_search_vector ON posts USING GIN (search_vector)",
+)
+
+# 사용자 부분 일치 조회: pg_trgm GIN 인덱스는 ILIKE '%q%' 에도 사용된다
+# 3글자 미만 검색어는 trigram 을 만들 수 없어 인덱스 전체를 훑게 되므로 허용하지 않음
+USER_LOOKUP_MIN_LENGTH = 3
+USER_LOOKUP_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_users_name_trgm ON users USING GIN (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_users_email_trgm ON users USING GIN (email gin_trgm_ops)",
+)
+
+
+def escape_like(value: str) -> str:
+    """LIKE / ILIKE 패턴 특수문자 이스케이프 (기본 이스케이프 문자 \\ 사용)"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
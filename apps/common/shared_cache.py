@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import os
+import struct
+import time
+import zlib
+from multiprocessing import resource_tracker, shared_memory
+from typing import Hashable, Iterator, Optional
+
+# 워커 간 공유 캐시 설정 (같은 호스트의 gunicorn 워커들이 /dev/shm 의 해시 테이블 1개를 함께 사용)
+SHARED_CACHE_ENABLED = os.getenv("SHARED_CACHE_ENABLED", "0") == "1"
+SHARED_CACHE_NAME = os.getenv("SHARED_CACHE_NAME", "orm_test")
+SHARED_CACHE_SLOTS = int(os.getenv("SHARED_CACHE_SLOTS", "65536"))
+SHARED_CACHE_SLOT_SIZE = int(os.getenv("SHARED_CACHE_SLOT_SIZE", "256"))  # 슬롯 1개 바이트 (헤더 + 키 + 값)
+SHARED_CACHE_TTL_MS = int(os.getenv("SHARED_CACHE_TTL_MS", "60000"))
+SHARED_CACHE_NEGATIVE_TTL_MS = int(os.getenv("SHARED_CACHE_NEGATIVE_TTL_MS", "1000"))  # "없음" 캐시
+SHARED_CACHE_PROBES = 4  # 키 하나가 들어갈 수 있는 연속 슬롯 수
+
+HEADER = struct.Struct("<4sII")  # magic, slots, slot_size
+HEADER_SIZE = 64
+MAGIC = b"OSC1"
+CRC = struct.Struct("<I")
+META = struct.Struct("<dHH")  # expires_at (time.time()), key_len, value_len
+EMPTY_SLOT = bytes(CRC.size + META.size)
+
+NOT_FOUND = b""  # 존재하지 않는 키를 캐시할 때의 값 (get 이 None 이면 캐시 미스)
+
+
+class SharedCache:
+    """multiprocessing.shared_memory 위의 고정 크기 해시 테이블 (워커 간 공유, 락 없음)
+
+    슬롯 = crc32 | expires_at | key_len | value_len | key | value.
+    쓰기는 레코드를 먼저 쓰고 crc 를 마지막에 쓴다. 읽기는 슬롯을 복사한 뒤 crc 를 검증하므로
+    다른 워커가 쓰는 중이거나 두 워커가 같은 슬롯에 동시에 쓴 슬롯은 미스로 처리된다.
+    invalidate 는 공유 메모리의 슬롯을 비우므로 모든 워커에 즉시 반영된다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        slots: int = SHARED_CACHE_SLOTS,
+        slot_size: int = SHARED_CACHE_SLOT_SIZE,
+        ttl_ms: int = SHARED_CACHE_TTL_MS,
+        negative_ttl_ms: int = SHARED_CACHE_NEGATIVE_TTL_MS,
+    ) -> None:
+        # 레이아웃이 바뀌면 다른 세그먼트를 사용 (이전 워커와 섞이지 않도록)
+        self.name = f"{SHARED_CACHE_NAME}_{name}_{slots}x{slot_size}"
+        self.slots = slots
+        self.slot_size = slot_size
+        self.ttl = ttl_ms / 1000
+        self.negative_ttl = negative_ttl_ms / 1000
+        self._shm: Optional[shared_memory.SharedMemory] = None
+
+    @property
+    def buf(self) -> memoryview:
+        """첫 사용 시 세그먼트 생성 또는 다른 워커가 만든 세그먼트에 연결"""
+        if self._shm is None:
+            self._shm = self._open()
+        return self._shm.buf
+
+    def _open(self) -> shared_memory.SharedMemory:
+        size = HEADER_SIZE + self.slots * self.slot_size
+        try:
+            shm = shared_memory.SharedMemory(self.name, create=True, size=size)
+            HEADER.pack_into(shm.buf, 0, MAGIC, self.slots, self.slot_size)
+        except FileExistsError:
+            # 생성한 워커가 크기를 잡고 헤더를 쓸 때까지 잠시 대기
+            for _ in range(100):
+                try:
+                    shm = shared_memory.SharedMemory(self.name)
+                except ValueError:  # 아직 크기가 0
+                    time.sleep(0.01)
+                    continue
+                if shm.size >= size and HEADER.unpack_from(shm.buf, 0) == (MAGIC, self.slots, self.slot_size):
+                    break
+                shm.close()
+                time.sleep(0.01)
+            else:
+                raise RuntimeError(f"Shared cache {self.name} is not initialized")
+        # 워커가 종료될 때 resource tracker 가 세그먼트를 지우지 않도록 (다른 워커가 계속 사용)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+    def _offsets(self, key: bytes) -> Iterator[int]:
+        # hash() 는 프로세스마다 시드가 달라 워커 간에 같은 슬롯을 가리키지 않으므로 crc32 사용
+        start = zlib.crc32(key) % self.slots
+        for probe in range(SHARED_CACHE_PROBES):
+            yield HEADER_SIZE + (start + probe) % self.slots * self.slot_size
+
+    def _read(self, buf: memoryview, offset: int, key: bytes) -> Optional[tuple[float, bytes]]:
+        """슬롯이 key 의 온전한 레코드이면 (expires_at, value)"""
+        crc, = CRC.unpack_from(buf, offset)
+        expires_at, key_len, value_len = META.unpack_from(buf, offset + CRC.size)
+        if key_len != len(key) or CRC.size + META.size + key_len + value_len > self.slot_size:
+            return None
+        record = bytes(buf[offset + CRC.size:offset + CRC.size + META.size + key_len + value_len])
+        if zlib.crc32(record) != crc or record[META.size:META.size + key_len] != key:
+            return None
+        expires_at, _, _ = META.unpack_from(record)
+        return expires_at, record[META.size + key_len:]
+
+    @staticmethod
+    def encode_key(key: Hashable) -> bytes:
+        return str(key).encode()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """캐시된 값 (NOT_FOUND 이면 존재하지 않는 키, None 이면 미스)"""
+        encoded = self.encode_key(key)
+        buf = self.buf
+        for offset in self._offsets(encoded):
+            entry = self._read(buf, offset, encoded)
+            if entry is not None:
+                expires_at, value = entry
+                return value if expires_at >= time.time() else None
+        return None
+
+    def set(self, key: Hashable, value: bytes) -> bool:
+        """값 저장 (NOT_FOUND 는 negative TTL, 슬롯보다 크면 저장하지 않고 False)"""
+        encoded = self.encode_key(key)
+        ttl = self.negative_ttl if value == NOT_FOUND else self.ttl
+        record = META.pack(time.time() + ttl, len(encoded), len(value)) + encoded + value
+        if CRC.size + len(record) > self.slot_size:
+            return False
+
+        buf = self.buf
+        now = time.time()
+        target = None
+        for offset in self._offsets(encoded):
+            entry = self._read(buf, offset, encoded)
+            if entry is not None:  # 같은 키 덮어쓰기
+                target = offset
+                break
+            if target is None:
+                expires_at, key_len, _ = META.unpack_from(buf, offset + CRC.size)
+                if key_len == 0 or expires_at < now:
+                    target = offset
+        if target is None:
+            # 빈 슬롯이 없으면 첫 슬롯을 교체
+            target = next(self._offsets(encoded))
+
+        buf[target + CRC.size:target + CRC.size + len(record)] = record
+        CRC.pack_into(buf, target, zlib.crc32(record))
+        return True
+
+    def invalidate(self, key: Hashable) -> None:
+        """모든 워커에서 key 제거"""
+        encoded = self.encode_key(key)
+        buf = self.buf
+        for offset in self._offsets(encoded):
+            if self._read(buf, offset, encoded) is not None:
+                buf[offset:offset + len(EMPTY_SLOT)] = EMPTY_SLOT
+
+    def close(self) -> None:
+        if self._shm is not None:
+            self._shm.close()
+            self._shm = None
+
+    def unlink(self) -> None:
+        """세그먼트 삭제 (배포 후 정리, 벤치마크 종료 시)"""
+        self.close()
+        # 새로 연결한 핸들은 resource tracker 에 등록되어 있어 unlink 가 등록 해제까지 처리
+        shm = shared_memory.SharedMemory(self.name)
+        shm.close()
+        shm.unlink()
+
+
+def shared_cache(name: str) -> Optional[SharedCache]:
+    """SHARED_CACHE_ENABLED=1 일 때만 공유 캐시 생성 (세그먼트는 첫 사용 시 연결)"""
+    return SharedCache(name) if SHARED_CACHE_ENABLED else None
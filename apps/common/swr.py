@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import random
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# 목록 캐시 설정 (GET /posts, GET /users 페이지)
+LIST_CACHE_ENABLED = os.getenv("LIST_CACHE_ENABLED", "0") == "1"
+LIST_CACHE_SOFT_TTL_MS = int(os.getenv("LIST_CACHE_SOFT_TTL_MS", "1000"))  # 이후에는 stale 응답 + 백그라운드 갱신
+LIST_CACHE_HARD_TTL_MS = int(os.getenv("LIST_CACHE_HARD_TTL_MS", "10000"))  # 이후에는 요청이 갱신을 기다림
+LIST_CACHE_EARLY_BETA = float(os.getenv("LIST_CACHE_EARLY_BETA", "1.0"))  # 확률적 조기 갱신 강도 (0 이면 끔)
+LIST_CACHE_MAXSIZE = int(os.getenv("LIST_CACHE_MAXSIZE", "1024"))
+
+
+class CacheEntry(Generic[T]):
+    __slots__ = ("value", "soft_expires_at", "hard_expires_at", "load_time")
+
+    def __init__(self, value: T, loaded_at: float, load_time: float, soft_ttl: float, hard_ttl: float) -> None:
+        self.value = value
+        self.soft_expires_at = loaded_at + soft_ttl
+        self.hard_expires_at = loaded_at + hard_ttl
+        self.load_time = load_time
+
+
+class StaleWhileRevalidateCache(Generic[T]):
+    """soft/hard TTL 캐시 (워커 단위 LRU)
+
+    - soft TTL 이전: 캐시 응답. 만료가 가까우면 확률적으로 미리 갱신
+      (XFetch: now - load_time * beta * ln(rand) >= soft_expires_at, 조회가 오래 걸릴수록 일찍 갱신)
+    - soft ~ hard TTL: stale 응답을 바로 반환하고 키당 백그라운드 갱신 1개만 실행
+    - hard TTL 이후 / 캐시 없음: 같은 키의 동시 요청은 조회 1개를 함께 기다림
+    따라서 만료 시점에 DB 로 가는 조회는 워커당 키마다 1개.
+    """
+
+    def __init__(
+        self,
+        soft_ttl_ms: int = LIST_CACHE_SOFT_TTL_MS,
+        hard_ttl_ms: int = LIST_CACHE_HARD_TTL_MS,
+        beta: float = LIST_CACHE_EARLY_BETA,
+        maxsize: int = LIST_CACHE_MAXSIZE,
+    ) -> None:
+        self.soft_ttl = soft_ttl_ms / 1000
+        self.hard_ttl = max(hard_ttl_ms, soft_ttl_ms) / 1000
+        self.beta = beta
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, CacheEntry[T]] = OrderedDict()
+        self._loading: Dict[Hashable, asyncio.Task] = {}
+        self._generation = 0  # clear() 마다 증가 (그 이전에 시작된 조회 결과는 저장하지 않음)
+        self.stats = {"hits": 0, "stale": 0, "misses": 0, "loads": 0, "errors": 0}
+
+    def _should_refresh(self, entry: CacheEntry[T], now: float) -> bool:
+        if now >= entry.soft_expires_at:
+            return True
+        if self.beta <= 0:
+            return False
+        return now - entry.load_time * self.beta * math.log(1.0 - random.random()) >= entry.soft_expires_at
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now < entry.hard_expires_at:
+            self._entries.move_to_end(key)
+            if self._should_refresh(entry, now):
+                self.stats["stale" if now >= entry.soft_expires_at else "hits"] += 1
+                self._load(key, loader)  # 진행 중인 갱신이 있으면 그대로 사용
+            else:
+                self.stats["hits"] += 1
+            return entry.value
+
+        self.stats["misses"] += 1
+        # 요청이 취소돼도(클라이언트 연결 종료) 같은 조회를 기다리는 다른 요청에는 영향 없도록 shield
+        return await asyncio.shield(self._load(key, loader))
+
+    def clear(self) -> None:
+        """모든 항목 제거 (쓰기 알림 수신 시). 진행 중인 조회는 무효화 이전 데이터일 수 있어 저장하지 않음"""
+        self._entries.clear()
+        self._loading.clear()
+        self._generation += 1
+
+    def _load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> asyncio.Task:
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._run_loader(key, loader))
+            # 아무도 기다리지 않는 백그라운드 갱신의 예외는 로그로 처리했으므로 회수만 함
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._loading[key] = task
+        return task
+
+    async def _run_loader(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        generation = self._generation
+        task = asyncio.current_task()
+        self.stats["loads"] += 1
+        try:
+            value = await loader()
+        except Exception:
+            self.stats["errors"] += 1
+            # stale 항목은 hard TTL 까지 계속 사용 (기다리는 요청에는 예외 전달)
+            logger.warning("list cache refresh failed for %r", key, exc_info=True)
+            raise
+        finally:
+            # clear() 이후 같은 키로 새 조회가 시작됐을 수 있으므로 자기 자신일 때만 제거
+            if self._loading.get(key) is task:
+                del self._loading[key]
+        if generation != self._generation:
+            return value
+        finished = time.monotonic()
+        self._entries[key] = CacheEntry(value, finished, finished - started, self.soft_ttl, self.hard_ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+
+def list_cache() -> Optional[StaleWhileRevalidateCache[bytes]]:
+    """LIST_CACHE_ENABLED=1 일 때만 목록 캐시 생성"""
+    return StaleWhileRevalidateCache() if LIST_CACHE_ENABLED else None
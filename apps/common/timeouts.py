@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import os
+from typing import Dict
+
+from fastapi import HTTPException
+
+# 쿼리 타임아웃 설정 (ms)
+STATEMENT_TIMEOUT_MS = int(os.getenv("STATEMENT_TIMEOUT_MS", "5000"))
+# 엔드포인트별 재정의: "get_posts=500,create_post=2000"
+ENDPOINT_TIMEOUTS_MS: Dict[str, int] = {
+    name.strip(): int(ms)
+    for name, ms in (
+        item.split("=") for item in os.getenv("ENDPOINT_TIMEOUTS_MS", "").split(",") if item.strip()
+    )
+}
+
+# 클라이언트 연결 종료 시 진행 중인 DB 호출 취소 (CANCEL_ON_DISCONNECT=1 일 때만)
+# 요청마다 본문 버퍼링 + 태스크 2개가 추가되고 쓰기 핸들러도 도중에 취소되므로 기본은 끔
+CANCEL_ON_DISCONNECT = os.getenv("CANCEL_ON_DISCONNECT", "0") == "1"
+
+
+def endpoint_timeout(endpoint: str) -> float:
+    """엔드포인트 타임아웃 (초)"""
+    return ENDPOINT_TIMEOUTS_MS.get(endpoint, STATEMENT_TIMEOUT_MS) / 1000
+
+
+def with_timeout(endpoint: str):
+    """라우트 핸들러 전체에 타임아웃 적용 (초과 시 진행 중인 쿼리를 취소하고 504)
+
+    asyncio 취소가 드라이버까지 전달되어 asyncpg / gel 모두 서버에 취소를 보내고
+    커넥션을 풀에 반환한다.
+    """
+    timeout = endpoint_timeout(endpoint)
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                async with asyncio.timeout(timeout):
+                    return await func(*args, **kwargs)
+            except TimeoutError:
+                raise HTTPException(status_code=504, detail="Query timed out")
+
+        # FastAPI 는 wrapper 의 모듈 기준으로 문자열 어노테이션을 해석하므로 미리 평가해 둔다
+        wrapper.__signature__ = inspect.signature(func, eval_str=True)
+        return wrapper
+
+    return decorator
+
+
+class CancelOnDisconnectMiddleware:
+    """클라이언트가 응답 전에 연결을 끊으면 핸들러 태스크를 취소하는 ASGI 미들웨어
+
+    요청 본문을 먼저 모두 읽은 뒤 남은 receive() 로 http.disconnect 를 감시한다.
+    클라이언트가 포기한 요청이 커넥션을 계속 점유하지 않도록 하기 위함.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+        self.cancelled = 0
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 요청 본문 버퍼링
+        messages = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            messages.append(message)
+            more_body = message.get("more_body", False)
+
+        disconnected = asyncio.Event()
+
+        async def replay_receive():
+            if messages:
+                return messages.pop(0)
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        app_task = asyncio.create_task(self.app(scope, replay_receive, send))
+
+        async def watch_disconnect() -> None:
+            message = await receive()
+            if message["type"] == "http.disconnect" and not app_task.done():
+                disconnected.set()
+                app_task.cancel()
+
+        watcher = asyncio.create_task(watch_disconnect())
+        try:
+            await app_task
+        except asyncio.CancelledError:
+            if not disconnected.is_set():
+                raise
+            self.cancelled += 1
+        finally:
+            watcher.cancel()
+            if not app_task.done():
+                app_task.cancel()
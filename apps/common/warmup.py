@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 워커 시작 시 커넥션 풀 + 자주 쓰는 문장 예열 (startup 이 끝나야 요청을 받으므로 /ready 전에 완료됨)
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "0") == "1"
+WARMUP_TIMEOUT_MS = int(os.getenv("WARMUP_TIMEOUT_MS", "10000"))  # 초과 시 예열을 포기하고 그대로 시작
+
+# 마지막 예열 결과 (워커 단위, /ready 응답에 포함)
+warmup_state: Dict[str, object] = {"done": False, "connections": 0, "statements": 0, "duration_ms": None, "error": None}
+
+
+async def warm_up(warm_connection: Callable[[asyncio.Barrier], Awaitable[int]], connections: int) -> None:
+    """warm_connection 을 connections 개 동시에 실행
+
+    warm_connection 은 커넥션 1개를 잡고 문장을 실행한 뒤(실행한 문장 수 반환) barrier 에서
+    나머지가 모두 커넥션을 잡을 때까지 반환하지 않아야 한다. 그래야 풀이 서로 다른 커넥션을
+    connections 개 열고, 커넥션마다 prepared statement / 타입 코덱 캐시가 채워진다.
+    DB 가 느리거나 내려가 있어도 워커 시작을 막지 않도록 실패는 로그만 남긴다.
+    """
+    started = time.perf_counter()
+    barrier = asyncio.Barrier(connections)
+    error: Optional[str] = None
+    statements = 0
+
+    async def warm_one() -> int:
+        try:
+            return await warm_connection(barrier)
+        except Exception:
+            # barrier 에서 기다리는 나머지가 커넥션을 쥔 채 타임아웃까지 남지 않도록
+            await barrier.abort()
+            raise
+
+    try:
+        async with asyncio.timeout(WARMUP_TIMEOUT_MS / 1000):
+            statements = sum(await asyncio.gather(*(warm_one() for _ in range(connections))))
+    except Exception as e:
+        error = type(e).__name__
+        logger.warning("connection warmup failed", exc_info=True)
+    duration_ms = round((time.perf_counter() - started) * 1000, 2)
+    warmup_state.update(
+        done=True, connections=connections, statements=statements, duration_ms=duration_ms, error=error
+    )
+    logger.info("warmed up %d connections, %d statements in %.1f ms", connections, statements, duration_ms)
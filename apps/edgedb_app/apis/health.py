@@ -1,9 +1,74 @@
+import asyncio
+import os
+import time
+
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from ..database import get_edgedb_client
+from ...common.warmup import WARMUP_ENABLED, warmup_state
 
 router = APIRouter()
 
+# Readiness 설정
+READY_CACHE_MS = int(os.getenv("READY_CACHE_MS", "1000"))  # DB 프로브 결과 캐시 시간
+READY_ACQUIRE_TIMEOUT_MS = int(os.getenv("READY_ACQUIRE_TIMEOUT_MS", "200"))  # 커넥션 획득 + select 1 허용 지연
+READY_MAX_POOL_USAGE = float(os.getenv("READY_MAX_POOL_USAGE", "1.0"))  # 풀 사용률 임계값
+
+# 마지막 DB 프로브 결과 (워커 단위 캐시)
+_probe = {"checked_at": 0.0, "ok": False, "latency_ms": None, "error": "not probed"}
+_probe_lock = asyncio.Lock()
+
+
+async def _probe_db() -> None:
+    """커넥션 획득 + select 1 (임계값 초과 시 즉시 실패)"""
+    client = await get_edgedb_client()
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout(READY_ACQUIRE_TIMEOUT_MS / 1000):
+            await client.query_single("select 1")
+        _probe.update(ok=True, error=None)
+    except TimeoutError:
+        _probe.update(ok=False, error="acquire latency exceeded")
+    except Exception as e:
+        _probe.update(ok=False, error=type(e).__name__)
+    _probe.update(checked_at=time.monotonic(), latency_ms=round((time.perf_counter() - started) * 1000, 2))
+
 
 @router.get("/health")
 async def health_check():
     """헬스체크 엔드포인트"""
-    return {"status": "ok", "orm": "edgedb"} 
\ No newline at end of file
+    return {"status": "ok", "orm": "edgedb"}
+
+
+@router.get("/ready")
+async def readiness_check():
+    """레디니스 엔드포인트 (풀 포화도 + 캐시된 DB 프로브)"""
+    client = await get_edgedb_client()
+    size = client.max_concurrency
+    in_use = size - client.free_size
+    pool = {"in_use": in_use, "size": size}
+
+    # 풀이 포화 상태면 프로브 자체가 대기열에 쌓이므로 DB 확인 없이 바로 실패
+    if in_use >= size * READY_MAX_POOL_USAGE:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unavailable", "orm": "edgedb", "reason": "pool saturated", "pool": pool},
+        )
+
+    # 캐시 만료 시 한 요청만 프로브하고, 진행 중이면 직전 결과 사용
+    expired = time.monotonic() - _probe["checked_at"] >= READY_CACHE_MS / 1000
+    if expired and not _probe_lock.locked():
+        async with _probe_lock:
+            await _probe_db()
+
+    if not _probe["ok"]:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unavailable", "orm": "edgedb", "reason": _probe["error"], "pool": pool},
+        )
+    body = {"status": "ready", "orm": "edgedb", "pool": pool, "db_latency_ms": _probe["latency_ms"]}
+    # 예열은 startup 에서 끝나므로 레디니스에는 반영하지 않고 결과만 노출 (실패해도 요청은 처리 가능)
+    if WARMUP_ENABLED:
+        body["warmup"] = warmup_state
+    return body
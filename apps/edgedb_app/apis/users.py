@@ -1,57 +1,155 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import List
+import uuid
+
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from typing import List, Optional
 import gel
 
-from ..schemas import UserCreate, UserResponse, PostResponse
-from ..services.user_service import user_service
+from ..database import JSON_PASSTHROUGH
+from ..schemas import UserCreate, UserResponse, UserWithPostCountResponse, USER_WITH_POST_COUNT_FIELDS, PostResponse, POST_FIELDS, parse_post_fields, dump_post_projection, dump_users_with_posts, dump_users_or_null
+from ..services.user_service import user_service, user_versions
+from ...common.batch import BATCH_MAX_IDS, parse_ids
+from ...common.compact import COMPACT_RESPONSES, dump_rows
+from ...common.etag import weak_etag, etag_matches
+from ...common.search import USER_LOOKUP_MIN_LENGTH
+from ...common.swr import LIST_CACHE_ENABLED
+from ...common.timeouts import with_timeout
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.post("", response_model=UserResponse)
+@with_timeout("create_user")
 async def create_user(user: UserCreate):
     """사용자 생성"""
     try:
+        if JSON_PASSTHROUGH:
+            return Response(await user_service.create_user_json(user), media_type="application/json")
         return await user_service.create_user(user)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except gel.ConstraintViolationError:
-        raise HTTPException(status_code=400, detail="Email already exists")
+        # 중복 이메일은 UNLESS CONFLICT 로 ValueError, 여기는 길이 제한 등 나머지 제약 위반
+        raise HTTPException(status_code=400, detail="Constraint violation")
 
 
-@router.get("", response_model=List[UserResponse])
+@router.get(
+    "",
+    response_model=List[UserWithPostCountResponse],
+    responses={200: {"description": "include=recent_posts 이면 List[UserWithPostsResponse], ids 이면 List[UserResponse | null]"}},
+)
+@with_timeout("get_users")
 async def get_users(
     skip: int = Query(0, ge=0),
-    limit: int = Query(10, ge=1, le=100)
+    limit: int = Query(10, ge=1, le=100),
+    include: Optional[str] = Query(None, description="recent_posts: 사용자별 최근 게시글 포함"),
+    per_user: int = Query(3, ge=1, le=20, description="include=recent_posts 일 때 사용자별 게시글 수"),
+    ids: Optional[str] = Query(None, description=f"쉼표 구분 id 목록 (최대 {BATCH_MAX_IDS}개, 요청 순서로 반환하고 없는 id 는 null)")
 ):
     """사용자 목록 조회"""
+    if ids is not None:
+        if include is not None:
+            raise HTTPException(status_code=400, detail="ids cannot be combined with include")
+        # 사용자마다 GET /users/{id} 를 호출하는 대신 id = ANY(...) 1회 조회
+        try:
+            user_ids = parse_ids(ids, uuid.UUID)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        users = await user_service.get_users_by_ids(user_ids)
+        return Response(dump_users_or_null(users), media_type="application/json")
+    
+    if include is not None:
+        if include != "recent_posts":
+            raise HTTPException(status_code=400, detail=f"Unknown include: {include}")
+        # 사용자 페이지와 최근 게시글을 한 번에 조회 (사용자마다 /users/{id}/posts 를 호출하는 N+1 대신)
+        rows = await user_service.get_users_with_recent_posts(skip=skip, limit=limit, per_user=per_user)
+        return Response(dump_users_with_posts(rows), media_type="application/json")
+    
+    if LIST_CACHE_ENABLED:
+        # 만료 시에도 stale 응답을 바로 반환하고 갱신은 백그라운드 1회 (DB 로 같은 조회가 몰리지 않음)
+        return Response(await user_service.get_users_cached(skip, limit), media_type="application/json")
+    if JSON_PASSTHROUGH:
+        return Response(await user_service.get_users_json(skip=skip, limit=limit), media_type="application/json")
+    if COMPACT_RESPONSES:
+        # 응답 모델 없이 조회 결과 객체를 바로 직렬화
+        rows = await user_service.get_users_rows(skip=skip, limit=limit)
+        return Response(dump_rows(rows, USER_WITH_POST_COUNT_FIELDS), media_type="application/json")
     return await user_service.get_users(skip=skip, limit=limit)
 
 
+# /{user_id} 보다 먼저 등록해야 "lookup" 이 user_id 로 해석되지 않음
+@router.get("/lookup", response_model=List[UserResponse])
+@with_timeout("lookup_users")
+async def lookup_users(
+    q: str = Query(..., min_length=USER_LOOKUP_MIN_LENGTH, max_length=255, description="이름/이메일 일부 (정확한 이메일이면 단건 조회)"),
+    limit: int = Query(10, ge=1, le=100)
+):
+    """이름/이메일 부분 일치 사용자 조회"""
+    return await user_service.lookup_users(q, limit=limit)
+
+
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(user_id: str):
+@with_timeout("get_user")
+async def get_user(
+    user_id: uuid.UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+):
     """단일 사용자 조회"""
-    try:
+    # 사용자는 변경되지 않으므로 이 워커에서 존재를 확인한 적이 있으면 DB 조회 없이 304
+    etag = weak_etag("user", user_id)
+    if etag_matches(if_none_match, etag) and user_versions.get(user_id) is not None:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    if JSON_PASSTHROUGH:
+        user = await user_service.get_user_json(user_id)
+    else:
         user = await user_service.get_user(user_id)
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-        return user
-    except gel.InvalidValueError:
-        raise HTTPException(status_code=400, detail="Invalid user ID format")
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    if JSON_PASSTHROUGH:
+        return Response(user, media_type="application/json", headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return user
 
 
 @router.get("/{user_id}/posts", response_model=List[PostResponse])
+@with_timeout("get_user_posts")
 async def get_user_posts(
-    user_id: str,
+    user_id: uuid.UUID,
+    response: Response,
     skip: int = Query(0, ge=0),
-    limit: int = Query(10, ge=1, le=100)
+    limit: int = Query(10, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: id,title)"),
+    if_none_match: Optional[str] = Header(None)
 ):
     """사용자의 게시글 조회"""
+    projection = None
+    if fields is not None:
+        try:
+            projection = parse_post_fields(fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    # 게시글 수를 버전으로 사용 (캐시 적중 시 DB 조회 없음)
+    version = await user_service.get_user_posts_version(user_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    etag = weak_etag("posts", user_id, version, skip, limit, ".".join(projection or ("all",)))
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
     try:
+        if projection is not None:
+            rows = await user_service.get_user_posts_projection(user_id, projection, skip=skip, limit=limit)
+            return Response(dump_post_projection(rows, projection), media_type="application/json", headers={"ETag": etag})
+        if JSON_PASSTHROUGH:
+            posts = await user_service.get_user_posts_json(user_id, skip=skip, limit=limit)
+            return Response(posts, media_type="application/json", headers={"ETag": etag})
+        if COMPACT_RESPONSES:
+            rows = await user_service.get_user_posts_projection(user_id, POST_FIELDS, skip=skip, limit=limit)
+            return Response(dump_rows(rows, POST_FIELDS), media_type="application/json", headers={"ETag": etag})
         posts = await user_service.get_user_posts(user_id, skip=skip, limit=limit)
-        if not posts:
-            # 빈 리스트인지 사용자가 없는지 확인
-            user = await user_service.get_user(user_id)
-            if not user:
-                raise HTTPException(status_code=404, detail="User not found")
-        return posts
-    except gel.InvalidValueError:
-        raise HTTPException(status_code=400, detail="Invalid user ID format") 
\ No newline at end of file
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    response.headers["ETag"] = etag
+    return posts
@@ -1,7 +1,16 @@
+import datetime
 import gel
 import os
 from typing import Optional
 
+from ..common.timeouts import STATEMENT_TIMEOUT_MS
+
+# JSON passthrough 모드: 서버가 만든 JSON 을 그대로 응답 (Python 객체 생성 생략)
+JSON_PASSTHROUGH = os.getenv("EDGEDB_JSON_PASSTHROUGH", "0") == "1"
+
+# Connection pool size
+MAX_CONCURRENCY = 5
+
 # EdgeDB connection pool
 _client: Optional[gel.AsyncIOClient] = None
 
@@ -15,10 +24,13 @@ async def get_edgedb_client() -> gel.AsyncIOClient:
             host="localhost",
             port=5656,
             # Connection pool 설정
-            max_concurrency=5,
+            max_concurrency=MAX_CONCURRENCY,
             # TLS 비활성화 (개발 환경용)
             tls_security="insecure",
             database="edgedb"
+        ).with_config(
+            # 서버 측 쿼리 실행 타임아웃
+            query_execution_timeout=datetime.timedelta(milliseconds=STATEMENT_TIMEOUT_MS)
         )
     return _client
 
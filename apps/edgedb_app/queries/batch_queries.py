@@ -0,0 +1,61 @@
+# id 배치 조회 (GET /users?ids=, GET /posts?ids=)
+# 배열 파라미터 1개로 받으므로 id 개수와 관계없이 같은 쿼리가 캐시된다.
+
+from __future__ import annotations
+import dataclasses
+import gel
+import uuid
+
+
+@dataclasses.dataclass
+class GetUsersByIdsResult:
+    id: uuid.UUID
+    name: str
+    email: str
+
+
+@dataclasses.dataclass
+class GetPostsByIdsResult:
+    id: uuid.UUID
+    title: str
+    content: str
+    user_id: uuid.UUID
+
+
+async def get_users_by_ids(
+    executor: gel.AsyncIOExecutor,
+    *,
+    ids: list[uuid.UUID],
+) -> list[GetUsersByIdsResult]:
+    """id 목록으로 사용자 조회 (순서 보장 없음)"""
+    return await executor.query(
+        """\
+        SELECT User {
+            id,
+            name,
+            email
+        }
+        FILTER .id IN array_unpack(<array<uuid>>$ids);\
+        """,
+        ids=ids,
+    )
+
+
+async def get_posts_by_ids(
+    executor: gel.AsyncIOExecutor,
+    *,
+    ids: list[uuid.UUID],
+) -> list[GetPostsByIdsResult]:
+    """id 목록으로 게시글 조회 (순서 보장 없음)"""
+    return await executor.query(
+        """\
+        SELECT Post {
+            id,
+            title,
+            content,
+            user_id := .user.id
+        }
+        FILTER .id IN array_unpack(<array<uuid>>$ids);\
+        """,
+        ids=ids,
+    )
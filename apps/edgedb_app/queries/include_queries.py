@@ -0,0 +1,56 @@
+# 사용자 목록 + 사용자별 최근 게시글 (중첩 shape 1회 조회)
+# posts 링크 shape 에 ORDER BY / LIMIT 를 주면 사용자별로 적용된다.
+
+from __future__ import annotations
+import dataclasses
+import gel
+import uuid
+
+
+@dataclasses.dataclass
+class UsersWithRecentPostsResult:
+    id: uuid.UUID
+    name: str
+    email: str
+    posts: list[UsersWithRecentPostsResultPostsItem]
+
+
+@dataclasses.dataclass
+class UsersWithRecentPostsResultPostsItem:
+    id: uuid.UUID
+    title: str
+    content: str
+    user_id: uuid.UUID
+
+
+async def get_users_with_recent_posts(
+    executor: gel.AsyncIOExecutor,
+    *,
+    skip: int,
+    limit: int,
+    per_user: int,
+) -> list[UsersWithRecentPostsResult]:
+    """사용자 페이지 + 사용자별 최근 per_user 건 게시글"""
+    return await executor.query(
+        """\
+        SELECT User {
+            id,
+            name,
+            email,
+            posts: {
+                id,
+                title,
+                content,
+                user_id := .user.id
+            }
+            ORDER BY .id DESC
+            LIMIT <int64>$per_user
+        }
+        ORDER BY .id
+        OFFSET <int64>$skip
+        LIMIT <int64>$limit;\
+        """,
+        skip=skip,
+        limit=limit,
+        per_user=per_user,
+    )
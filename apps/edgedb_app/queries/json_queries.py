@@ -0,0 +1,158 @@
+# JSON passthrough 쿼리
+# 서버에서 응답 스키마(UserResponse / PostResponse)와 같은 모양의 JSON 을 만들어 반환한다.
+# gel-py 코드 생성기는 JSON 출력 함수를 만들지 않으므로 직접 작성.
+
+from __future__ import annotations
+import gel
+import uuid
+
+
+async def insert_user_json(
+    executor: gel.AsyncIOExecutor,
+    *,
+    name: str,
+    email: str,
+) -> str:
+    return await executor.query_single_json(
+        """\
+        WITH
+          new_user := (
+            INSERT User {
+              name := <str>$name,
+              email := <str>$email
+            }
+            UNLESS CONFLICT ON .email
+          )
+        SELECT new_user {
+          id,
+          name,
+          email
+        };\
+        """,
+        name=name,
+        email=email,
+    )
+
+
+async def get_users_json(
+    executor: gel.AsyncIOExecutor,
+    *,
+    skip: int,
+    limit: int,
+) -> str:
+    return await executor.query_json(
+        """\
+        SELECT User {
+            id,
+            name,
+            email,
+            post_count
+        }
+        ORDER BY .id
+        OFFSET <int64>$skip
+        LIMIT <int64>$limit;\
+        """,
+        skip=skip,
+        limit=limit,
+    )
+
+
+async def get_user_json(
+    executor: gel.AsyncIOExecutor,
+    *,
+    user_id: uuid.UUID,
+) -> str:
+    """사용자가 없으면 "null" 반환"""
+    return await executor.query_single_json(
+        """\
+        SELECT User {
+            id,
+            name,
+            email
+        }
+        FILTER .id = <uuid>$user_id;\
+        """,
+        user_id=user_id,
+    )
+
+
+async def get_user_posts_json(
+    executor: gel.AsyncIOExecutor,
+    *,
+    user_id: uuid.UUID,
+    skip: int,
+    limit: int,
+) -> str:
+    """게시글 JSON 배열 (사용자가 없으면 "null" 반환)"""
+    return await executor.query_single_json(
+        """\
+        WITH user := (SELECT User FILTER .id = <uuid>$user_id)
+        SELECT array_agg((
+            SELECT user.posts {
+                id,
+                title,
+                content,
+                user_id := user.id
+            }
+            ORDER BY .id
+            OFFSET <int64>$skip
+            LIMIT <int64>$limit
+        ))
+        FILTER EXISTS user;\
+        """,
+        user_id=user_id,
+        skip=skip,
+        limit=limit,
+    )
+
+
+async def create_post_json(
+    executor: gel.AsyncIOExecutor,
+    *,
+    title: str,
+    content: str,
+    user_id: uuid.UUID,
+) -> str:
+    return await executor.query_single_json(
+        """\
+        WITH new_post := (
+            INSERT Post {
+                title := <str>$title,
+                content := <str>$content,
+                user := (SELECT User FILTER .id = <uuid>$user_id)
+            }
+        )
+        SELECT new_post {
+            id,
+            title,
+            content,
+            user_id := .user.id
+        };\
+        """,
+        title=title,
+        content=content,
+        user_id=user_id,
+    )
+
+
+async def get_posts_json(
+    executor: gel.AsyncIOExecutor,
+    *,
+    skip: int,
+    limit: int,
+) -> str:
+    return await executor.query_json(
+        """\
+        SELECT Post {
+            id,
+            title,
+            content,
+            user_id := .user.id
+        }
+        ORDER BY .id DESC
+        OFFSET <int64>$skip
+        LIMIT <int64>$limit;\
+        """,
+        skip=skip,
+        limit=limit,
+    )
@@ -0,0 +1,58 @@
+# 사용자 조회 쿼리 (이름/이메일 부분 일치)
+# name / email 의 ext::pg_trgm::gin 인덱스가 ILIKE '%q%' 에 사용된다.
+
+from __future__ import annotations
+import dataclasses
+import gel
+import uuid
+
+
+@dataclasses.dataclass
+class LookupUsersResult:
+    id: uuid.UUID
+    name: str
+    email: str
+
+
+async def get_user_by_email(
+    executor: gel.AsyncIOExecutor,
+    *,
+    email: str,
+) -> LookupUsersResult | None:
+    """정확한 이메일 조회 (exclusive 제약 인덱스 사용)"""
+    return await executor.query_single(
+        """\
+        SELECT User {
+            id,
+            name,
+            email
+        }
+        FILTER .email = <str>$email;\
+        """,
+        email=email,
+    )
+
+
+async def lookup_users(
+    executor: gel.AsyncIOExecutor,
+    *,
+    contains: str,
+    prefix: str,
+    limit: int,
+) -> list[LookupUsersResult]:
+    """부분 일치 조회 (접두 일치 우선, 그다음 id 순)"""
+    return await executor.query(
+        """\
+        SELECT User {
+            id,
+            name,
+            email
+        }
+        FILTER .name ILIKE <str>$contains OR .email ILIKE <str>$contains
+        ORDER BY (.name ILIKE <str>$prefix OR .email ILIKE <str>$prefix) DESC THEN .id
+        LIMIT <int64>$limit;\
+        """,
+        contains=contains,
+        prefix=prefix,
+        limit=limit,
+    )
@@ -0,0 +1,66 @@
+# Sparse fieldset 쿼리
+# 요청 필드로 EdgeQL shape 를 구성한다. 필드명은 schemas.parse_post_fields 로 검증된 값만 사용.
+
+from __future__ import annotations
+import gel
+import uuid
+from typing import Tuple
+
+# 응답 필드 -> shape 요소
+POST_SHAPE = {
+    "id": "id",
+    "title": "title",
+    "content": "content",
+    "user_id": "user_id := .user.id",
+}
+
+
+def post_shape(fields: Tuple[str, ...]) -> str:
+    return ", ".join(POST_SHAPE[name] for name in fields)
+
+
+async def get_posts_projection(
+    executor: gel.AsyncIOExecutor,
+    *,
+    fields: Tuple[str, ...],
+    skip: int,
+    limit: int,
+) -> list[gel.Object]:
+    return await executor.query(
+        f"""\
+        SELECT Post {{ {post_shape(fields)} }}
+        ORDER BY .id DESC
+        OFFSET <int64>$skip
+        LIMIT <int64>$limit;\
+        """,
+        skip=skip,
+        limit=limit,
+    )
+
+
+async def get_user_posts_projection(
+    executor: gel.AsyncIOExecutor,
+    *,
+    fields: Tuple[str, ...],
+    user_id: uuid.UUID,
+    skip: int,
+    limit: int,
+) -> gel.Object:
+    """user_exists 와 posts 를 함께 반환"""
+    return await executor.query_required_single(
+        f"""\
+        WITH user := (SELECT User FILTER .id = <uuid>$user_id)
+        SELECT {{
+            user_exists := EXISTS user,
+            posts := (
+                SELECT user.posts {{ {post_shape(fields)} }}
+                ORDER BY .id
+                OFFSET <int64>$skip
+                LIMIT <int64>$limit
+            )
+        }};\
+        """,
+        user_id=user_id,
+        skip=skip,
+        limit=limit,
+    )
@@ -0,0 +1,57 @@
+# 전문 검색 쿼리 (Post 의 fts::index 사용)
+# 점수 내림차순 + (score, id) keyset 페이지네이션
+
+from __future__ import annotations
+import dataclasses
+import gel
+import uuid
+
+
+@dataclasses.dataclass(frozen=True)
+class SearchPostsResultPost:
+    id: uuid.UUID
+    title: str
+    content: str
+    user_id: uuid.UUID
+
+
+@dataclasses.dataclass(frozen=True)
+class SearchPostsResult:
+    post: SearchPostsResultPost
+    rank: float
+
+
+async def search_posts(
+    executor: gel.AsyncIOExecutor,
+    *,
+    q: str,
+    limit: int,
+    after_rank: float | None = None,
+    after_id: uuid.UUID | None = None,
+) -> list[SearchPostsResult]:
+    return await executor.query(
+        """\
+        SELECT (
+            FOR hit IN fts::search(Post, <str>$q, language := 'eng')
+            UNION (
+                post := hit.object {
+                    id,
+                    title,
+                    content,
+                    user_id := .user.id
+                },
+                rank := hit.score
+            )
+        )
+        FILTER (
+            .rank < <optional float32>$after_rank
+            OR (.rank = <optional float32>$after_rank AND .post.id < <optional uuid>$after_id)
+        ) ?? true
+        ORDER BY .rank DESC THEN .post.id DESC
+        LIMIT <int64>$limit;\
+        """,
+        q=q,
+        limit=limit,
+        after_rank=after_rank,
+        after_id=after_id,
+    )
@@ -0,0 +1,118 @@
+# 사용자 쿼리 (gel-py 생성 모듈에서 shape 을 바꿔 직접 관리)
+# queries/user/*_async_edgeql.py 는 재생성 시 덮어써지므로 수정한 쿼리는 이 모듈에 둔다.
+
+from __future__ import annotations
+import dataclasses
+import gel
+import uuid
+
+
+@dataclasses.dataclass
+class InsertUserResult:
+    id: uuid.UUID
+    name: str
+    email: str
+
+
+@dataclasses.dataclass
+class GetUsersResult:
+    id: uuid.UUID
+    name: str
+    email: str
+    post_count: int
+
+
+@dataclasses.dataclass
+class GetUserPostsResult:
+    user_exists: bool
+    posts: list[GetUserPostsResultPostsItem]
+
+
+@dataclasses.dataclass
+class GetUserPostsResultPostsItem:
+    id: uuid.UUID
+    title: str
+    content: str
+
+
+async def insert_user(
+    executor: gel.AsyncIOExecutor,
+    *,
+    name: str,
+    email: str,
+) -> InsertUserResult | None:
+    """사용자 생성 (이메일이 이미 있으면 None)"""
+    return await executor.query_single(
+        """\
+        WITH
+          new_user := (
+            INSERT User {
+              name := <str>$name,
+              email := <str>$email
+            }
+            UNLESS CONFLICT ON .email
+          )
+        SELECT new_user {
+          id,
+          name,
+          email
+        };\
+        """,
+        name=name,
+        email=email,
+    )
+
+
+async def get_users(
+    executor: gel.AsyncIOExecutor,
+    *,
+    skip: int,
+    limit: int,
+) -> list[GetUsersResult]:
+    """사용자 목록 (post_count 카운터 포함)"""
+    return await executor.query(
+        """\
+        SELECT User {
+            id,
+            name,
+            email,
+            post_count
+        }
+        ORDER BY .id
+        OFFSET <int64>$skip
+        LIMIT <int64>$limit;\
+        """,
+        skip=skip,
+        limit=limit,
+    )
+
+
+async def get_user_posts(
+    executor: gel.AsyncIOExecutor,
+    *,
+    user_id: uuid.UUID,
+    skip: int,
+    limit: int,
+) -> GetUserPostsResult:
+    """사용자 존재 여부 + 게시글 1회 조회 (사용자가 없으면 user_exists=False, posts=[])"""
+    return await executor.query_required_single(
+        """\
+        WITH user := (SELECT User FILTER .id = <uuid>$user_id)
+        SELECT {
+            user_exists := EXISTS user,
+            posts := (
+                SELECT user.posts {
+                    id,
+                    title,
+                    content
+                }
+                ORDER BY .id
+                OFFSET <int64>$skip
+                LIMIT <int64>$limit
+            )
+        };\
+        """,
+        user_id=user_id,
+        skip=skip,
+        limit=limit,
+    )
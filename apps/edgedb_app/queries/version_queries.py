@@ -0,0 +1,20 @@
+# ETag 버전 쿼리
+# 게시글은 추가만 되므로 사용자별 게시글 수(post_count 카운터)를 버전으로 사용한다.
+
+from __future__ import annotations
+import gel
+import uuid
+
+
+async def get_user_posts_version(
+    executor: gel.AsyncIOExecutor,
+    *,
+    user_id: uuid.UUID,
+) -> int | None:
+    """사용자 게시글 수 (사용자가 없으면 None)"""
+    return await executor.query_single(
+        """\
+        SELECT (SELECT User FILTER .id = <uuid>$user_id).post_count;\
+        """,
+        user_id=user_id,
+    )
@@ -0,0 +1,36 @@
+"""User.post_count 보정 (실제 게시글 수와 다른 사용자만 갱신)
+
+카운터는 Post insert 트리거로 증가하지만, 트리거 추가 이전 데이터는 0 으로 남아 있다.
+EdgeDB 트랜잭션은 serializable 이므로 동시 create_post 와 충돌하면 클라이언트가 재시도한다.
+
+    $ python -m apps.edgedb_app.reconcile
+"""
+from __future__ import annotations
+
+import asyncio
+
+from .database import get_edgedb_client, close_edgedb_client
+
+RECONCILE_QUERY = """\
+SELECT count((
+    UPDATE User
+    FILTER .post_count != count(.posts)
+    SET { post_count := count(.posts) }
+));\
+"""
+
+
+async def reconcile_post_counts() -> int:
+    """어긋난 post_count 를 고치고 수정한 사용자 수를 반환"""
+    client = await get_edgedb_client()
+    return await client.query_required_single(RECONCILE_QUERY)
+
+
+async def main() -> None:
+    fixed = await reconcile_post_counts()
+    print(f"post_count reconciled: {fixed} users fixed")
+    await close_edgedb_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 from .frozen_config import FROZEN_CONFIG
-from .user import UserCreate, UserResponse, UserWithPostsResponse
-from .post import PostCreate, PostResponse
+from .user import UserCreate, UserResponse, UserWithPostCountResponse, USER_WITH_POST_COUNT_FIELDS, UserWithPostsResponse, dump_users_with_posts, dump_users_or_null
+from .post import PostCreate, PostResponse, PostSearchHit, PostSearchPage, POST_FIELDS, parse_post_fields, dump_post_projection, dump_posts_or_null
 
 __all__ = [
     "FROZEN_CONFIG",
     "UserCreate",
     "UserResponse", 
+    "UserWithPostCountResponse",
+    "USER_WITH_POST_COUNT_FIELDS",
     "UserWithPostsResponse",
+    "dump_users_with_posts",
+    "dump_users_or_null",
     "PostCreate",
     "PostResponse",
+    "PostSearchHit",
+    "PostSearchPage",
+    "POST_FIELDS",
+    "parse_post_fields",
+    "dump_post_projection",
+    "dump_posts_or_null",
 ]
@@ -1,11 +1,24 @@
 
 import uuid
-from typing import List
+from typing import List, Optional, Tuple
 
 from ..database import get_edgedb_client
 from ..queries.post.create_post_async_edgeql import create_post as create_post_query
 from ..queries.post.get_posts_async_edgeql import get_posts as get_posts_query
-from ..schemas import PostCreate, PostResponse
+from ..queries.batch_queries import get_posts_by_ids as get_posts_by_ids_query
+from ..queries.json_queries import create_post_json as create_post_json_query
+from ..queries.json_queries import get_posts_json as get_posts_json_query
+from ..queries.projection_queries import get_posts_projection as get_posts_projection_query
+from ..queries.search_queries import search_posts as search_posts_query
+from ..schemas import PostCreate, PostResponse, PostSearchHit, PostSearchPage, POST_FIELDS
+from .user_service import user_posts_versions
+from ...common.batch import unique_ids, in_request_order
+from ...common.compact import dump_rows
+from ...common.cursor import encode_cursor, decode_cursor
+from ...common.swr import list_cache
+
+# 게시글 목록 페이지 캐시 (LIST_CACHE_ENABLED=1 일 때만, 키: (skip, limit))
+posts_pages = list_cache()
 
 
 class PostService:
@@ -22,12 +35,13 @@ class PostService:
             content=post.content,
             user_id=uuid.UUID(post.user_id),
         )
+        user_posts_versions.bump(created_post.user.id)
         
         return PostResponse(
-            id=str(created_post.id),
+            id=created_post.id,
             title=created_post.title,
             content=created_post.content,
-            user_id=str(created_post.user.id)
+            user_id=created_post.user.id
         )
     
     async def get_posts(self, skip: int = 0, limit: int = 10) -> List[PostResponse]:
@@ -43,13 +57,89 @@ class PostService:
         
         return [
             PostResponse(
-                id=str(post.id),
+                id=post.id,
                 title=post.title,
                 content=post.content,
-                user_id=str(post.user.id)
+                user_id=post.user.id
             ) for post in posts
         ]
+    
+    async def get_posts_cached(self, skip: int, limit: int) -> bytes:
+        """게시글 목록 JSON (stale-while-revalidate 캐시, 만료 시 DB 조회는 키당 1회)"""
+        return await posts_pages.get_or_load((skip, limit), lambda: self._load_posts_page(skip, limit))
+    
+    async def _load_posts_page(self, skip: int, limit: int) -> bytes:
+        rows = await self.get_posts_projection(POST_FIELDS, skip=skip, limit=limit)
+        return dump_rows(rows, POST_FIELDS)
+    
+    async def get_posts_by_ids(self, post_ids: List[uuid.UUID]) -> List[Optional[PostResponse]]:
+        """id 목록으로 게시글 조회 (array_unpack 1회, 요청 순서로 반환하고 없는 id 는 None)"""
+        client = await get_edgedb_client()
+        
+        posts = await get_posts_by_ids_query(client, ids=unique_ids(post_ids))
+        
+        return in_request_order(
+            post_ids,
+            [
+                PostResponse(
+                    id=post.id,
+                    title=post.title,
+                    content=post.content,
+                    user_id=post.user_id
+                ) for post in posts
+            ],
+        )
+    
+    async def create_post_json(self, post: PostCreate) -> str:
+        """게시글 생성 (JSON passthrough)"""
+        client = await get_edgedb_client()
+        user_id = uuid.UUID(post.user_id)
+        created_post = await create_post_json_query(
+            client,
+            title=post.title,
+            content=post.content,
+            user_id=user_id,
+        )
+        user_posts_versions.bump(user_id)
+        return created_post
+    
+    async def get_posts_json(self, skip: int = 0, limit: int = 10) -> str:
+        """게시글 목록 조회 (JSON passthrough)"""
+        client = await get_edgedb_client()
+        return await get_posts_json_query(client, skip=skip, limit=limit)
+    
+    async def get_posts_projection(self, fields: Tuple[str, ...], skip: int = 0, limit: int = 10) -> list:
+        """게시글 목록 조회 (요청한 필드만 shape 에 포함)"""
+        client = await get_edgedb_client()
+        return await get_posts_projection_query(client, fields=fields, skip=skip, limit=limit)
+
+    
+    async def search_posts(self, q: str, limit: int = 10, cursor: Optional[str] = None) -> PostSearchPage:
+        """게시글 전문 검색 (fts::search 점수 내림차순, (score, id) keyset 페이지네이션)"""
+        after_rank, after_id = decode_cursor(cursor, (float, uuid.UUID)) if cursor is not None else (None, None)
+        client = await get_edgedb_client()
+        
+        # 다음 페이지 존재 여부 확인용 1건 추가
+        hits = await search_posts_query(
+            client,
+            q=q,
+            limit=limit + 1,
+            after_rank=after_rank,
+            after_id=after_id,
+        )
+        
+        items = [
+            PostSearchHit(
+                id=hit.post.id,
+                title=hit.post.title,
+                content=hit.post.content,
+                user_id=hit.post.user_id,
+                rank=hit.rank
+            ) for hit in hits[:limit]
+        ]
+        next_cursor = encode_cursor(hits[limit - 1].rank, hits[limit - 1].post.id) if len(hits) > limit else None
+        return PostSearchPage(items=items, next_cursor=next_cursor)
 
 
 # 싱글톤 인스턴스
-post_service = PostService() 
\ No newline at end of file
+post_service = PostService()
\ No newline at end of file
@@ -1,37 +1,68 @@
 
 import uuid
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from ..database import get_edgedb_client
-from ..queries.user.insert_user_async_edgeql import insert_user
-from ..queries.user.get_users_async_edgeql import get_users as get_users_query
-from ..queries.user.get_user_async_edgeql import get_user as get_user_query
-from ..queries.user.get_user_posts_async_edgeql import get_user_posts as get_user_posts_query
-from ..schemas import UserCreate, UserResponse, PostResponse
+from ..queries.user_queries import insert_user
+from ..queries.user_queries import get_users as get_users_query
+from ..queries.user_queries import get_user_posts as get_user_posts_query
+from ..queries.json_queries import (
+    insert_user_json,
+    get_users_json as get_users_json_query,
+    get_user_json as get_user_json_query,
+    get_user_posts_json as get_user_posts_json_query,
+)
+from ..queries.batch_queries import get_users_by_ids as get_users_by_ids_query
+from ..queries.include_queries import get_users_with_recent_posts as get_users_with_recent_posts_query
+from ..queries.lookup_queries import get_user_by_email, lookup_users as lookup_users_query
+from ..queries.projection_queries import get_user_posts_projection as get_user_posts_projection_query
+from ..queries.version_queries import get_user_posts_version as get_user_posts_version_query
+from ..schemas import UserCreate, UserResponse, UserWithPostCountResponse, USER_WITH_POST_COUNT_FIELDS, PostResponse
+from ...common.batch import unique_ids, in_request_order
+from ...common.compact import dump_rows
+from ...common.etag import VersionCache
+from ...common.shared_cache import NOT_FOUND, shared_cache
+from ...common.search import escape_like
+from ...common.swr import list_cache
+
+# ETag 버전 캐시 (워커 단위)
+user_versions = VersionCache(ttl_ms=None)  # 사용자는 수정/삭제되지 않으므로 만료 없음
+user_posts_versions = VersionCache()  # 사용자별 게시글 수 (게시글은 추가만 되므로 버전으로 사용)
+
+# 워커 간 공유 사용자 캐시 (SHARED_CACHE_ENABLED=1 일 때만, 아니면 None)
+shared_users = shared_cache("users_edgedb")
+
+# 사용자 목록 페이지 캐시 (LIST_CACHE_ENABLED=1 일 때만, 키: (skip, limit))
+users_pages = list_cache()
 
 
 class UserService:
     """사용자 관련 비즈니스 로직"""
     
     async def create_user(self, user: UserCreate) -> UserResponse:
-        """사용자 생성"""
+        """사용자 생성 (INSERT ... UNLESS CONFLICT ON .email)"""
         client = await get_edgedb_client()
         
-        # gel CLI로 생성된 insert_user 함수 사용
         created_user = await insert_user(
             client,
             name=user.name,
             email=user.email,
         )
+        if created_user is None:
+            # 중복 이메일은 ConstraintViolationError 대신 빈 결과로 판단
+            raise ValueError("Email already exists")
+        # 이 id 를 "없음" 으로 캐시한 워커가 있을 수 있으므로 공유 캐시에서 제거 (모든 워커에 반영)
+        if shared_users is not None:
+            shared_users.invalidate(created_user.id)
         
         return UserResponse(
-            id=str(created_user.id),
+            id=created_user.id,
             name=created_user.name,
             email=created_user.email
         )
     
-    async def get_users(self, skip: int = 0, limit: int = 10) -> List[UserResponse]:
-        """사용자 목록 조회"""
+    async def get_users(self, skip: int = 0, limit: int = 10) -> List[UserWithPostCountResponse]:
+        """사용자 목록 조회 (post_count 포함)"""
         client = await get_edgedb_client()
         
         # gel CLI로 생성된 get_users_query 함수 사용
@@ -42,55 +73,169 @@ class UserService:
         )
         
         return [
-            UserResponse(
-                id=str(user.id),
+            UserWithPostCountResponse(
+                id=user.id,
                 name=user.name,
-                email=user.email
+                email=user.email,
+                post_count=user.post_count
             ) for user in users
         ]
     
-    async def get_user(self, user_id: str) -> Optional[UserResponse]:
-        """단일 사용자 조회"""
+    async def get_users_rows(self, skip: int = 0, limit: int = 10) -> list:
+        """사용자 목록 조회 (post_count 포함, 응답 모델로 옮기지 않고 조회 결과 객체를 그대로 반환)"""
+        client = await get_edgedb_client()
+        return await get_users_query(client, skip=skip, limit=limit)
+    
+    async def get_users_cached(self, skip: int, limit: int) -> bytes:
+        """사용자 목록 JSON (stale-while-revalidate 캐시, 만료 시 DB 조회는 키당 1회)"""
+        return await users_pages.get_or_load((skip, limit), lambda: self._load_users_page(skip, limit))
+    
+    async def _load_users_page(self, skip: int, limit: int) -> bytes:
+        rows = await self.get_users_rows(skip=skip, limit=limit)
+        return dump_rows(rows, USER_WITH_POST_COUNT_FIELDS)
+    
+    async def get_users_with_recent_posts(self, skip: int = 0, limit: int = 10, per_user: int = 3) -> list:
+        """사용자 목록 + 사용자별 최근 게시글 (중첩 shape 로 1회 조회)"""
+        client = await get_edgedb_client()
+        return await get_users_with_recent_posts_query(client, skip=skip, limit=limit, per_user=per_user)
+    
+    async def lookup_users(self, q: str, limit: int = 10) -> List[UserResponse]:
+        """이름/이메일 부분 일치 조회 (pg_trgm 인덱스, 정확한 이메일이면 exclusive 인덱스로 단건 조회)"""
         client = await get_edgedb_client()
         
-        # gel CLI로 생성된 get_user_query 함수 사용
-        user = await get_user_query(
+        if "@" in q:
+            exact = await get_user_by_email(client, email=q)
+            if exact:
+                return [UserResponse(id=exact.id, name=exact.name, email=exact.email)]
+        
+        pattern = escape_like(q)
+        users = await lookup_users_query(
             client,
-            user_id=uuid.UUID(user_id),
+            contains=f"%{pattern}%",
+            prefix=f"{pattern}%",
+            limit=limit,
         )
         
-        if not user:
-            return None
+        return [
+            UserResponse(
+                id=user.id,
+                name=user.name,
+                email=user.email
+            ) for user in users
+        ]
+    
+    async def get_user(self, user_id: uuid.UUID) -> Optional[UserResponse]:
+        """단일 사용자 조회 (공유 캐시가 있으면 캐시 우선, 없는 사용자도 짧게 캐시)"""
+        if shared_users is not None:
+            cached = shared_users.get(user_id)
+            if cached == NOT_FOUND:
+                return None
+            if cached is not None:
+                user_versions.set(user_id, 0)
+                return UserResponse.model_validate_json(cached)
         
-        return UserResponse(
-            id=str(user.id),
-            name=user.name,
-            email=user.email
+        users = await self.get_users_by_ids([user_id])
+        user = users[0]
+        if shared_users is not None:
+            shared_users.set(user_id, NOT_FOUND if user is None else user.model_dump_json().encode())
+        return user
+    
+    async def get_users_by_ids(self, user_ids: List[uuid.UUID]) -> List[Optional[UserResponse]]:
+        """id 목록으로 사용자 조회 (array_unpack 1회, 요청 순서로 반환하고 없는 id 는 None)"""
+        client = await get_edgedb_client()
+        
+        users = await get_users_by_ids_query(client, ids=unique_ids(user_ids))
+        
+        for user in users:
+            user_versions.set(user.id, 0)
+        return in_request_order(
+            user_ids,
+            [
+                UserResponse(
+                    id=user.id,
+                    name=user.name,
+                    email=user.email
+                ) for user in users
+            ],
         )
     
-    async def get_user_posts(self, user_id: str, skip: int = 0, limit: int = 10) -> List[PostResponse]:
-        """사용자의 게시글 조회"""
+    async def get_user_posts_version(self, user_id: uuid.UUID) -> Optional[int]:
+        """사용자 게시글 버전 (게시글 수, 사용자가 없으면 None)"""
+        version = user_posts_versions.get(user_id)
+        if version is not None:
+            return version
+        
+        client = await get_edgedb_client()
+        version = await get_user_posts_version_query(client, user_id=user_id)
+        if version is not None:
+            user_posts_versions.set(user_id, version)
+        return version
+    
+    async def get_user_posts(self, user_id: uuid.UUID, skip: int = 0, limit: int = 10) -> List[PostResponse]:
+        """사용자의 게시글 조회 (사용자 존재 여부와 게시글을 단일 쿼리로 조회)"""
         client = await get_edgedb_client()
         
         # gel CLI로 생성된 get_user_posts_query 함수 사용
         result = await get_user_posts_query(
             client,
-            user_id=uuid.UUID(user_id),
+            user_id=user_id,
             skip=skip,
             limit=limit,
         )
         
-        if not result:
-            return []
+        if not result.user_exists:
+            raise ValueError("User not found")
         
         return [
             PostResponse(
-                id=str(post.id),
+                id=post.id,
                 title=post.title,
                 content=post.content,
                 user_id=user_id
             ) for post in result.posts
         ]
+    
+    async def create_user_json(self, user: UserCreate) -> str:
+        """사용자 생성 (JSON passthrough, 중복 이메일이면 ValueError)"""
+        client = await get_edgedb_client()
+        created_user = await insert_user_json(client, name=user.name, email=user.email)
+        if created_user == "null":
+            raise ValueError("Email already exists")
+        return created_user
+    
+    async def get_users_json(self, skip: int = 0, limit: int = 10) -> str:
+        """사용자 목록 조회 (JSON passthrough)"""
+        client = await get_edgedb_client()
+        return await get_users_json_query(client, skip=skip, limit=limit)
+    
+    async def get_user_json(self, user_id: uuid.UUID) -> Optional[str]:
+        """단일 사용자 조회 (JSON passthrough)"""
+        client = await get_edgedb_client()
+        user = await get_user_json_query(client, user_id=user_id)
+        if user == "null":
+            return None
+        user_versions.set(user_id, 0)
+        return user
+    
+    async def get_user_posts_json(self, user_id: uuid.UUID, skip: int = 0, limit: int = 10) -> str:
+        """사용자의 게시글 조회 (JSON passthrough)"""
+        client = await get_edgedb_client()
+        posts = await get_user_posts_json_query(client, user_id=user_id, skip=skip, limit=limit)
+        if not posts or posts == "null":
+            raise ValueError("User not found")
+        return posts
+    
+    async def get_user_posts_projection(
+        self, user_id: uuid.UUID, fields: Tuple[str, ...], skip: int = 0, limit: int = 10
+    ) -> list:
+        """사용자의 게시글 조회 (요청한 필드만 shape 에 포함)"""
+        client = await get_edgedb_client()
+        result = await get_user_posts_projection_query(
+            client, fields=fields, user_id=user_id, skip=skip, limit=limit
+        )
+        if not result.user_exists:
+            raise ValueError("User not found")
+        return result.posts
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,54 @@
+"""워커 시작 시 클라이언트 풀 예열 (WARMUP_ENABLED=1 일 때 startup 에서 실행)
+
+max_concurrency 개 트랜잭션을 동시에 열어 커넥션(TLS 핸드셰이크 + 인증)을 모두 맺고,
+자주 쓰는 조회를 실행해 클라이언트의 쿼리별 코덱 캐시와 서버의 컴파일 캐시를 채운다.
+쓰기(insert_user / create_post)는 데이터를 만들지 않도록 예열하지 않는다.
+"""
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+from .database import JSON_PASSTHROUGH, MAX_CONCURRENCY, get_edgedb_client
+from .queries.user_queries import get_users, get_user_posts
+from .queries.post.get_posts_async_edgeql import get_posts
+from .queries.batch_queries import get_users_by_ids, get_posts_by_ids
+from .queries.json_queries import get_users_json, get_user_json, get_user_posts_json, get_posts_json
+from .queries.version_queries import get_user_posts_version
+from ..common.warmup import warm_up
+
+# 존재하지 않는 id 로 조회 (결과는 비어도 코덱/컴파일 캐시는 동일하게 채워짐)
+_MISSING_ID = uuid.UUID(int=0)
+
+HOT_READS = (
+    lambda tx: get_users(tx, skip=0, limit=10),
+    lambda tx: get_users_by_ids(tx, ids=[_MISSING_ID]),
+    lambda tx: get_user_posts(tx, user_id=_MISSING_ID, skip=0, limit=10),
+    lambda tx: get_user_posts_version(tx, user_id=_MISSING_ID),
+    lambda tx: get_posts(tx, skip=0, limit=10),
+    lambda tx: get_posts_by_ids(tx, ids=[_MISSING_ID]),
+)
+
+# JSON passthrough 는 출력 형식이 달라 별도 캐시 항목
+HOT_JSON_READS = (
+    lambda tx: get_users_json(tx, skip=0, limit=10),
+    lambda tx: get_user_json(tx, user_id=_MISSING_ID),
+    lambda tx: get_user_posts_json(tx, user_id=_MISSING_ID, skip=0, limit=10),
+    lambda tx: get_posts_json(tx, skip=0, limit=10),
+)
+
+
+async def _warm_connection(barrier: asyncio.Barrier) -> int:
+    client = await get_edgedb_client()
+    reads = HOT_READS + HOT_JSON_READS if JSON_PASSTHROUGH else HOT_READS
+    # 트랜잭션은 끝날 때까지 커넥션 1개를 점유하므로 동시에 열면 서로 다른 커넥션을 사용
+    async for tx in client.transaction():
+        async with tx:
+            for read in reads:
+                await read(tx)
+            await barrier.wait()
+    return len(reads)
+
+
+async def warm_up_pool() -> None:
+    await warm_up(_warm_connection, MAX_CONCURRENCY)
@@ -1,11 +1,81 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import time
+
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+
+from ..database import engine, POOL_SIZE
+from ...common.invalidation import CACHE_NOTIFY_ENABLED
+from ...common.warmup import WARMUP_ENABLED, warmup_state
 
 router = APIRouter()
 
+# Readiness 설정
+READY_CACHE_MS = int(os.getenv("READY_CACHE_MS", "1000"))  # DB 프로브 결과 캐시 시간
+READY_ACQUIRE_TIMEOUT_MS = int(os.getenv("READY_ACQUIRE_TIMEOUT_MS", "200"))  # 커넥션 획득 + SELECT 1 허용 지연
+READY_MAX_POOL_USAGE = float(os.getenv("READY_MAX_POOL_USAGE", "1.0"))  # 풀 사용률 임계값
+
+# 마지막 DB 프로브 결과 (워커 단위 캐시)
+_probe = {"checked_at": 0.0, "ok": False, "latency_ms": None, "error": "not probed"}
+_probe_lock = asyncio.Lock()
+
+
+async def _probe_db() -> None:
+    """커넥션 획득 + SELECT 1 (임계값 초과 시 즉시 실패)"""
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout(READY_ACQUIRE_TIMEOUT_MS / 1000):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        _probe.update(ok=True, error=None)
+    except TimeoutError:
+        _probe.update(ok=False, error="acquire latency exceeded")
+    except Exception as e:
+        _probe.update(ok=False, error=type(e).__name__)
+    _probe.update(checked_at=time.monotonic(), latency_ms=round((time.perf_counter() - started) * 1000, 2))
+
 
 @router.get("/health")
 async def health_check():
     """헬스체크 엔드포인트"""
-    return {"status": "ok", "orm": "sqlalchemy_v2"} 
\ No newline at end of file
+    return {"status": "ok", "orm": "sqlalchemy_v2"}
+
+
+@router.get("/ready")
+async def readiness_check():
+    """레디니스 엔드포인트 (풀 포화도 + 캐시된 DB 프로브)"""
+    in_use = engine.pool.checkedout()
+    pool = {"in_use": in_use, "size": POOL_SIZE}
+
+    # 풀이 포화 상태면 프로브 자체가 대기열에 쌓이므로 DB 확인 없이 바로 실패
+    if in_use >= POOL_SIZE * READY_MAX_POOL_USAGE:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unavailable", "orm": "sqlalchemy_v2", "reason": "pool saturated", "pool": pool},
+        )
+
+    # 캐시 만료 시 한 요청만 프로브하고, 진행 중이면 직전 결과 사용
+    expired = time.monotonic() - _probe["checked_at"] >= READY_CACHE_MS / 1000
+    if expired and not _probe_lock.locked():
+        async with _probe_lock:
+            await _probe_db()
+
+    if not _probe["ok"]:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unavailable", "orm": "sqlalchemy_v2", "reason": _probe["error"], "pool": pool},
+        )
+    body = {"status": "ready", "orm": "sqlalchemy_v2", "pool": pool, "db_latency_ms": _probe["latency_ms"]}
+    # 알림 수신이 끊겨도 캐시는 TTL 로 동작하므로 레디니스에는 반영하지 않고 상태만 노출
+    if CACHE_NOTIFY_ENABLED:
+        from ..invalidation import listener
+
+        body["cache_notify"] = {"connected": listener.connected, **listener.stats}
+    # 예열은 startup 에서 끝나므로 레디니스에는 반영하지 않고 결과만 노출 (실패해도 요청은 처리 가능)
+    if WARMUP_ENABLED:
+        body["warmup"] = warmup_state
+    return body
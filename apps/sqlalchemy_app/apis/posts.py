@@ -1,18 +1,23 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Response, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 
 
-from ..schemas import PostCreate, PostResponse
+from ..schemas import PostCreate, PostResponse, PostSearchPage, POST_FIELDS, parse_post_fields, dump_post_projection, dump_posts_or_null
 from ..database import get_db
 from ..services.post_service import post_service
+from ...common.batch import BATCH_MAX_IDS, parse_ids
+from ...common.compact import COMPACT_RESPONSES, dump_rows
+from ...common.swr import LIST_CACHE_ENABLED
+from ...common.timeouts import with_timeout
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
 
 @router.post("", response_model=PostResponse)
+@with_timeout("create_post")
 async def create_post(
     post: PostCreate,
     db: AsyncSession = Depends(get_db)
@@ -25,12 +30,61 @@ async def create_post(
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.get("", response_model=List[PostResponse])
+@router.get(
+    "",
+    response_model=List[PostResponse],
+    responses={200: {"description": "ids 이면 List[PostResponse | null]"}},
+)
+@with_timeout("get_posts")
 async def get_posts(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: id,title)"),
+    ids: Optional[str] = Query(None, description=f"쉼표 구분 id 목록 (최대 {BATCH_MAX_IDS}개, 요청 순서로 반환하고 없는 id 는 null)"),
     db: AsyncSession = Depends(get_db)
 ):
     """게시글 목록 조회"""
+    if ids is not None:
+        if fields is not None:
+            raise HTTPException(status_code=400, detail="ids cannot be combined with fields")
+        try:
+            post_ids = parse_ids(ids)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        posts = await post_service.get_posts_by_ids(post_ids, db)
+        return Response(dump_posts_or_null(posts), media_type="application/json")
+    
+    if fields is not None:
+        try:
+            projection = parse_post_fields(fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        rows = await post_service.get_posts_projection(skip, limit, projection, db)
+        return Response(dump_post_projection(rows, projection), media_type="application/json")
+    
+    if LIST_CACHE_ENABLED:
+        # 만료 시에도 stale 응답을 바로 반환하고 갱신은 백그라운드 1회 (DB 로 같은 조회가 몰리지 않음)
+        return Response(await post_service.get_posts_cached(skip, limit), media_type="application/json")
+    
+    if COMPACT_RESPONSES:
+        # ORM 인스턴스/응답 모델 없이 컬럼 행을 바로 직렬화
+        rows = await post_service.get_posts_projection(skip, limit, POST_FIELDS, db)
+        return Response(dump_rows(rows, POST_FIELDS), media_type="application/json")
+    
     posts = await post_service.get_posts(skip, limit, db)
-    return posts 
\ No newline at end of file
+    return posts 
+
+
+@router.get("/search", response_model=PostSearchPage)
+@with_timeout("search_posts")
+async def search_posts(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (websearch 문법: \"구문\", or, -제외)"),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 페이지 응답의 next_cursor"),
+    db: AsyncSession = Depends(get_db)
+):
+    """게시글 전문 검색 (관련도 순)"""
+    try:
+        return await post_service.search_posts(q, limit, cursor, db)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,46 @@
+"""다른 워커/호스트의 쓰기 알림으로 워커 캐시 무효화 (CACHE_NOTIFY_ENABLED=1 일 때 startup 에서 시작)
+
+create_user / create_post 가 같은 트랜잭션에서 pg_notify 로 보낸 알림은 커밋 시점에 전달된다.
+수신 연결이 끊긴 동안에는 각 캐시의 TTL 로만 만료된다.
+"""
+from __future__ import annotations
+
+from .database import DATABASE_URL
+from .services.user_service import shared_users, user_posts_versions, users_pages
+from .services.post_service import posts_pages
+from ..common.invalidation import InvalidationListener, USERS, POSTS
+
+# asyncpg 는 SQLAlchemy 드라이버 접두어 없는 DSN 사용
+listener = InvalidationListener(dsn=DATABASE_URL.replace("+asyncpg", "", 1))
+
+
+def _clear_pages() -> None:
+    # 페이지는 id 순이라 새 행이 어느 페이지에 들어가는지 알 수 없으므로 전체 제거
+    if users_pages is not None:
+        users_pages.clear()
+    if posts_pages is not None:
+        posts_pages.clear()
+
+
+def _user_created(user_id: int) -> None:
+    # 다른 호스트에서 "없음" 으로 캐시된 id (같은 호스트는 생성한 워커가 이미 제거)
+    if shared_users is not None:
+        shared_users.invalidate(user_id)
+    if users_pages is not None:
+        users_pages.clear()
+
+
+def _post_created(user_id: int) -> None:
+    # 버전을 올리지 않고 제거: 생성한 워커 자신도 알림을 받으므로 bump 하면 두 번 증가
+    user_posts_versions.invalidate(user_id)
+    _clear_pages()  # 게시글 목록 + 사용자 목록의 post_count
+
+
+def _reset() -> None:
+    user_posts_versions.clear()
+    _clear_pages()
+
+
+listener.on(USERS, _user_created)
+listener.on(POSTS, _post_created)
+listener.on_reset(_reset)
@@ -0,0 +1,34 @@
+"""SQLAlchemy 스키마 마이그레이션
+
+워커마다 startup 에서 create_all 을 실행하지 않도록 배포 시 1회만 실행한다.
+
+    $ python -m apps.sqlalchemy_app.migrate
+"""
+from __future__ import annotations
+
+import asyncio
+
+from sqlalchemy import text
+
+from .database import engine
+from .models import Base
+from ..common.counters import POST_COUNT_DDL
+from ..common.search import SEARCH_DDL, USER_LOOKUP_DDL
+
+
+async def create_schema() -> None:
+    """테이블 생성 (이미 존재하면 건너뜀)"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # create_all 은 기존 테이블을 변경하지 않으므로 추가된 컬럼/인덱스는 멱등 DDL 로 보장
+        for statement in POST_COUNT_DDL + SEARCH_DDL + USER_LOOKUP_DDL:
+            await conn.execute(text(statement))
+
+
+async def main() -> None:
+    await create_schema()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
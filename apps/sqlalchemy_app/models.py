@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from typing import List
-from sqlalchemy import String, Text, ForeignKey
+from sqlalchemy import String, Text, ForeignKey, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+from ..common.search import SEARCH_VECTOR_SQL
+
 
 class Base(DeclarativeBase):
     """SQLAlchemy v2 DeclarativeBase"""
@@ -16,6 +19,8 @@ class User(Base):
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    # 게시글 수 (create_post 트랜잭션에서 증가, reconcile 로 보정)
+    post_count: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
     
     # Relationship
     posts: Mapped[List[Post]] = relationship(back_populates="user", lazy="selectin")
@@ -29,5 +34,14 @@ class Post(Base):
     content: Mapped[str] = mapped_column(Text, nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     
+    # 전문 검색용 생성 컬럼 (일반 조회에서는 로드하지 않음)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True), deferred=True
+    )
+    
+    __table_args__ = (
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+    )
+    
     # Relationship
     user: Mapped[User] = relationship(back_populates="posts") 
\ No newline at end of file
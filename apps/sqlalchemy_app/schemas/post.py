@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel, TypeAdapter, create_model
 from .frozen_config import FROZEN_CONFIG
 
 
@@ -20,4 +23,56 @@ class PostResponse(BaseModel):
     id: int
     title: str
     content: str
-    user_id: int 
\ No newline at end of file
+    user_id: int
+
+
+# Search Response Models (검색 점수 순, keyset 페이지네이션)
+class PostSearchHit(PostResponse):
+    rank: float
+
+
+class PostSearchPage(BaseModel):
+    model_config = FROZEN_CONFIG
+
+    items: List[PostSearchHit]
+    next_cursor: Optional[str] = None
+
+
+# Sparse fieldsets (fields= 쿼리 파라미터)
+POST_FIELDS = tuple(PostResponse.model_fields)
+
+
+def parse_post_fields(fields: str) -> Tuple[str, ...]:
+    """"id,title" -> ("id", "title") (id 는 항상 포함, 정의 순서로 정규화)"""
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested.difference(POST_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    requested.add("id")
+    return tuple(name for name in POST_FIELDS if name in requested)
+
+
+@lru_cache(maxsize=None)
+def post_projection(fields: Tuple[str, ...]) -> TypeAdapter:
+    """필드셋별 응답 모델을 생성해 List 직렬화기로 캐시"""
+    model = create_model(
+        f"PostResponse_{'_'.join(fields)}",
+        __config__=FROZEN_CONFIG,
+        **{name: (PostResponse.model_fields[name].annotation, ...) for name in fields},
+    )
+    return TypeAdapter(List[model])
+
+
+def dump_post_projection(rows, fields: Tuple[str, ...]) -> bytes:
+    """조회 행(dict 또는 속성 객체)을 필드셋 응답 JSON 으로 직렬화"""
+    adapter = post_projection(fields)
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+
+# GET /posts?ids= 응답 직렬화기 (요청 순서, 없는 id 는 null)
+posts_or_null = TypeAdapter(List[Optional[PostResponse]])
+
+
+def dump_posts_or_null(rows) -> bytes:
+    """요청 순서로 정렬된 조회 행(없으면 None)을 PostResponse | null 목록 JSON 으로 직렬화"""
+    return posts_or_null.dump_json(posts_or_null.validate_python(rows, from_attributes=True))
\ No newline at end of file
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, TypeAdapter
+from typing import List, Optional
 from .frozen_config import FROZEN_CONFIG
+from .post import PostResponse
 
 
 # User Request Models
@@ -22,10 +23,36 @@ class UserResponse(BaseModel):
     email: str
 
 
+class UserWithPostCountResponse(UserResponse):
+    post_count: int  # users.post_count (비정규화 카운터)
+
+
+# 컬럼 행 직렬화 필드 순서 (COMPACT_RESPONSES)
+USER_WITH_POST_COUNT_FIELDS = tuple(UserWithPostCountResponse.model_fields)
+
+
 class UserWithPostsResponse(BaseModel):
     model_config = FROZEN_CONFIG
 
     id: int
     name: str
     email: str
-    posts: List[PostResponse] = [] 
\ No newline at end of file
+    posts: List[PostResponse] = []
+
+
+# GET /users?include=recent_posts 응답 직렬화기
+users_with_posts = TypeAdapter(List[UserWithPostsResponse])
+
+
+def dump_users_with_posts(rows) -> bytes:
+    """조회 행(dict 또는 속성 객체, posts 포함)을 UserWithPostsResponse 목록 JSON 으로 직렬화"""
+    return users_with_posts.dump_json(users_with_posts.validate_python(rows, from_attributes=True))
+
+
+# GET /users?ids= 응답 직렬화기 (요청 순서, 없는 id 는 null)
+users_or_null = TypeAdapter(List[Optional[UserResponse]])
+
+
+def dump_users_or_null(rows) -> bytes:
+    """요청 순서로 정렬된 조회 행(없으면 None)을 UserResponse | null 목록 JSON 으로 직렬화"""
+    return users_or_null.dump_json(users_or_null.validate_python(rows, from_attributes=True))
\ No newline at end of file
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List
+from sqlalchemy import select, update, func, cast, tuple_, any_, bindparam, Integer
+from sqlalchemy.dialects.postgresql import ARRAY, REAL
+from typing import List, Optional, Tuple
 
+from ..database import AsyncSessionLocal
 from ..models import User, Post
-from ..schemas import PostCreate, PostResponse
+from ..schemas import PostCreate, PostResponse, PostSearchHit, PostSearchPage, POST_FIELDS
+from .user_service import user_posts_versions
+from ...common.batch import unique_ids, in_request_order
+from ...common.compact import dump_rows
+from ...common.cursor import encode_cursor, decode_cursor
+from ...common.invalidation import CACHE_NOTIFY_ENABLED, CACHE_NOTIFY_CHANNEL, POSTS, notify_payload
+from ...common.search import SEARCH_CONFIG
+from ...common.swr import list_cache
+
+# 게시글 목록 페이지 캐시 (LIST_CACHE_ENABLED=1 일 때만, 키: (skip, limit))
+posts_pages = list_cache()
 
 
 class PostService:
@@ -13,10 +25,14 @@ class PostService:
     
     async def create_post(self, post_data: PostCreate, db: AsyncSession) -> PostResponse:
         """게시글 생성"""
-        # User 존재 확인
-        result = await db.execute(select(User).where(User.id == post_data.user_id))
-        user = result.scalar_one_or_none()
-        if not user:
+        # 작성자 post_count 증가 (User 존재 확인 겸용, 게시글 INSERT 와 같은 트랜잭션에서 커밋)
+        result = await db.execute(
+            update(User)
+            .where(User.id == post_data.user_id)
+            .values(post_count=User.post_count + 1)
+            .returning(User.id)
+        )
+        if result.scalar_one_or_none() is None:
             raise ValueError("User not found")
         
         db_post = Post(
@@ -25,8 +41,13 @@ class PostService:
             user_id=post_data.user_id
         )
         db.add(db_post)
+        if CACHE_NOTIFY_ENABLED:
+            # 같은 트랜잭션에서 알림 (커밋될 때만 다른 워커/호스트에 전달)
+            await db.execute(select(func.pg_notify(CACHE_NOTIFY_CHANNEL, notify_payload(POSTS, post_data.user_id))))
+        # id 는 INSERT ... RETURNING 으로 채워지고 expire_on_commit=False 이므로 refresh 하지 않음
+        # (id 만으로 다시 조회하면 user_id 해시 파티션 테이블에서는 모든 파티션을 읽게 됨)
         await db.commit()
-        await db.refresh(db_post)
+        user_posts_versions.bump(post_data.user_id)
         return db_post
     
     async def get_posts(self, skip: int, limit: int, db: AsyncSession) -> List[PostResponse]:
@@ -36,6 +57,64 @@ class PostService:
         )
         posts = result.scalars().all()
         return list(posts)
+    
+    async def get_posts_cached(self, skip: int, limit: int) -> bytes:
+        """게시글 목록 JSON (stale-while-revalidate 캐시, 만료 시 DB 조회는 키당 1회)"""
+        return await posts_pages.get_or_load((skip, limit), lambda: self._load_posts_page(skip, limit))
+    
+    async def _load_posts_page(self, skip: int, limit: int) -> bytes:
+        # 백그라운드 갱신은 요청 세션이 닫힌 뒤에도 실행되므로 별도 세션 사용
+        async with AsyncSessionLocal() as db:
+            rows = await self.get_posts_projection(skip, limit, POST_FIELDS, db)
+        return dump_rows(rows, POST_FIELDS)
+    
+    async def get_posts_by_ids(self, post_ids: List[int], db: AsyncSession) -> List[Optional[PostResponse]]:
+        """id 목록으로 게시글 조회 (id = ANY(배열) 1회, 요청 순서로 반환하고 없는 id 는 None)"""
+        result = await db.execute(
+            select(Post).where(Post.id == any_(bindparam("post_ids", unique_ids(post_ids), type_=ARRAY(Integer))))
+        )
+        return in_request_order(post_ids, result.scalars().all())
+    
+    async def get_posts_projection(
+        self, 
+        skip: int, 
+        limit: int, 
+        fields: Tuple[str, ...], 
+        db: AsyncSession
+    ) -> list:
+        """게시글 목록 조회 (요청한 컬럼만 SELECT)"""
+        columns = [getattr(Post, name) for name in fields]
+        result = await db.execute(
+            select(*columns).offset(skip).limit(limit).order_by(Post.id.desc())
+        )
+        return list(result.all())
+    
+    async def search_posts(
+        self, 
+        q: str, 
+        limit: int, 
+        cursor: Optional[str], 
+        db: AsyncSession
+    ) -> PostSearchPage:
+        """게시글 전문 검색 (ts_rank 내림차순, (rank, id) keyset 페이지네이션)"""
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        rank = func.ts_rank(Post.search_vector, query)
+        stmt = (
+            select(Post.id, Post.title, Post.content, Post.user_id, rank.label("rank"))
+            .where(Post.search_vector.bool_op("@@")(query))
+            .order_by(rank.desc(), Post.id.desc())
+            .limit(limit + 1)  # 다음 페이지 존재 여부 확인용 1건 추가
+        )
+        if cursor is not None:
+            after_rank, after_id = decode_cursor(cursor, (float, int))
+            # ts_rank 는 real 이므로 같은 타입으로 비교해야 경계 행이 정확히 제외됨
+            stmt = stmt.where(tuple_(rank, Post.id) < tuple_(cast(after_rank, REAL), after_id))
+        
+        result = await db.execute(stmt)
+        rows = result.all()
+        items = [PostSearchHit.model_validate(row, from_attributes=True) for row in rows[:limit]]
+        next_cursor = encode_cursor(rows[limit - 1].rank, rows[limit - 1].id) if len(rows) > limit else None
+        return PostSearchPage(items=items, next_cursor=next_cursor)
 
 
 # 싱글톤 인스턴스
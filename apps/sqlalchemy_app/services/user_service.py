@@ -1,53 +1,196 @@
 from __future__ import annotations
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
-from typing import List, Optional
+from sqlalchemy import select, func, or_, true, any_, bindparam, Integer
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from typing import List, Optional, Tuple
 
+from ..database import AsyncSessionLocal
 from ..models import User, Post
-from ..schemas import UserCreate, UserResponse, PostResponse
+from ..schemas import UserCreate, UserResponse, UserWithPostCountResponse, USER_WITH_POST_COUNT_FIELDS, PostResponse
+from ...common.batch import unique_ids, in_request_order
+from ...common.compact import dump_rows
+from ...common.etag import VersionCache
+from ...common.invalidation import CACHE_NOTIFY_ENABLED, CACHE_NOTIFY_CHANNEL, USERS, notify_payload
+from ...common.shared_cache import NOT_FOUND, shared_cache
+from ...common.search import escape_like
+from ...common.swr import list_cache
+
+# ETag 버전 캐시 (워커 단위)
+user_versions = VersionCache(ttl_ms=None)  # 사용자는 수정/삭제되지 않으므로 만료 없음
+user_posts_versions = VersionCache()  # 사용자별 게시글 수 (게시글은 추가만 되므로 버전으로 사용)
+
+# 워커 간 공유 사용자 캐시 (SHARED_CACHE_ENABLED=1 일 때만, 아니면 None)
+shared_users = shared_cache("users_sqlalchemy")
+
+# 사용자 목록 페이지 캐시 (LIST_CACHE_ENABLED=1 일 때만, 키: (skip, limit))
+users_pages = list_cache()
 
 
 class UserService:
     """User 관련 비즈니스 로직"""
     
     async def create_user(self, user_data: UserCreate, db: AsyncSession) -> UserResponse:
-        """사용자 생성"""
-        try:
-            db_user = User(name=user_data.name, email=user_data.email)
-            db.add(db_user)
-            await db.commit()
-            await db.refresh(db_user)
-            return db_user
-        except IntegrityError:
-            await db.rollback()
+        """사용자 생성 (INSERT ... ON CONFLICT (email) DO NOTHING RETURNING)"""
+        result = await db.execute(
+            insert(User)
+            .values(name=user_data.name, email=user_data.email)
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User.id, User.name, User.email)
+        )
+        row = result.first()
+        if row is None:
+            # 중복 이메일은 실패한 INSERT + 롤백 + IntegrityError 대신 빈 RETURNING 으로 판단
+            # (변경 없는 트랜잭션은 세션 종료 시 정리됨)
             raise ValueError("Email already exists")
+        if CACHE_NOTIFY_ENABLED:
+            # 같은 트랜잭션에서 알림 (커밋될 때만 다른 워커/호스트에 전달)
+            await db.execute(select(func.pg_notify(CACHE_NOTIFY_CHANNEL, notify_payload(USERS, row.id))))
+        await db.commit()
+        # 이 id 를 "없음" 으로 캐시한 워커가 있을 수 있으므로 공유 캐시에서 제거 (모든 워커에 반영)
+        if shared_users is not None:
+            shared_users.invalidate(row.id)
+        return UserResponse(id=row.id, name=row.name, email=row.email)
     
-    async def get_users(self, skip: int, limit: int, db: AsyncSession) -> List[UserResponse]:
-        """사용자 목록 조회"""
+    async def get_users(self, skip: int, limit: int, db: AsyncSession) -> List[UserWithPostCountResponse]:
+        """사용자 목록 조회 (post_count 포함)"""
         result = await db.execute(
             select(User).offset(skip).limit(limit).order_by(User.id)
         )
         users = result.scalars().all()
         return list(users)
     
+    async def get_users_rows(self, skip: int, limit: int, db: AsyncSession) -> list:
+        """사용자 목록 조회 (post_count 포함, 컬럼만 SELECT 해 ORM 인스턴스/identity map 없이 Row 로 반환)"""
+        columns = [getattr(User, name) for name in USER_WITH_POST_COUNT_FIELDS]
+        result = await db.execute(
+            select(*columns).offset(skip).limit(limit).order_by(User.id)
+        )
+        return list(result.all())
+    
+    async def get_users_cached(self, skip: int, limit: int) -> bytes:
+        """사용자 목록 JSON (stale-while-revalidate 캐시, 만료 시 DB 조회는 키당 1회)"""
+        return await users_pages.get_or_load((skip, limit), lambda: self._load_users_page(skip, limit))
+    
+    async def _load_users_page(self, skip: int, limit: int) -> bytes:
+        # 백그라운드 갱신은 요청 세션이 닫힌 뒤에도 실행되므로 별도 세션 사용
+        async with AsyncSessionLocal() as db:
+            rows = await self.get_users_rows(skip, limit, db)
+        return dump_rows(rows, USER_WITH_POST_COUNT_FIELDS)
+    
+    async def get_users_with_recent_posts(
+        self, 
+        skip: int, 
+        limit: int, 
+        per_user: int, 
+        db: AsyncSession
+    ) -> List[dict]:
+        """사용자 목록 + 사용자별 최근 게시글 (사용자 페이지 LEFT JOIN LATERAL 1회 조회)"""
+        users_page = (
+            select(User.id, User.name, User.email)
+            .order_by(User.id)
+            .offset(skip)
+            .limit(limit)
+            .subquery("users_page")
+        )
+        # 사용자마다 user_id 인덱스로 최근 per_user 건만 읽음
+        recent_posts = (
+            select(Post.id, Post.title, Post.content)
+            .where(Post.user_id == users_page.c.id)
+            .order_by(Post.id.desc())
+            .limit(per_user)
+            .lateral("recent_posts")
+        )
+        result = await db.execute(
+            select(
+                users_page,
+                recent_posts.c.id.label("post_id"),
+                recent_posts.c.title,
+                recent_posts.c.content,
+            )
+            .select_from(users_page.outerjoin(recent_posts, true()))
+            .order_by(users_page.c.id, recent_posts.c.id.desc())
+        )
+        
+        users = {}
+        for row in result:
+            user = users.setdefault(row.id, {"id": row.id, "name": row.name, "email": row.email, "posts": []})
+            if row.post_id is not None:
+                user["posts"].append(
+                    {"id": row.post_id, "title": row.title, "content": row.content, "user_id": row.id}
+                )
+        return list(users.values())
+    
+    async def lookup_users(self, q: str, limit: int, db: AsyncSession) -> list:
+        """이름/이메일 부분 일치 조회 (pg_trgm 인덱스, 정확한 이메일이면 unique 인덱스로 단건 조회)"""
+        columns = (User.id, User.name, User.email)
+        if "@" in q:
+            result = await db.execute(select(*columns).where(User.email == q))
+            exact = result.first()
+            if exact:
+                return [exact]
+        
+        pattern = escape_like(q)
+        result = await db.execute(
+            select(*columns)
+            .where(or_(User.name.ilike(f"%{pattern}%"), User.email.ilike(f"%{pattern}%")))
+            # 접두 일치 우선, 그다음 id 순
+            .order_by(or_(User.name.ilike(f"{pattern}%"), User.email.ilike(f"{pattern}%")).desc(), User.id)
+            .limit(limit)
+        )
+        return list(result.all())
+    
     async def get_user(self, user_id: int, db: AsyncSession) -> Optional[UserResponse]:
-        """단일 사용자 조회"""
-        result = await db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
+        """단일 사용자 조회 (공유 캐시가 있으면 캐시 우선, 없는 사용자도 짧게 캐시)"""
+        if shared_users is not None:
+            cached = shared_users.get(user_id)
+            if cached == NOT_FOUND:
+                return None
+            if cached is not None:
+                user_versions.set(user_id, 0)
+                return UserResponse.model_validate_json(cached)
+        
+        users = await self.get_users_by_ids([user_id], db)
+        user = users[0]
+        if shared_users is not None:
+            shared_users.set(user_id, NOT_FOUND if user is None else UserResponse.model_validate(user, from_attributes=True).model_dump_json().encode())
+        return user
+    
+    async def get_users_by_ids(self, user_ids: List[int], db: AsyncSession) -> List[Optional[UserResponse]]:
+        """id 목록으로 사용자 조회 (id = ANY(배열) 1회, 요청 순서로 반환하고 없는 id 는 None)"""
+        # 배열 파라미터 1개로 바인딩해 id 개수와 관계없이 같은 prepared statement 를 재사용
+        result = await db.execute(
+            select(User).where(User.id == any_(bindparam("user_ids", unique_ids(user_ids), type_=ARRAY(Integer))))
+        )
+        users = result.scalars().all()
+        for user in users:
+            user_versions.set(user.id, 0)
+        return in_request_order(user_ids, users)
+    
+    async def get_user_posts_version(self, user_id: int, db: AsyncSession) -> Optional[int]:
+        """사용자 게시글 버전 (게시글 수, 사용자가 없으면 None)"""
+        version = user_posts_versions.get(user_id)
+        if version is not None:
+            return version
+        
+        result = await db.execute(select(User.post_count).where(User.id == user_id))
+        version = result.scalar_one_or_none()
+        if version is not None:
+            user_posts_versions.set(user_id, version)
+        return version
     
     async def get_user_posts(
         self, 
         user_id: int, 
         skip: int, 
         limit: int, 
-        db: AsyncSession
+        db: AsyncSession,
+        *,
+        check_user: bool = True
     ) -> List[PostResponse]:
         """사용자의 게시글 조회"""
-        # User 존재 확인
-        user = await self.get_user(user_id, db)
-        if not user:
+        # User 존재 확인 (버전 조회로 이미 확인한 호출자는 check_user=False 로 생략)
+        if check_user and not await self.get_user(user_id, db):
             raise ValueError("User not found")
         
         # Posts 조회
@@ -60,6 +203,31 @@ class UserService:
         )
         posts = result.scalars().all()
         return list(posts)
+    
+    async def get_user_posts_projection(
+        self, 
+        user_id: int, 
+        skip: int, 
+        limit: int, 
+        fields: Tuple[str, ...], 
+        db: AsyncSession,
+        *,
+        check_user: bool = True
+    ) -> list:
+        """사용자의 게시글 조회 (요청한 컬럼만 SELECT)"""
+        # User 존재 확인 (버전 조회로 이미 확인한 호출자는 check_user=False 로 생략)
+        if check_user and not await self.get_user(user_id, db):
+            raise ValueError("User not found")
+        
+        columns = [getattr(Post, name) for name in fields]
+        result = await db.execute(
+            select(*columns)
+            .where(Post.user_id == user_id)
+            .offset(skip)
+            .limit(limit)
+            .order_by(Post.id)
+        )
+        return list(result.all())
 
 
 # 싱글톤 인스턴스
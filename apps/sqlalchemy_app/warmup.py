@@ -0,0 +1,44 @@
+"""워커 시작 시 커넥션 풀 예열 (WARMUP_ENABLED=1 일 때 startup 에서 실행)
+
+POOL_SIZE 개 커넥션을 동시에 열고, 커넥션마다 서비스의 자주 쓰는 조회를 1회씩 실행해
+asyncpg prepared statement 캐시와 타입 코덱(JSON, int[] 등)을 채운다.
+쓰기(create_user / create_post)는 데이터를 만들지 않도록 예열하지 않는다 (첫 호출 시 prepare).
+"""
+from __future__ import annotations
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .database import engine, POOL_SIZE
+from .schemas import POST_FIELDS
+from .services.user_service import user_service
+from .services.post_service import post_service
+from ..common.warmup import warm_up
+
+# 존재하지 않는 id 로 조회 (결과는 비어도 문장 prepare 와 코덱 초기화는 동일)
+_MISSING_ID = 0
+
+HOT_READS = (
+    lambda db: user_service.get_users(0, 10, db),
+    lambda db: user_service.get_users_rows(0, 10, db),
+    lambda db: user_service.get_users_by_ids([_MISSING_ID], db),
+    lambda db: user_service.get_user_posts_version(_MISSING_ID, db),
+    lambda db: post_service.get_posts(0, 10, db),
+    lambda db: post_service.get_posts_projection(0, 10, POST_FIELDS, db),
+    lambda db: post_service.get_posts_by_ids([_MISSING_ID], db),
+)
+
+
+async def _warm_connection(barrier: asyncio.Barrier) -> int:
+    async with engine.connect() as conn:
+        async with AsyncSession(bind=conn) as db:
+            for read in HOT_READS:
+                await read(db)
+        # 모든 예열이 커넥션을 잡을 때까지 반환하지 않아 풀이 서로 다른 커넥션을 열게 함
+        await barrier.wait()
+    return len(HOT_READS)
+
+
+async def warm_up_pool() -> None:
+    await warm_up(_warm_connection, POOL_SIZE)
@@ -4,6 +4,14 @@ from fastapi import FastAPI
 
 from .database import init_tortoise, close_tortoise
 from .apis import health, users, posts
+from ..common.compression import CompressionMiddleware, COMPRESSION_ENABLED
+from ..common.concurrency import AdaptiveConcurrencyMiddleware, CONCURRENCY_LIMIT_ENABLED
+from ..common.idempotency import IdempotencyMiddleware, IDEMPOTENCY_ENABLED
+from ..common.invalidation import CACHE_NOTIFY_ENABLED
+from ..common.loop_monitor import LoopMonitorMiddleware, LOOP_MONITOR_ENABLED
+from ..common.profiling import ProfilingMiddleware, PROFILING_ENABLED
+from ..common.timeouts import CancelOnDisconnectMiddleware, CANCEL_ON_DISCONNECT
+from ..common.warmup import WARMUP_ENABLED
 
 # FastAPI app
 app = FastAPI(title="Tortoise ORM Performance Test")
@@ -13,15 +21,58 @@ app.include_router(health.router)
 app.include_router(users.router)
 app.include_router(posts.router)
 
+# 샘플링 프로파일러 /debug/profile?seconds=N (PROFILING_ENABLED=1 일 때만)
+# 요청을 처리하는 태스크를 기록해야 하므로 가장 안쪽 미들웨어로 등록
+if PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+# POST /users, /posts 의 Idempotency-Key 재시도를 저장된 응답으로 처리 (IDEMPOTENCY_ENABLED=1 일 때만)
+# 압축 전 본문을 저장하도록 압축 안쪽에 등록
+if IDEMPOTENCY_ENABLED:
+    app.add_middleware(IdempotencyMiddleware)
+
+# 응답 압축 (COMPRESSION_ENABLED=1 일 때만)
+if COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# 클라이언트 연결 종료 시 진행 중인 DB 호출 취소 (CANCEL_ON_DISCONNECT=1 일 때만)
+if CANCEL_ON_DISCONNECT:
+    app.add_middleware(CancelOnDisconnectMiddleware)
+
+# 적응형 동시성 제한 (CONCURRENCY_LIMIT_ENABLED=1 일 때만)
+if CONCURRENCY_LIMIT_ENABLED:
+    app.add_middleware(AdaptiveConcurrencyMiddleware)
+
+# 이벤트 루프 lag 히스토그램 + 블로킹 호출 스택 /metrics/loop (LOOP_MONITOR_ENABLED=1 일 때만)
+# 동시성 제한에 걸리지 않도록 가장 바깥쪽에 등록
+if LOOP_MONITOR_ENABLED:
+    app.add_middleware(LoopMonitorMiddleware)
+
 
 
 @app.on_event("startup")
 async def startup():
     """앱 시작 시 Tortoise ORM 초기화"""
     await init_tortoise()
+    
+    # 다른 워커/호스트의 쓰기 알림으로 워커 캐시 무효화 (CACHE_NOTIFY_ENABLED=1 일 때만)
+    if CACHE_NOTIFY_ENABLED:
+        from .invalidation import listener
+
+        listener.start()
+
+    # 풀 커넥션을 미리 열고 자주 쓰는 조회를 실행 (WARMUP_ENABLED=1 일 때만, 끝나야 요청을 받기 시작)
+    if WARMUP_ENABLED:
+        from .warmup import warm_up_pool
+
+        await warm_up_pool()
 
 
 @app.on_event("shutdown")
 async def shutdown():
     """앱 종료 시 Tortoise ORM 정리"""
+    if CACHE_NOTIFY_ENABLED:
+        from .invalidation import listener
+
+        await listener.stop()
     await close_tortoise() 
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""Tortoise ORM 스키마 마이그레이션
+
+워커마다 startup 에서 generate_schemas 를 실행하지 않도록 배포 시 1회만 실행한다.
+
+    $ python -m apps.tortoise_app.migrate
+"""
+from __future__ import annotations
+
+import asyncio
+
+from .database import init_tortoise, close_tortoise
+
+
+async def main() -> None:
+    await init_tortoise(generate_schemas=True)
+    await close_tortoise()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
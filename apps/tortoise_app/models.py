@@ -8,6 +8,8 @@ class User(Model):
     id = fields.IntField(pk=True)
     name = fields.CharField(max_length=100, index=True)
     email = fields.CharField(max_length=255, unique=True, index=True)
+    # 게시글 수 (create_post 트랜잭션에서 증가, reconcile 로 보정)
+    post_count = fields.IntField(default=0)
     
     # Reverse foreign key
     posts: fields.ReverseRelation[Post]
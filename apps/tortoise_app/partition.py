@@ -0,0 +1,134 @@
+"""posts 테이블을 파티션 테이블로 변환 (opt-in)
+
+1. posts_partitioned 생성 (hash: user_id / range: id) 후 id 구간별로 복사 (구간마다 짧은 트랜잭션)
+2. 기존 보조 인덱스를 같은 정의로 새 테이블에 생성 (새 테이블은 아직 사용되지 않으므로 잠금 경합 없음)
+3. posts 를 ACCESS EXCLUSIVE 로 잠그고 복사 이후 들어온 행을 옮긴 뒤 이름 교체
+   (기존 테이블은 posts_unpartitioned 로 남으므로 확인 후 직접 DROP)
+
+교체 후에는 워커를 재시작해 prepared statement 를 새 테이블 기준으로 다시 만든다.
+range 파티션은 id 가 미리 만든 구간을 넘기 전에 --extend 로 추가한다 (cron 등).
+
+    $ python -m apps.tortoise_app.partition --strategy hash --partitions 16
+    $ python -m apps.tortoise_app.partition --strategy range --range-size 1000000
+    $ python -m apps.tortoise_app.partition --extend
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from tortoise import Tortoise
+from tortoise.transactions import in_transaction
+
+from .database import init_tortoise, close_tortoise
+from ..common.partitioning import (
+    ALL_INDEXES_SQL,
+    IS_PARTITIONED_SQL,
+    PARTITION_COPY_BATCH_SIZE,
+    PARTITION_STRATEGIES,
+    PARTITIONED_POSTS_TABLE,
+    PARTITIONS_SQL,
+    POSTS_HASH_PARTITIONS,
+    POSTS_PARTITIONING,
+    POSTS_RANGE_AHEAD,
+    POSTS_RANGE_SIZE,
+    SECONDARY_INDEXES_SQL,
+    SERIAL_SEQUENCE_SQL,
+    UNPARTITIONED_POSTS_TABLE,
+    copy_index_ddl,
+    copy_posts_sql,
+    create_partitioned_posts_ddl,
+    range_partitions_ddl,
+    swap_tables_ddl,
+)
+
+
+async def fetch_value(sql: str):
+    connection = Tortoise.get_connection("default")
+    rows = await connection.execute_query_dict(sql)
+    return next(iter(rows[0].values()))
+
+
+async def partition_posts(
+    strategy: str = POSTS_PARTITIONING,
+    partitions: int = POSTS_HASH_PARTITIONS,
+    range_size: int = POSTS_RANGE_SIZE,
+    batch_size: int = PARTITION_COPY_BATCH_SIZE,
+) -> int:
+    """posts 를 파티션 테이블로 교체하고 복사한 최대 id 를 반환"""
+    target = PARTITIONED_POSTS_TABLE
+    if await fetch_value(IS_PARTITIONED_SQL.format(table="posts")):
+        raise ValueError("posts is already partitioned")
+    sequence = await fetch_value(SERIAL_SEQUENCE_SQL.format(table="posts"))
+    max_id = await fetch_value("SELECT coalesce(max(id), 0) FROM posts")
+    connection = Tortoise.get_connection("default")
+    indexes = await connection.execute_query_dict(SECONDARY_INDEXES_SQL.format(table="posts"))
+
+    # 이전 실행이 중간에 실패했으면 새 테이블부터 다시 만듦
+    async with in_transaction() as conn:
+        await conn.execute_script(f"DROP TABLE IF EXISTS {target}")
+        for statement in create_partitioned_posts_ddl(target, strategy, sequence, max_id, partitions, range_size):
+            await conn.execute_script(statement)
+
+    for low in range(0, max_id, batch_size):
+        async with in_transaction() as conn:
+            await conn.execute_script(copy_posts_sql("posts", target, low, low + batch_size))
+
+    new_indexes = [(f"{target}_pkey", "posts_pkey")]
+    async with in_transaction() as conn:
+        for index in indexes:
+            temp_name, ddl = copy_index_ddl(index["name"], index["definition"], "posts", target)
+            await conn.execute_script(ddl)
+            new_indexes.append((temp_name, index["name"]))
+
+    async with in_transaction() as conn:
+        # 교체가 끝날 때까지 쓰기/읽기 모두 대기 (복사 이후 커밋된 행만 옮기므로 짧음)
+        await conn.execute_script("LOCK TABLE posts IN ACCESS EXCLUSIVE MODE")
+        # 복사 시작 전에 id 를 받았지만 늦게 커밋된 행까지 포함하도록 마지막 구간부터 다시 복사
+        await conn.execute_script(copy_posts_sql("posts", target, max(0, max_id - batch_size), 2**31 - 1))
+        old_indexes = [row["name"] for row in await conn.execute_query_dict(ALL_INDEXES_SQL.format(table="posts"))]
+        new_partitions = [row["name"] for row in await conn.execute_query_dict(PARTITIONS_SQL.format(table=target))]
+        for statement in swap_tables_ddl(
+            "posts", target, UNPARTITIONED_POSTS_TABLE, sequence, old_indexes, new_indexes, new_partitions
+        ):
+            await conn.execute_script(statement)
+
+    await connection.execute_script("ANALYZE posts")
+    return max_id
+
+
+async def extend_range_partitions(range_size: int = POSTS_RANGE_SIZE, ahead: int = POSTS_RANGE_AHEAD) -> int:
+    """range 파티션을 현재 최대 id 이후 ahead 구간까지 추가하고 생성 DDL 수를 반환"""
+    max_id = await fetch_value("SELECT coalesce(max(id), 0) FROM posts")
+    statements = range_partitions_ddl("posts", max_id, range_size, ahead)
+    async with in_transaction() as conn:
+        for statement in statements:
+            await conn.execute_script(statement)
+    return len(statements)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--strategy", choices=PARTITION_STRATEGIES, default=POSTS_PARTITIONING)
+    parser.add_argument("--partitions", type=int, default=POSTS_HASH_PARTITIONS, help="hash 파티션 수")
+    parser.add_argument("--range-size", type=int, default=POSTS_RANGE_SIZE, help="range 파티션 1개당 id 수")
+    parser.add_argument("--batch", type=int, default=PARTITION_COPY_BATCH_SIZE, help="복사 트랜잭션 1회당 id 수")
+    parser.add_argument("--extend", action="store_true", help="range 파티션만 추가")
+    args = parser.parse_args()
+
+    await init_tortoise(generate_schemas=False)
+    try:
+        if args.extend:
+            count = await extend_range_partitions(args.range_size)
+            print(f"range partitions ensured: {count}")
+        else:
+            max_id = await partition_posts(args.strategy, args.partitions, args.range_size, args.batch)
+            print(f"posts partitioned by {args.strategy} (copied up to id {max_id}, old table: {UNPARTITIONED_POSTS_TABLE})")
+    except ValueError as e:
+        print(e)
+    finally:
+        await close_tortoise()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+"""users.post_count 보정 (실제 게시글 수와 다른 행만 갱신)
+
+카운터는 create_post 트랜잭션에서 증가하지만, 직접 SQL 로 넣은 데이터나 컬럼 추가 직후에는 어긋날 수 있다.
+id 구간별로 사용자 행을 잠근 뒤 다시 세므로 동시에 실행 중인 create_post 와 경합해도 값이 틀어지지 않는다.
+
+    $ python -m apps.tortoise_app.reconcile
+"""
+from __future__ import annotations
+
+import asyncio
+
+from tortoise import Tortoise
+from tortoise.transactions import in_transaction
+
+from .database import init_tortoise, close_tortoise
+from ..common.counters import RECONCILE_BATCH_SIZE
+
+LOCK_USERS_SQL = "SELECT id FROM users WHERE id > $1 AND id <= $2 FOR UPDATE"
+RECONCILE_SQL = """
+UPDATE users u
+SET post_count = c.actual
+FROM (
+    SELECT u2.id, count(p.id) AS actual
+    FROM users u2 LEFT JOIN posts p ON p.user_id = u2.id
+    WHERE u2.id > $1 AND u2.id <= $2
+    GROUP BY u2.id
+) c
+WHERE u.id = c.id AND u.post_count <> c.actual
+RETURNING u.id
+"""
+
+
+async def reconcile_post_counts(batch_size: int = RECONCILE_BATCH_SIZE) -> int:
+    """어긋난 post_count 를 고치고 수정한 사용자 수를 반환"""
+    connection = Tortoise.get_connection("default")
+    _, rows = await connection.execute_query("SELECT coalesce(max(id), 0) AS max_id FROM users")
+    max_id = rows[0]["max_id"]
+
+    fixed = 0
+    for low in range(0, max_id, batch_size):
+        values = [low, low + batch_size]
+        # 구간마다 짧은 트랜잭션 (잠금 유지 시간 제한)
+        async with in_transaction() as conn:
+            await conn.execute_query(LOCK_USERS_SQL, values)
+            count, _ = await conn.execute_query(RECONCILE_SQL, values)  # RETURNING 행 수 = 수정한 사용자 수
+            fixed += count
+    return fixed
+
+
+async def main() -> None:
+    await init_tortoise(generate_schemas=False)
+    fixed = await reconcile_post_counts()
+    print(f"post_count reconciled: {fixed} users fixed")
+    await close_tortoise()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 from .frozen_config import FROZEN_CONFIG
-from .user import UserCreate, UserResponse, UserWithPostsResponse
-from .post import PostCreate, PostResponse
+from .user import UserCreate, UserResponse, UserRow, UserWithPostCountRow, UserWithPostCountResponse, UserWithPostsResponse, dump_users_with_posts, dump_users_or_null
+from .post import PostCreate, PostResponse, PostSearchHit, PostSearchPage, PostRow, POST_FIELDS, parse_post_fields, dump_post_projection, dump_posts_or_null
 
 __all__ = [
     "FROZEN_CONFIG",
     "UserCreate",
     "UserResponse",
-    "UserWithPostsResponse", 
+    "UserRow",
+    "UserWithPostCountRow",
+    "UserWithPostCountResponse",
+    "UserWithPostsResponse",
+    "dump_users_with_posts",
+    "dump_users_or_null", 
     "PostCreate",
     "PostResponse",
+    "PostSearchHit",
+    "PostSearchPage",
+    "PostRow",
+    "POST_FIELDS",
+    "parse_post_fields",
+    "dump_post_projection",
+    "dump_posts_or_null",
 ] 
\ No newline at end of file
@@ -1,9 +1,40 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Tuple
+
+from pydantic import TypeAdapter
+from tortoise import Tortoise
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
 
 from ..models import User, Post
-from ..schemas import PostCreate, PostResponse
+from ..schemas import PostCreate, PostResponse, PostRow, PostSearchHit, PostSearchPage
+from .user_service import user_posts_versions
+from ...common.batch import unique_ids, in_request_order
+from ...common.cursor import encode_cursor, decode_cursor
+from ...common.invalidation import CACHE_NOTIFY_ENABLED, CACHE_NOTIFY_CHANNEL, NOTIFY_SQL, POSTS, notify_payload
+from ...common.search import SEARCH_CONFIG
+from ...common.swr import list_cache
+
+# .values() 행 리스트 -> JSON 직렬화기
+posts_json = TypeAdapter(List[PostRow])
+
+# 게시글 목록 페이지 캐시 (LIST_CACHE_ENABLED=1 일 때만, 키: (skip, limit))
+posts_pages = list_cache()
+
+# id 배치 조회 (id 개수와 관계없이 같은 문장이 되도록 배열 파라미터 1개로 바인딩)
+POSTS_BY_IDS_SQL = "SELECT id, title, content, user_id FROM posts WHERE id = ANY($1::int[])"
+
+# 전문 검색 (search_vector 는 모델에 없는 생성 컬럼이므로 raw SQL 사용)
+SEARCH_POSTS_SQL = f"""
+SELECT id, title, content, user_id, ts_rank(search_vector, query) AS rank
+FROM posts, websearch_to_tsquery('{SEARCH_CONFIG}', $1) AS query
+WHERE search_vector @@ query {{keyset}}
+ORDER BY rank DESC, id DESC
+LIMIT $2
+"""
+# ts_rank 는 real 이므로 같은 타입으로 비교해야 경계 행이 정확히 제외됨
+SEARCH_KEYSET_SQL = "AND (ts_rank(search_vector, query), id) < ($3::real, $4)"
 
 
 class PostService:
@@ -11,16 +42,21 @@ class PostService:
     
     async def create_post(self, post_data: PostCreate) -> PostResponse:
         """게시글 생성"""
-        # User 존재 확인
-        user = await User.get_or_none(id=post_data.user_id)
-        if not user:
-            raise ValueError("User not found")
-        
-        db_post = await Post.create(
-            title=post_data.title,
-            content=post_data.content,
-            user_id=post_data.user_id
-        )
+        async with in_transaction() as connection:
+            # 작성자 post_count 증가 (User 존재 확인 겸용, 게시글 INSERT 와 같은 트랜잭션에서 커밋)
+            updated = await User.filter(id=post_data.user_id).update(post_count=F("post_count") + 1)
+            if not updated:
+                raise ValueError("User not found")
+            
+            db_post = await Post.create(
+                title=post_data.title,
+                content=post_data.content,
+                user_id=post_data.user_id
+            )
+            if CACHE_NOTIFY_ENABLED:
+                # 같은 트랜잭션에서 알림 (커밋될 때만 다른 워커/호스트에 전달)
+                await connection.execute_query(NOTIFY_SQL, [CACHE_NOTIFY_CHANNEL, notify_payload(POSTS, post_data.user_id)])
+        user_posts_versions.bump(post_data.user_id)
         
         return PostResponse(
             id=db_post.id,
@@ -29,17 +65,45 @@ class PostService:
             user_id=db_post.user_id
         )
     
-    async def get_posts(self, skip: int, limit: int) -> List[PostResponse]:
-        """게시글 목록 조회"""
-        posts = await Post.all().offset(skip).limit(limit).order_by("-id")
-        return [
-            PostResponse(
-                id=post.id,
-                title=post.title,
-                content=post.content,
-                user_id=post.user_id
-            ) for post in posts
-        ]
+    async def get_posts(self, skip: int, limit: int) -> bytes:
+        """게시글 목록 조회 (필요한 컬럼만 .values() 로 조회해 모델 인스턴스 없이 JSON 직렬화)"""
+        posts = await (
+            Post.all()
+            .offset(skip)
+            .limit(limit)
+            .order_by("-id")
+            .values("id", "title", "content", "user_id")
+        )
+        return posts_json.dump_json(posts)
+    
+    async def get_posts_cached(self, skip: int, limit: int) -> bytes:
+        """게시글 목록 JSON (stale-while-revalidate 캐시, 만료 시 DB 조회는 키당 1회)"""
+        return await posts_pages.get_or_load((skip, limit), lambda: self.get_posts(skip, limit))
+    
+    async def get_posts_by_ids(self, post_ids: List[int]) -> List[Optional[dict]]:
+        """id 목록으로 게시글 조회 (id = ANY(배열) 1회, 요청 순서로 반환하고 없는 id 는 None)"""
+        connection = Tortoise.get_connection("default")
+        rows = await connection.execute_query_dict(POSTS_BY_IDS_SQL, [unique_ids(post_ids)])
+        return in_request_order(post_ids, rows, key=lambda row: row["id"])
+    
+    async def get_posts_projection(self, skip: int, limit: int, fields: Tuple[str, ...]) -> List[dict]:
+        """게시글 목록 조회 (요청한 컬럼만 .values() 로 조회)"""
+        return await Post.all().offset(skip).limit(limit).order_by("-id").values(*fields)
+    
+    async def search_posts(self, q: str, limit: int, cursor: Optional[str]) -> PostSearchPage:
+        """게시글 전문 검색 (ts_rank 내림차순, (rank, id) keyset 페이지네이션)"""
+        # 다음 페이지 존재 여부 확인용 1건 추가
+        values = [q, limit + 1]
+        keyset = ""
+        if cursor is not None:
+            values.extend(decode_cursor(cursor, (float, int)))
+            keyset = SEARCH_KEYSET_SQL
+        
+        connection = Tortoise.get_connection("default")
+        rows = await connection.execute_query_dict(SEARCH_POSTS_SQL.format(keyset=keyset), values)
+        items = [PostSearchHit(**row) for row in rows[:limit]]
+        next_cursor = encode_cursor(rows[limit - 1]["rank"], rows[limit - 1]["id"]) if len(rows) > limit else None
+        return PostSearchPage(items=items, next_cursor=next_cursor)
 
 
 # 싱글톤 인스턴스
@@ -1,63 +1,186 @@
 from __future__ import annotations
 
-from tortoise.exceptions import IntegrityError
-from typing import List, Optional
+from pydantic import TypeAdapter
+from tortoise import Tortoise
+from typing import List, Optional, Tuple
 
 from ..models import User, Post
-from ..schemas import UserCreate, UserResponse, PostResponse
+from ..schemas import UserCreate, UserResponse, UserRow, UserWithPostCountRow, PostResponse
+from ...common.batch import unique_ids, in_request_order
+from ...common.etag import VersionCache
+from ...common.invalidation import CACHE_NOTIFY_ENABLED, CACHE_NOTIFY_CHANNEL, NOTIFY_SQL, USERS, notify_payload
+from ...common.shared_cache import NOT_FOUND, shared_cache
+from ...common.search import escape_like
+from ...common.swr import list_cache
+
+# .values() 행 리스트 -> JSON 직렬화기
+users_json = TypeAdapter(List[UserRow])
+users_with_count_json = TypeAdapter(List[UserWithPostCountRow])
+
+# 사용자 생성 (중복 이메일은 예외 대신 빈 결과, post_count 는 모델 기본값이라 DB 기본값이 없을 수 있어 명시)
+CREATE_USER_SQL = """
+INSERT INTO users (name, email, post_count)
+VALUES ($1, $2, 0)
+ON CONFLICT (email) DO NOTHING
+RETURNING id
+"""
+
+# 사용자별 최근 게시글 (Prefetch 의 queryset limit 은 사용자별이 아닌 전체에 적용되므로 LATERAL 조인 raw SQL)
+RECENT_POSTS_SQL = """
+SELECT p.id, p.title, p.content, p.user_id
+FROM unnest($1::int[]) AS u(id)
+CROSS JOIN LATERAL (
+    SELECT id, title, content, user_id
+    FROM posts
+    WHERE user_id = u.id
+    ORDER BY id DESC
+    LIMIT $2
+) p
+ORDER BY p.user_id, p.id DESC
+"""
+
+# id 배치 조회 (filter(id__in=...) 는 id 개수마다 다른 IN ($1, $2, ...) 문장이 되므로 배열 파라미터 1개로 바인딩)
+USERS_BY_IDS_SQL = "SELECT id, name, email FROM users WHERE id = ANY($1::int[])"
+
+# 부분 일치 조회 (Tortoise 의 icontains 는 UPPER(CAST(...)) LIKE 로 변환되어 trigram 인덱스를 쓰지 못하므로 raw SQL)
+LOOKUP_USERS_SQL = """
+SELECT id, name, email
+FROM users
+WHERE name ILIKE $1 OR email ILIKE $1
+ORDER BY (name ILIKE $2 OR email ILIKE $2) DESC, id
+LIMIT $3
+"""
+
+# ETag 버전 캐시 (워커 단위)
+user_versions = VersionCache(ttl_ms=None)  # 사용자는 수정/삭제되지 않으므로 만료 없음
+user_posts_versions = VersionCache()  # 사용자별 게시글 수 (게시글은 추가만 되므로 버전으로 사용)
+
+# 워커 간 공유 사용자 캐시 (SHARED_CACHE_ENABLED=1 일 때만, 아니면 None)
+shared_users = shared_cache("users_tortoise")
+
+# 사용자 목록 페이지 캐시 (LIST_CACHE_ENABLED=1 일 때만, 키: (skip, limit))
+users_pages = list_cache()
 
 
 class UserService:
     """User 관련 비즈니스 로직"""
     
     async def create_user(self, user_data: UserCreate) -> UserResponse:
-        """사용자 생성"""
-        try:
-            db_user = await User.create(
-                name=user_data.name, 
-                email=user_data.email
-            )
-            return UserResponse(
-                id=db_user.id,
-                name=db_user.name,
-                email=db_user.email
-            )
-        except IntegrityError:
+        """사용자 생성 (INSERT ... ON CONFLICT (email) DO NOTHING RETURNING)"""
+        connection = Tortoise.get_connection("default")
+        rows = await connection.execute_query_dict(CREATE_USER_SQL, [user_data.name, user_data.email])
+        if not rows:
+            # 중복 이메일은 실패한 INSERT + IntegrityError 대신 빈 RETURNING 으로 판단
             raise ValueError("Email already exists")
+        user_id = rows[0]["id"]
+        if CACHE_NOTIFY_ENABLED:
+            # INSERT 는 autocommit 이므로 커밋된 뒤 별도 문장으로 알림 (다른 워커/호스트의 캐시 무효화)
+            await connection.execute_query(NOTIFY_SQL, [CACHE_NOTIFY_CHANNEL, notify_payload(USERS, user_id)])
+        # 이 id 를 "없음" 으로 캐시한 워커가 있을 수 있으므로 공유 캐시에서 제거 (모든 워커에 반영)
+        if shared_users is not None:
+            shared_users.invalidate(user_id)
+        return UserResponse(
+            id=user_id,
+            name=user_data.name,
+            email=user_data.email
+        )
     
-    async def get_users(self, skip: int, limit: int) -> List[UserResponse]:
-        """사용자 목록 조회"""
-        users = await User.all().offset(skip).limit(limit).order_by("id")
-        return [
-            UserResponse(
-                id=user.id,
-                name=user.name,
-                email=user.email
-            ) for user in users
-        ]
+    async def get_users(self, skip: int, limit: int) -> bytes:
+        """사용자 목록 조회 (post_count 포함, 필요한 컬럼만 .values() 로 조회해 모델 인스턴스 없이 JSON 직렬화)"""
+        users = await (
+            User.all()
+            .offset(skip)
+            .limit(limit)
+            .order_by("id")
+            .values("id", "name", "email", "post_count")
+        )
+        return users_with_count_json.dump_json(users)
+    
+    async def get_users_cached(self, skip: int, limit: int) -> bytes:
+        """사용자 목록 JSON (stale-while-revalidate 캐시, 만료 시 DB 조회는 키당 1회)"""
+        return await users_pages.get_or_load((skip, limit), lambda: self.get_users(skip, limit))
+    
+    async def get_users_with_recent_posts(self, skip: int, limit: int, per_user: int) -> List[dict]:
+        """사용자 목록 + 사용자별 최근 게시글 (사용자 페이지 1회 + 게시글 LATERAL 1회, N+1 없음)"""
+        users = await (
+            User.all()
+            .offset(skip)
+            .limit(limit)
+            .order_by("id")
+            .values("id", "name", "email")
+        )
+        if not users:
+            return []
+        
+        by_id = {user["id"]: {**user, "posts": []} for user in users}
+        connection = Tortoise.get_connection("default")
+        posts = await connection.execute_query_dict(RECENT_POSTS_SQL, [list(by_id), per_user])
+        for post in posts:
+            by_id[post["user_id"]]["posts"].append(post)
+        return list(by_id.values())
+    
+    async def lookup_users(self, q: str, limit: int) -> bytes:
+        """이름/이메일 부분 일치 조회 (pg_trgm 인덱스, 정확한 이메일이면 unique 인덱스로 단건 조회)"""
+        if "@" in q:
+            exact = await User.filter(email=q).values("id", "name", "email")
+            if exact:
+                return users_json.dump_json(exact)
+        
+        pattern = escape_like(q)
+        connection = Tortoise.get_connection("default")
+        # 접두 일치 우선, 그다음 id 순
+        users = await connection.execute_query_dict(LOOKUP_USERS_SQL, [f"%{pattern}%", f"{pattern}%", limit])
+        return users_json.dump_json(users)
     
     async def get_user(self, user_id: int) -> Optional[UserResponse]:
-        """단일 사용자 조회"""
-        user = await User.get_or_none(id=user_id)
-        if not user:
-            return None
+        """단일 사용자 조회 (공유 캐시가 있으면 캐시 우선, 없는 사용자도 짧게 캐시)"""
+        if shared_users is not None:
+            cached = shared_users.get(user_id)
+            if cached == NOT_FOUND:
+                return None
+            if cached is not None:
+                user_versions.set(user_id, 0)
+                return UserResponse.model_validate_json(cached)
         
-        return UserResponse(
-            id=user.id,
-            name=user.name,
-            email=user.email
-        )
+        users = await self.get_users_by_ids([user_id])
+        user = users[0]
+        if shared_users is not None:
+            shared_users.set(user_id, NOT_FOUND if user is None else user.model_dump_json().encode())
+        return user
+    
+    async def get_users_by_ids(self, user_ids: List[int]) -> List[Optional[UserResponse]]:
+        """id 목록으로 사용자 조회 (id = ANY(배열) 1회, 요청 순서로 반환하고 없는 id 는 None)"""
+        connection = Tortoise.get_connection("default")
+        rows = await connection.execute_query_dict(USERS_BY_IDS_SQL, [unique_ids(user_ids)])
+        
+        users = [UserResponse(id=row["id"], name=row["name"], email=row["email"]) for row in rows]
+        for user in users:
+            user_versions.set(user.id, 0)
+        return in_request_order(user_ids, users)
+    
+    async def get_user_posts_version(self, user_id: int) -> Optional[int]:
+        """사용자 게시글 버전 (게시글 수, 사용자가 없으면 None)"""
+        version = user_posts_versions.get(user_id)
+        if version is not None:
+            return version
+        
+        counts = await User.filter(id=user_id).values_list("post_count", flat=True)
+        if not counts:
+            return None
+        user_posts_versions.set(user_id, counts[0])
+        return counts[0]
     
     async def get_user_posts(
         self, 
         user_id: int, 
         skip: int, 
-        limit: int
+        limit: int,
+        *,
+        check_user: bool = True
     ) -> List[PostResponse]:
         """사용자의 게시글 조회"""
-        # User 존재 확인
-        user = await User.get_or_none(id=user_id)
-        if not user:
+        # User 존재 확인 (버전 조회로 이미 확인한 호출자는 check_user=False 로 생략)
+        if check_user and not await User.exists(id=user_id):
             raise ValueError("User not found")
         
         # Posts 조회
@@ -70,6 +193,28 @@ class UserService:
                 user_id=post.user_id
             ) for post in posts
         ]
+    
+    async def get_user_posts_projection(
+        self, 
+        user_id: int, 
+        skip: int, 
+        limit: int, 
+        fields: Tuple[str, ...],
+        *,
+        check_user: bool = True
+    ) -> List[dict]:
+        """사용자의 게시글 조회 (요청한 컬럼만 .values() 로 조회)"""
+        # User 존재 확인 (버전 조회로 이미 확인한 호출자는 check_user=False 로 생략)
+        if check_user and not await User.exists(id=user_id):
+            raise ValueError("User not found")
+        
+        return await (
+            Post.filter(user_id=user_id)
+            .offset(skip)
+            .limit(limit)
+            .order_by("id")
+            .values(*fields)
+        )
 
 
 # 싱글톤 인스턴스
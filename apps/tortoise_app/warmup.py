@@ -0,0 +1,52 @@
+"""워커 시작 시 커넥션 풀 예열 (WARMUP_ENABLED=1 일 때 startup 에서 실행)
+
+maxsize 개 커넥션을 동시에 열고, 커넥션마다 서비스의 자주 쓰는 조회를 1회씩 실행해
+asyncpg prepared statement 캐시(문장 텍스트 기준)와 타입 코덱(int[] 등)을 채운다.
+ORM 조회는 LIMIT/OFFSET 이 SQL 에 값으로 들어가므로 기본 페이지(skip=0, limit=10) 문장만 예열된다.
+쓰기(create_user / create_post)는 데이터를 만들지 않도록 예열하지 않는다 (첫 호출 시 prepare).
+"""
+from __future__ import annotations
+
+import asyncio
+
+from tortoise import Tortoise
+
+from .database import TORTOISE_ORM
+from .models import User, Post
+from .services.user_service import USERS_BY_IDS_SQL, RECENT_POSTS_SQL
+from .services.post_service import POSTS_BY_IDS_SQL
+from ..common.warmup import warm_up
+
+POOL_SIZE = TORTOISE_ORM["connections"]["default"]["credentials"]["maxsize"]
+
+# 존재하지 않는 id 로 조회 (결과는 비어도 문장 prepare 와 코덱 초기화는 동일)
+_MISSING_IDS = [0]
+
+
+def _hot_reads() -> list[tuple[str, list]]:
+    """(SQL, 파라미터) 목록. ORM 쿼리는 실행 시와 같은 SQL 텍스트를 만들어 사용"""
+    return [
+        (USERS_BY_IDS_SQL, [_MISSING_IDS]),
+        (POSTS_BY_IDS_SQL, [_MISSING_IDS]),
+        (RECENT_POSTS_SQL, [_MISSING_IDS, 3]),
+        (User.all().offset(0).limit(10).order_by("id").values("id", "name", "email", "post_count").sql(), []),
+        (Post.all().offset(0).limit(10).order_by("-id").values("id", "title", "content", "user_id").sql(), []),
+    ]
+
+
+async def warm_up_pool() -> None:
+    client = Tortoise.get_connection("default")
+    # 풀은 첫 사용 시 만들어지므로 동시에 여러 번 만들지 않도록 먼저 1회 연결
+    async with client.acquire_connection():
+        pass
+    hot_reads = _hot_reads()
+
+    async def warm_connection(barrier: asyncio.Barrier) -> int:
+        async with client.acquire_connection() as connection:
+            for sql, values in hot_reads:
+                await connection.fetch(sql, *values)
+            # 모든 예열이 커넥션을 잡을 때까지 반환하지 않아 풀이 서로 다른 커넥션을 열게 함
+            await barrier.wait()
+        return len(hot_reads)
+
+    await warm_up(warm_connection, POOL_SIZE)
@@ -0,0 +1,62 @@
+"""포기된 요청 이후 커넥션 풀 점유율 회복 측정
+
+클라이언트 타임아웃을 짧게 두고 동시 요청을 보낸 뒤 바로 연결을 끊고,
+/ready 의 pool.in_use 가 0 으로 돌아올 때까지 걸린 시간을 잰다.
+CANCEL_ON_DISCONNECT=1 로 띄운 서버와 기본 서버를 비교하면 취소 효과를 확인할 수 있다.
+
+    $ python scripts/bench_abandoned_requests.py http://localhost:8001 --path "/posts?limit=100"
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+
+async def abandon(client: httpx.AsyncClient, path: str, timeout: float) -> bool:
+    """요청 후 timeout 내 응답이 없으면 연결을 끊음 (포기했으면 True)"""
+    try:
+        await client.get(path, timeout=timeout)
+        return False
+    except httpx.TimeoutException:
+        return True
+
+
+async def pool_in_use(client: httpx.AsyncClient) -> int:
+    response = await client.get("/ready", timeout=2)
+    return response.json()["pool"]["in_use"]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("host")
+    parser.add_argument("--path", default="/posts?limit=100")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--client-timeout", type=float, default=0.005, help="클라이언트가 포기하기까지의 시간 (초)")
+    parser.add_argument("--wait", type=float, default=10.0, help="회복 대기 최대 시간 (초)")
+    args = parser.parse_args()
+
+    async with httpx.AsyncClient(base_url=args.host, limits=httpx.Limits(max_connections=None)) as client:
+        results = await asyncio.gather(
+            *(abandon(client, args.path, args.client_timeout) for _ in range(args.concurrency))
+        )
+        abandoned_at = time.perf_counter()
+        print(f"abandoned: {sum(results)}/{args.concurrency}")
+
+    async with httpx.AsyncClient(base_url=args.host) as monitor:
+        peak = 0
+        while time.perf_counter() - abandoned_at < args.wait:
+            in_use = await pool_in_use(monitor)
+            peak = max(peak, in_use)
+            if in_use == 0:
+                elapsed = (time.perf_counter() - abandoned_at) * 1000
+                print(f"pool recovered in {elapsed:.1f}ms (peak in_use after abandon: {peak})")
+                return
+            await asyncio.sleep(0.01)
+        print(f"pool not recovered within {args.wait}s (peak in_use: {peak})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+"""응답 압축 인코딩/레벨 비교
+
+limit=100 게시글 목록과 같은 JSON 페이로드를 인코딩·레벨별로 압축해 다음을 보고한다.
+- cpu ms: 응답 1건 압축에 드는 CPU 시간 (이벤트 루프가 막히는 시간)
+- ratio / bytes: 압축률과 전송 크기
+- xfer ms: --bandwidth-mbps 기준 전송 시간
+- total ms: cpu + xfer (클라이언트 체감 지연시간 추정)
+- max rps/core: 압축만으로 CPU 한 코어가 포화되는 응답 수
+
+    $ PYTHONPATH=. python scripts/bench_compression.py                              # 합성 페이로드
+    $ PYTHONPATH=. python scripts/bench_compression.py --url "http://localhost:8001/posts?limit=100" --bandwidth-mbps 50
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+import urllib.request
+
+from apps.common.compression import CODECS, codec_level
+
+
+def synthetic_payload(rows: int, content_size: int) -> bytes:
+    return json.dumps([
+        {"id": i, "title": f"Post {i}", "content": f"This is test content {i} " * (content_size // 24), "user_id": i % 50}
+        for i in range(rows)
+    ]).encode()
+
+
+def fetch_payload(url: str) -> bytes:
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "identity"})
+    with urllib.request.urlopen(request) as response:
+        return response.read()
+
+
+def measure(codec_cls, level: int, payload: bytes, repeat: int) -> tuple[float, int]:
+    """(median CPU 초, 압축 크기)"""
+    samples = []
+    size = 0
+    for _ in range(repeat):
+        started = time.thread_time()
+        compressed = codec_cls(level).finish(payload)
+        samples.append(time.thread_time() - started)
+        size = len(compressed)
+    return statistics.median(samples), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="압축할 응답을 가져올 URL (없으면 합성 페이로드)")
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--content-size", type=int, default=500)
+    parser.add_argument("--bandwidth-mbps", type=float, default=100.0)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    payload = fetch_payload(args.url) if args.url else synthetic_payload(args.rows, args.content_size)
+    bytes_per_ms = args.bandwidth_mbps * 1_000_000 / 8 / 1000
+
+    print(f"payload={len(payload)} bytes  bandwidth={args.bandwidth_mbps} Mbps  encodings={','.join(CODECS)}")
+    print(f"{'encoding':<10}{'level':>6}{'cpu ms':>10}{'bytes':>10}{'ratio':>8}{'xfer ms':>10}{'total ms':>10}{'max rps/core':>14}")
+    print(f"{'identity':<10}{'-':>6}{0:>10.3f}{len(payload):>10}{1:>8.3f}{len(payload) / bytes_per_ms:>10.3f}"
+          f"{len(payload) / bytes_per_ms:>10.3f}{'-':>14}")
+    for name, codec_cls in CODECS.items():
+        low, high = codec_cls.level_range
+        levels = sorted({codec_level(codec_cls, level) for level in (low, codec_cls.default_level, (low + high) // 2, high)})
+        for level in levels:
+            cpu, size = measure(codec_cls, level, payload, args.repeat)
+            xfer = size / bytes_per_ms
+            max_rps = f"{1 / cpu:.0f}" if cpu else "-"
+            print(f"{name:<10}{level:>6}{cpu * 1000:>10.3f}{size:>10}{size / len(payload):>8.3f}{xfer:>10.3f}"
+                  f"{cpu * 1000 + xfer:>10.3f}{max_rps:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""EdgeDB 응답 경로 비교: 객체 디코딩 + Pydantic 직렬화 vs JSON passthrough
+
+엔드포인트별로 서비스 호출부터 응답 바이트 생성까지의 시간을 측정한다.
+- objects: 생성된 dataclass 디코딩 -> PostResponse/UserResponse -> JSON (FastAPI 기본 경로와 동일)
+- json: query_json / query_single_json 결과 문자열을 그대로 사용
+
+    $ PYTHONPATH=. python scripts/bench_edgedb_json.py --iterations 1000 --limit 100
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Optional
+
+from pydantic import TypeAdapter
+
+from apps.edgedb_app.database import get_edgedb_client, close_edgedb_client
+from apps.edgedb_app.schemas import PostResponse, UserResponse
+from apps.edgedb_app.services.post_service import post_service
+from apps.edgedb_app.services.user_service import user_service
+
+users_adapter = TypeAdapter(List[UserResponse])
+user_adapter = TypeAdapter(Optional[UserResponse])
+posts_adapter = TypeAdapter(List[PostResponse])
+
+
+async def measure(func, iterations: int) -> tuple[float, float, int]:
+    """(평균 ms, p95 ms, 응답 바이트)"""
+    samples = []
+    body = b""
+    for _ in range(iterations):
+        started = time.perf_counter()
+        body = await func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.mean(samples), statistics.quantiles(samples, n=20)[-1], len(body)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    client = await get_edgedb_client()
+    user_id = await client.query_single("SELECT (SELECT User FILTER EXISTS .posts LIMIT 1).id")
+    if user_id is None:
+        raise SystemExit("seed some users and posts first")
+    limit = args.limit
+
+    endpoints = {
+        "get_users": (
+            lambda: _objects(users_adapter, user_service.get_users(limit=limit)),
+            lambda: _json(user_service.get_users_json(limit=limit)),
+        ),
+        "get_user": (
+            lambda: _objects(user_adapter, user_service.get_user(user_id)),
+            lambda: _json(user_service.get_user_json(user_id)),
+        ),
+        "get_posts": (
+            lambda: _objects(posts_adapter, post_service.get_posts(limit=limit)),
+            lambda: _json(post_service.get_posts_json(limit=limit)),
+        ),
+        "get_user_posts": (
+            lambda: _objects(posts_adapter, user_service.get_user_posts(user_id, limit=limit)),
+            lambda: _json(user_service.get_user_posts_json(user_id, limit=limit)),
+        ),
+    }
+
+    print(f"{'endpoint':<16}{'path':<9}{'avg ms':>10}{'p95 ms':>10}{'bytes':>10}")
+    for name, (objects_path, json_path) in endpoints.items():
+        for label, func in (("objects", objects_path), ("json", json_path)):
+            avg, p95, size = await measure(func, args.iterations)
+            print(f"{name:<16}{label:<9}{avg:>10.3f}{p95:>10.3f}{size:>10}")
+
+    await close_edgedb_client()
+
+
+async def _objects(adapter: TypeAdapter, coro) -> bytes:
+    return adapter.dump_json(await coro)
+
+
+async def _json(coro) -> bytes:
+    return (await coro).encode()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
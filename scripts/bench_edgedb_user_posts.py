@@ -0,0 +1,80 @@
+"""EdgeDB get_user_posts: 기존 2-쿼리 경로 vs 단일 쿼리 비교
+
+기존 경로는 게시글이 없으면 사용자 존재 확인을 위해 get_user 를 한 번 더 호출했다.
+게시글이 있는 사용자 / 없는 사용자 / 없는 ID 각각에 대해 평균, p95 지연시간을 측정한다.
+
+    $ PYTHONPATH=. python scripts/bench_edgedb_user_posts.py --iterations 2000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from apps.edgedb_app.database import get_edgedb_client, close_edgedb_client
+from apps.edgedb_app.queries.user_queries import get_user_posts
+
+# 기존 쿼리 (비교용)
+LEGACY_USER_POSTS = """\
+SELECT User {
+    id,
+    posts: {
+        id,
+        title,
+        content
+    } ORDER BY .id OFFSET <int64>$skip LIMIT <int64>$limit
+}
+FILTER .id = <uuid>$user_id;\
+"""
+LEGACY_GET_USER = "SELECT User { id, name, email } FILTER .id = <uuid>$user_id;"
+
+
+async def legacy_path(client, user_id: uuid.UUID) -> bool:
+    result = await client.query_single(LEGACY_USER_POSTS, user_id=user_id, skip=0, limit=10)
+    posts = [str(post.id) for post in result.posts] if result else []
+    if not posts:
+        return await client.query_single(LEGACY_GET_USER, user_id=user_id) is not None
+    return True
+
+
+async def single_query_path(client, user_id: uuid.UUID) -> bool:
+    result = await get_user_posts(client, user_id=user_id, skip=0, limit=10)
+    return result.user_exists
+
+
+async def measure(func, client, user_id: uuid.UUID, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await func(client, user_id)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    client = await get_edgedb_client()
+    with_posts = await client.query_single("SELECT (SELECT User FILTER EXISTS .posts LIMIT 1).id")
+    without_posts = await client.query_single("SELECT (SELECT User FILTER NOT EXISTS .posts LIMIT 1).id")
+    cases = {"with posts": with_posts, "without posts": without_posts, "missing user": uuid.uuid4()}
+
+    print(f"{'case':<16}{'path':<14}{'avg ms':>10}{'p95 ms':>10}")
+    for case, user_id in cases.items():
+        if user_id is None:
+            print(f"{case:<16}(no matching user in database)")
+            continue
+        for name, func in (("two-query", legacy_path), ("single-query", single_query_path)):
+            samples = await measure(func, client, user_id, args.iterations)
+            p95 = statistics.quantiles(samples, n=20)[-1]
+            print(f"{case:<16}{name:<14}{statistics.mean(samples):>10.3f}{p95:>10.3f}")
+
+    await close_edgedb_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
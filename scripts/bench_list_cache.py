@@ -0,0 +1,141 @@
+"""목록 캐시: 캐시 없음 vs 단순 TTL vs stale-while-revalidate (부하 급증 시 DB QPS)
+
+GET /posts?skip=0&limit=10 같은 인기 페이지 1개를 --workers 개 워커(워커별 캐시)가 처리한다고 보고
+open-loop 로 요청을 보낸다. 기본 --base-rps 로 보내다가 --spike-at 초부터 --spike-seconds 동안 --spike-rps.
+DB 조회는 --db-ms 만큼 걸리고 워커마다 커넥션 --pool 개로 제한된다.
+- none: 요청마다 DB 조회
+- ttl: TTL 만료 시 그 순간 들어온 요청이 모두 DB 조회 (stampede)
+- swr: apps.common.swr.StaleWhileRevalidateCache (stale 응답 + 키당 갱신 1개 + 확률적 조기 갱신)
+
+DB qps 는 100ms 구간별 조회 수를 초당으로 환산한 값 (base/spike 구간 평균, 전체 최대).
+
+    $ PYTHONPATH=. python scripts/bench_list_cache.py --base-rps 200 --spike-rps 3000 --ttl-ms 1000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+from typing import Awaitable, Callable, Dict, Hashable
+
+from apps.common.swr import StaleWhileRevalidateCache
+
+MODES = ("none", "ttl", "swr")
+WINDOW = 0.1  # DB qps 집계 구간 (초)
+KEY = ("posts", 0, 10)
+
+
+class TTLCache:
+    """만료되면 그 순간의 모든 요청이 각자 다시 조회하는 단순 TTL 캐시"""
+
+    def __init__(self, ttl_ms: int) -> None:
+        self.ttl = ttl_ms / 1000
+        self.entries: Dict[Hashable, tuple[float, bytes]] = {}
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        value = await loader()
+        self.entries[key] = (time.monotonic() + self.ttl, value)
+        return value
+
+
+class FakeDB:
+    """워커별 커넥션 풀 + 고정 조회 시간, 구간별 조회 수 기록"""
+
+    def __init__(self, args: argparse.Namespace, started: float) -> None:
+        self.db_ms = args.db_ms
+        self.pools = [asyncio.Semaphore(args.pool) for _ in range(args.workers)]
+        self.started = started
+        self.queries: Counter = Counter()
+
+    def loader(self, worker: int) -> Callable[[], Awaitable[bytes]]:
+        async def query() -> bytes:
+            async with self.pools[worker]:
+                self.queries[int((time.monotonic() - self.started) / WINDOW)] += 1
+                await asyncio.sleep(self.db_ms / 1000)
+                return b"[]"
+        return query
+
+
+async def run(mode: str, args: argparse.Namespace) -> dict:
+    started = time.monotonic()
+    db = FakeDB(args, started)
+    if mode == "ttl":
+        caches = [TTLCache(args.ttl_ms) for _ in range(args.workers)]
+    elif mode == "swr":
+        caches = [
+            StaleWhileRevalidateCache(soft_ttl_ms=args.ttl_ms, hard_ttl_ms=args.hard_ttl_ms, beta=args.beta)
+            for _ in range(args.workers)
+        ]
+    else:
+        caches = None
+    latencies: list[float] = []
+
+    async def request(index: int) -> None:
+        worker = index % args.workers
+        begin = time.monotonic()
+        if caches is None:
+            await db.loader(worker)()
+        else:
+            await caches[worker].get_or_load(KEY, db.loader(worker))
+        latencies.append((time.monotonic() - begin) * 1000)
+
+    # 10ms 마다 해당 시점 rps 만큼 요청 시작 (응답을 기다리지 않는 open-loop)
+    tasks = []
+    sent = 0.0
+    tick = 0.01
+    for step in range(int(args.seconds / tick)):
+        now = step * tick
+        spiking = args.spike_at <= now < args.spike_at + args.spike_seconds
+        sent += (args.spike_rps if spiking else args.base_rps) * tick
+        while len(tasks) < int(sent):
+            tasks.append(asyncio.create_task(request(len(tasks))))
+        await asyncio.sleep(max(0.0, started + now + tick - time.monotonic()))
+    await asyncio.gather(*tasks)
+
+    windows = int(args.seconds / WINDOW)
+    qps = [db.queries[window] / WINDOW for window in range(windows)]
+    spike = range(int(args.spike_at / WINDOW), int((args.spike_at + args.spike_seconds) / WINDOW))
+    base = [qps[window] for window in range(windows) if window not in spike]
+    latencies.sort()
+    return {
+        "base_qps": statistics.mean(base) if base else 0.0,
+        "spike_qps": statistics.mean(qps[window] for window in spike),
+        "max_qps": max(qps),
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(len(latencies) * 0.99)],
+        "requests": len(latencies),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--pool", type=int, default=5, help="워커당 DB 커넥션 수")
+    parser.add_argument("--db-ms", type=float, default=20.0)
+    parser.add_argument("--base-rps", type=float, default=200)
+    parser.add_argument("--spike-rps", type=float, default=3000)
+    parser.add_argument("--spike-at", type=float, default=4.0)
+    parser.add_argument("--spike-seconds", type=float, default=3.0)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--ttl-ms", type=int, default=1000, help="ttl 의 TTL, swr 의 soft TTL")
+    parser.add_argument("--hard-ttl-ms", type=int, default=10000)
+    parser.add_argument("--beta", type=float, default=1.0)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    args = parser.parse_args()
+
+    print(f"workers={args.workers} pool={args.pool} db_ms={args.db_ms} base_rps={args.base_rps} "
+          f"spike_rps={args.spike_rps} ttl_ms={args.ttl_ms}")
+    print(f"{'mode':<6}{'requests':>10}{'base qps':>10}{'spike qps':>11}{'max qps':>9}{'p50 ms':>9}{'p99 ms':>9}")
+    for mode in args.modes:
+        result = await run(mode, args)
+        print(f"{mode:<6}{result['requests']:>10}{result['base_qps']:>10.1f}{result['spike_qps']:>11.1f}"
+              f"{result['max_qps']:>9.0f}{result['p50']:>9.2f}{result['p99']:>9.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,192 @@
+"""엔드포인트별 메모리 사용량: 기본 응답 vs COMPACT_RESPONSES
+
+앱/모드마다 별도 프로세스에서 (COMPACT_RESPONSES 는 import 시점에 읽음) ASGI 앱을 직접 호출하고
+tracemalloc 으로 측정한다. HTTP 클라이언트를 거치지 않으므로 측정값은 서버 쪽 할당만 포함한다.
+- peak/req: --concurrency 개 요청을 동시에 처리하는 동안 늘어난 최대 할당량 / 동시 요청 수
+- kept/req: 모든 요청이 끝나고 gc 후에도 남은 증가량 / 요청 수 (캐시, 누수 후보)
+- /row: 응답 행 수로 나눈 값 (ORM 인스턴스, 응답 모델, 조회 결과 객체가 행마다 만드는 비용)
+
+DB 는 떠 있고 데이터가 있어야 한다 (사용자 --limit 명 이상, 게시글이 있는 사용자 포함).
+
+    $ PYTHONPATH=. python scripts/bench_memory.py --concurrency 32 --rounds 20 --limit 100
+    $ PYTHONPATH=. python scripts/bench_memory.py sqlalchemy --modes default compact
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+APPS = {
+    "sqlalchemy": "apps.sqlalchemy_app.main",
+    "tortoise": "apps.tortoise_app.main",
+    "edgedb": "apps.edgedb_app.main",
+}
+# 모드별 환경 변수 (EdgeDB JSON passthrough 는 별도 모드로 비교)
+MODES = {
+    "default": {"COMPACT_RESPONSES": "0", "EDGEDB_JSON_PASSTHROUGH": "0"},
+    "compact": {"COMPACT_RESPONSES": "1", "EDGEDB_JSON_PASSTHROUGH": "0"},
+    "passthrough": {"COMPACT_RESPONSES": "0", "EDGEDB_JSON_PASSTHROUGH": "1"},
+}
+ENDPOINTS = (
+    "/users?limit={limit}",
+    "/posts?limit={limit}",
+    "/users/{user_id}/posts?limit={limit}",
+    "/users/{user_id}",
+)
+
+
+async def call(app, target: str) -> bytes:
+    """ASGI 앱에 GET 요청 1회 (응답 본문 반환)"""
+    path, _, query = target.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    requested = False
+    finished = asyncio.Event()
+    status = 0
+    body = []
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                finished.set()
+
+    await app(scope, receive, send)
+    if status != 200:
+        raise RuntimeError(f"GET {target} -> {status}")
+    return b"".join(body)
+
+
+async def measure_endpoint(app, target: str, args: argparse.Namespace) -> dict:
+    body = json.loads(await call(app, target))
+    rows = len(body) if isinstance(body, list) else 1
+    # prepared statement, 직렬화기, 버전 캐시 등 1회성 할당은 측정에서 제외
+    for _ in range(args.warmup):
+        await call(app, target)
+
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    peaks = []
+    for _ in range(args.rounds):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        await asyncio.gather(*(call(app, target) for _ in range(args.concurrency)))
+        peaks.append((tracemalloc.get_traced_memory()[1] - before) / args.concurrency)
+    gc.collect()
+    retained = (tracemalloc.get_traced_memory()[0] - baseline) / (args.rounds * args.concurrency)
+    tracemalloc.stop()
+
+    peak = sorted(peaks)[len(peaks) // 2]  # 라운드 중앙값
+    return {"rows": rows, "peak": peak, "retained": max(0.0, retained)}
+
+
+async def run_child(app_name: str, args: argparse.Namespace) -> list[dict]:
+    app = importlib.import_module(APPS[app_name]).app
+    async with app.router.lifespan_context(app):
+        users = json.loads(await call(app, f"/users?limit={args.limit}"))
+        # 게시글이 가장 많은 사용자 (사용자별 게시글 응답 행 수를 최대로)
+        user_id = max(users, key=lambda user: user["post_count"])["id"]
+        results = []
+        for template in ENDPOINTS:
+            target = template.format(limit=args.limit, user_id=user_id)
+            results.append({"endpoint": template.split("?")[0], **await measure_endpoint(app, target, args)})
+        return results
+
+
+def spawn(app_name: str, mode: str, args: argparse.Namespace) -> list[dict]:
+    proc = subprocess.run(
+        [
+            sys.executable, __file__, app_name, "--child",
+            "--concurrency", str(args.concurrency),
+            "--rounds", str(args.rounds),
+            "--warmup", str(args.warmup),
+            "--limit", str(args.limit),
+        ],
+        cwd=ROOT,
+        env={**os.environ, **MODES[mode], "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "child failed")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def kib(value: float) -> str:
+    return f"{value / 1024:.1f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("apps", nargs="*", help=f"측정할 앱 ({', '.join(APPS)}, 기본 전체)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=["default", "compact"])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    unknown = set(args.apps).difference(APPS)
+    if unknown:
+        parser.error(f"unknown apps: {', '.join(sorted(unknown))}")
+    args.apps = args.apps or list(APPS)
+
+    if args.child:
+        print(json.dumps(asyncio.run(run_child(args.apps[0], args))))
+        return
+
+    print(f"concurrency={args.concurrency} rounds={args.rounds} limit={args.limit} (KiB)")
+    print(f"{'app':<12}{'endpoint':<26}{'mode':<13}{'rows':>5}{'peak/req':>10}{'peak/row':>10}"
+          f"{'kept/req':>10}{'kept/row':>10}")
+    for app_name in args.apps:
+        for mode in args.modes:
+            if mode == "passthrough" and app_name != "edgedb":
+                continue
+            try:
+                results = spawn(app_name, mode, args)
+            except RuntimeError as e:
+                print(f"{app_name:<12}{'-':<26}{mode:<13} failed: {e}")
+                continue
+            for result in results:
+                rows = max(result["rows"], 1)
+                print(f"{app_name:<12}{result['endpoint']:<26}{mode:<13}{result['rows']:>5}"
+                      f"{kib(result['peak']):>10}{kib(result['peak'] / rows):>10}"
+                      f"{kib(result['retained']):>10}{kib(result['retained'] / rows):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""사용자 조회 캐시: 워커 간 공유 캐시(shared memory) vs 워커별 LRU
+
+--workers 개 프로세스가 gunicorn 워커처럼 요청을 나눠 받아 사용자 id 를 조회한다.
+- 조회 id 는 zipf 분포 (--skew), 캐시 미스는 DB 조회 비용 --db-ms 만큼 대기 후 채움
+- 공유 캐시는 JSON 을 저장하므로 적중 시 UserResponse 파싱 비용 포함, LRU 는 모델 객체를 그대로 보관
+- --create-ratio 만큼 사용자 생성 + 생성 직후 id 근처 조회: 다른 워커가 "없음" 으로 캐시한 id 를
+  생성 후에도 404 로 응답하면 stale (공유 캐시는 create 시 invalidate 가 모든 워커에 반영됨)
+
+비교 대상 (같은 호스트 메모리 기준)
+- shared: 슬롯 --slots 개를 모든 워커가 공유
+- lru: 워커마다 --slots / --workers 개 (공유 캐시와 같은 총 메모리)
+- lru-full: 워커마다 --slots 개 (총 메모리 --workers 배)
+
+    $ PYTHONPATH=. python scripts/bench_shared_cache.py --workers 4 --keys 100000 --slots 16384 --requests 50000
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import multiprocessing as mp
+import os
+import random
+import statistics
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from apps.common.shared_cache import NOT_FOUND, SharedCache
+from apps.sqlalchemy_app.schemas import UserResponse
+
+MODES = ("shared", "lru", "lru-full")
+
+
+class LRUCache:
+    """워커별 LRU (TTL 은 공유 캐시와 동일하게 적용)"""
+
+    def __init__(self, capacity: int, ttl: float, negative_ttl: float) -> None:
+        self.capacity = capacity
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.entries: OrderedDict[Hashable, tuple[float, Optional[UserResponse]]] = OrderedDict()
+
+    def get(self, key: Hashable):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.time():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return NOT_FOUND if value is None else value
+
+    def set(self, key: Hashable, value: Optional[UserResponse]) -> None:
+        ttl = self.negative_ttl if value is None else self.ttl
+        self.entries[key] = (time.time() + ttl, value)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        self.entries.pop(key, None)
+
+
+def load_user(user_id: int, next_id, db_ms: float) -> Optional[UserResponse]:
+    """DB 조회 흉내 (next_id 미만이면 존재)"""
+    time.sleep(db_ms / 1000)
+    if user_id >= next_id.value:
+        return None
+    return UserResponse(id=user_id, name=f"User {user_id}", email=f"user{user_id}@test.com")
+
+
+def worker(mode: str, index: int, args: argparse.Namespace, ids: list, cum_weights: list, next_id, barrier, results) -> None:
+    rng = random.Random(args.seed + index)
+    if mode == "shared":
+        cache = SharedCache(f"bench_{args.run}", slots=args.slots, slot_size=args.slot_size,
+                            ttl_ms=args.ttl_ms, negative_ttl_ms=args.negative_ttl_ms)
+    else:
+        capacity = args.slots if mode == "lru-full" else args.slots // args.workers
+        cache = LRUCache(capacity, args.ttl_ms / 1000, args.negative_ttl_ms / 1000)
+
+    hits = misses = stale = 0
+    samples = []
+    barrier.wait()
+    for _ in range(args.requests // args.workers):
+        if rng.random() < args.create_ratio:
+            # 사용자 생성 후 해당 id 무효화 (LRU 는 자기 워커만 무효화 가능)
+            with next_id.get_lock():
+                created = next_id.value
+                next_id.value += 1
+            cache.invalidate(created)
+            # 생성 직후 조회: 아직 없는 id 와 방금 생긴 id 가 섞임
+            user_id = next_id.value + rng.randint(-3, 3)
+        else:
+            user_id = rng.choices(ids, cum_weights=cum_weights)[0]
+
+        started = time.perf_counter()
+        cached = cache.get(user_id)
+        if cached is None:
+            misses += 1
+            user = load_user(user_id, next_id, args.db_ms)
+            if mode == "shared":
+                cache.set(user_id, NOT_FOUND if user is None else user.model_dump_json().encode())
+            else:
+                cache.set(user_id, user)
+        else:
+            hits += 1
+            if cached == NOT_FOUND:
+                user = None
+                if user_id < next_id.value:
+                    stale += 1
+            else:
+                user = UserResponse.model_validate_json(cached) if mode == "shared" else cached
+        samples.append((time.perf_counter() - started) * 1000)
+
+    if mode == "shared":
+        cache.close()
+    results.put((hits, misses, stale, samples))
+
+
+def run(mode: str, args: argparse.Namespace, ids: list, cum_weights: list) -> dict:
+    next_id = mp.Value("q", args.keys + 1)
+    barrier = mp.Barrier(args.workers)
+    results = mp.Queue()
+    shared = None
+    if mode == "shared":
+        shared = SharedCache(f"bench_{args.run}", slots=args.slots, slot_size=args.slot_size)
+        shared.buf  # 세그먼트 생성
+    processes = [
+        mp.Process(target=worker, args=(mode, index, args, ids, cum_weights, next_id, barrier, results))
+        for index in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    collected = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    if shared is not None:
+        shared.unlink()
+
+    hits = sum(result[0] for result in collected)
+    misses = sum(result[1] for result in collected)
+    stale = sum(result[2] for result in collected)
+    samples = sorted(itertools.chain.from_iterable(result[3] for result in collected))
+    return {
+        "hit_rate": hits / (hits + misses),
+        "p50": statistics.median(samples),
+        "p99": samples[int(len(samples) * 0.99)],
+        "stale": stale,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--skew", type=float, default=1.0, help="zipf 지수 (클수록 소수 사용자에 집중)")
+    parser.add_argument("--slots", type=int, default=16_384)
+    parser.add_argument("--slot-size", type=int, default=256)
+    parser.add_argument("--requests", type=int, default=50_000, help="전체 조회 수 (워커에 균등 분배)")
+    parser.add_argument("--db-ms", type=float, default=1.0)
+    parser.add_argument("--create-ratio", type=float, default=0.01)
+    parser.add_argument("--ttl-ms", type=int, default=60_000)
+    parser.add_argument("--negative-ttl-ms", type=int, default=1_000)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    args.run = os.getpid()
+
+    # 순위 -> id 를 섞어 인기 사용자가 특정 슬롯 구간에 몰리지 않도록
+    ids = list(range(1, args.keys + 1))
+    random.Random(args.seed).shuffle(ids)
+    cum_weights = list(itertools.accumulate(1 / rank ** args.skew for rank in range(1, args.keys + 1)))
+
+    print(f"workers={args.workers} keys={args.keys} skew={args.skew} slots={args.slots} "
+          f"requests={args.requests} db_ms={args.db_ms} create_ratio={args.create_ratio}")
+    print(f"{'mode':<10}{'entries/worker':>16}{'hit rate':>10}{'p50 ms':>9}{'p99 ms':>9}{'stale':>7}")
+    for mode in args.modes:
+        entries = {"shared": args.slots, "lru": args.slots // args.workers, "lru-full": args.slots}[mode]
+        result = run(mode, args, ids, cum_weights)
+        print(f"{mode:<10}{entries:>16}{result['hit_rate']:>10.1%}{result['p50']:>9.3f}"
+              f"{result['p99']:>9.3f}{result['stale']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""사용자 목록 + 최근 게시글: include=recent_posts 1회 요청 vs N+1 요청
+
+같은 페이지를 두 방식으로 가져와 지연시간과 DB 왕복(요청) 수를 비교한다.
+- include: GET /users?include=recent_posts&per_user=N (서버에서 조인 1회)
+- n+1: GET /users 후 사용자마다 GET /users/{id}/posts?limit=N (순차, 기존 클라이언트 방식)
+- n+1 gather: 사용자별 요청을 동시에 보냄 (동시성으로 지연은 줄지만 요청 수는 그대로)
+
+    $ python scripts/bench_user_recent_posts.py http://localhost:8001 --limit 50 --per-user 3 --iterations 20
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def fetch_include(client: httpx.AsyncClient, limit: int, per_user: int) -> int:
+    response = await client.get("/users", params={"include": "recent_posts", "limit": limit, "per_user": per_user})
+    response.raise_for_status()
+    return 1
+
+
+async def fetch_n_plus_one(client: httpx.AsyncClient, limit: int, per_user: int) -> int:
+    users = (await client.get("/users", params={"limit": limit})).json()
+    for user in users:
+        (await client.get(f"/users/{user['id']}/posts", params={"limit": per_user})).raise_for_status()
+    return 1 + len(users)
+
+
+async def fetch_n_plus_one_gather(client: httpx.AsyncClient, limit: int, per_user: int) -> int:
+    users = (await client.get("/users", params={"limit": limit})).json()
+    responses = await asyncio.gather(
+        *(client.get(f"/users/{user['id']}/posts", params={"limit": per_user}) for user in users)
+    )
+    for response in responses:
+        response.raise_for_status()
+    return 1 + len(users)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("host")
+    parser.add_argument("--limit", type=int, default=50, help="페이지당 사용자 수")
+    parser.add_argument("--per-user", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    variants = (
+        ("include", fetch_include),
+        ("n+1", fetch_n_plus_one),
+        ("n+1 gather", fetch_n_plus_one_gather),
+    )
+    async with httpx.AsyncClient(base_url=args.host, limits=httpx.Limits(max_connections=None)) as client:
+        print(f"limit={args.limit} per_user={args.per_user} iterations={args.iterations}")
+        print(f"{'variant':<12}{'avg ms':>10}{'p95 ms':>10}{'requests':>10}")
+        for name, fetch in variants:
+            await fetch(client, args.limit, args.per_user)  # 워밍업
+            samples = []
+            requests = 0
+            for _ in range(args.iterations):
+                started = time.perf_counter()
+                requests = await fetch(client, args.limit, args.per_user)
+                samples.append((time.perf_counter() - started) * 1000)
+            p95 = statistics.quantiles(samples, n=20)[-1] if len(samples) > 1 else samples[0]
+            print(f"{name:<12}{statistics.mean(samples):>10.2f}{p95:>10.2f}{requests:>10}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,130 @@
+"""워커 시작 직후 첫 요청 지연: 예열 없음(cold) vs WARMUP_ENABLED=1(warm)
+
+앱마다 uvicorn 을 WARMUP_ENABLED=0 / 1 로 새로 띄우고 /health 가 200 이 되자마자
+첫 --requests 개 요청을 --concurrency 개씩 동시에 보낸다 (풀 크기보다 크게 두면 모든 커넥션이 사용됨).
+- boot: 프로세스 시작 -> /health 200 (예열 시간 포함)
+- first: 첫 요청 하나만 보냈을 때의 지연 (새 커넥션 + prepare + 코덱 조회)
+- p50 / p99 / max: 이어서 보낸 첫 요청들의 지연
+DB 는 미리 띄워 두고 데이터가 있어야 한다 (scripts/start_servers.sh 와 같은 설정).
+
+    $ PYTHONPATH=. python scripts/bench_warmup.py
+    $ PYTHONPATH=. python scripts/bench_warmup.py sqlalchemy tortoise --rounds 5 --concurrency 20
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+
+APPS = {
+    "sqlalchemy": ("apps.sqlalchemy_app.main", 9001),
+    "tortoise": ("apps.tortoise_app.main", 9002),
+    "edgedb": ("apps.edgedb_app.main", 9003),
+}
+MODES = {"cold": "0", "warm": "1"}
+
+# 기본 요청 구성 (목록 조회 위주, limit 이 다르면 Tortoise 는 다른 SQL 이 됨)
+PATHS = ("/users", "/posts", "/users?limit=10", "/posts?limit=10", "/users?skip=10&limit=10", "/posts?limit=100")
+
+
+async def wait_healthy(client: httpx.AsyncClient, proc: subprocess.Popen, timeout: float) -> None:
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with code {proc.returncode}")
+        try:
+            if (await client.get("/health", timeout=1)).status_code == 200:
+                return
+        except httpx.TransportError:
+            await asyncio.sleep(0.01)
+    raise TimeoutError(f"/health not ready within {timeout}s")
+
+
+async def first_requests(client: httpx.AsyncClient, paths: list[str], concurrency: int) -> tuple[float, list[float]]:
+    """첫 요청 1개 지연, 이어지는 요청들의 지연 목록 (ms)"""
+
+    async def timed(path: str) -> float:
+        started = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        return (time.perf_counter() - started) * 1000
+
+    first = await timed(paths[0])
+    queue = iter(paths[1:])
+    samples: list[float] = []
+
+    async def worker() -> None:
+        for path in queue:
+            samples.append(await timed(path))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return first, sorted(samples)
+
+
+async def run(module: str, port: int, warmup: str, args: argparse.Namespace) -> dict:
+    env = {**os.environ, "WARMUP_ENABLED": warmup}
+    paths = [PATHS[index % len(PATHS)] for index in range(args.requests)]
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", f"{module}:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+        env=env,
+    )
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", limits=httpx.Limits(max_connections=None), timeout=10
+        ) as client:
+            await wait_healthy(client, proc, args.timeout)
+            boot = (time.perf_counter() - started) * 1000
+            first, samples = await first_requests(client, paths, args.concurrency)
+    finally:
+        proc.terminate()
+        proc.wait()
+    return {
+        "boot": boot,
+        "first": first,
+        "p50": statistics.median(samples),
+        "p99": samples[min(len(samples) - 1, int(len(samples) * 0.99))],
+        "max": samples[-1],
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("apps", nargs="*", help=f"측정할 앱 ({', '.join(APPS)}, 기본 전체)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=3, help="모드별 서버 재시작 횟수 (결과는 라운드 중앙값)")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+    unknown = set(args.apps).difference(APPS)
+    if unknown:
+        parser.error(f"unknown apps: {', '.join(sorted(unknown))}")
+
+    print(f"first {args.requests} requests, concurrency={args.concurrency}, rounds={args.rounds} (ms)")
+    print(f"{'app':<12}{'mode':<7}{'boot':>9}{'first':>9}{'p50':>9}{'p99':>9}{'max':>9}")
+    for app_name in args.apps or APPS:
+        module, port = APPS[app_name]
+        for mode in args.modes:
+            try:
+                results = [await run(module, port, MODES[mode], args) for _ in range(args.rounds)]
+            except (RuntimeError, TimeoutError, httpx.HTTPError) as e:
+                print(f"{app_name:<12}{mode:<7}failed: {type(e).__name__}: {e}")
+                continue
+            row = {key: statistics.median(result[key] for result in results) for key in results[0]}
+            print(f"{app_name:<12}{mode:<7}{row['boot']:>9.1f}{row['first']:>9.2f}{row['p50']:>9.2f}"
+                  f"{row['p99']:>9.2f}{row['max']:>9.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+"""ORM 앱 시작 시간 프로파일러
+
+각 앱에 대해 다음 두 가지를 측정한다.
+- import 시간: `python -X importtime` 출력에서 누적 시간 상위 모듈
+- time-to-first-healthy: uvicorn 프로세스 시작부터 /health 가 200 을 반환할 때까지
+
+    $ python scripts/profile_startup.py                 # 3개 앱 모두
+    $ python scripts/profile_startup.py sqlalchemy      # 특정 앱만
+    $ SKIP_SCHEMA_INIT=1 python scripts/profile_startup.py
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+APPS = {
+    "sqlalchemy": ("apps.sqlalchemy_app.main", 9001),
+    "tortoise": ("apps.tortoise_app.main", 9002),
+    "edgedb": ("apps.edgedb_app.main", 9003),
+}
+
+
+def measure_import_time(module: str, top: int) -> tuple[float, list[tuple[int, str]]]:
+    """-X importtime 으로 모듈 import 시간 측정 (총 ms, 누적 상위 모듈)"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    # 자식 모듈이 부모보다 먼저 출력되므로 대상 모듈 직전까지의 depth-1 항목이 직접 의존성
+    total_us = 0
+    children: list[tuple[int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 0:
+            if name.strip() == module:
+                total_us = int(cumulative)
+                break
+            children = []
+        elif depth == 1:
+            children.append((int(cumulative), name.strip()))
+
+    children.sort(reverse=True)
+    return total_us / 1000, children[:top]
+
+
+def measure_time_to_healthy(module: str, port: int, timeout: float) -> float:
+    """uvicorn 시작부터 /health 200 응답까지 걸린 시간 (ms)"""
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", f"{module}:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+        env=os.environ.copy(),
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f"server exited with code {proc.returncode}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+        raise TimeoutError(f"/health not ready within {timeout}s")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("apps", nargs="*", help=f"측정할 앱 ({', '.join(APPS)})")
+    parser.add_argument("--top", type=int, default=8, help="출력할 무거운 import 개수")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--imports-only", action="store_true", help="서버 기동 측정 생략")
+    args = parser.parse_args()
+    unknown = set(args.apps) - set(APPS)
+    if unknown:
+        parser.error(f"unknown app: {', '.join(sorted(unknown))}")
+
+    for name in args.apps or APPS:
+        module, port = APPS[name]
+        print(f"=== {name} ({module})")
+
+        total_ms, heaviest = measure_import_time(module, args.top)
+        print(f"import time: {total_ms:.1f}ms")
+        for us, imported in heaviest:
+            print(f"  {us / 1000:8.1f}ms  {imported}")
+
+        if not args.imports_only:
+            try:
+                ready_ms = measure_time_to_healthy(module, port, args.timeout)
+                print(f"time-to-first-healthy: {ready_ms:.1f}ms")
+            except (RuntimeError, TimeoutError) as e:
+                print(f"time-to-first-healthy: failed ({e})")
+        print()
+
+
+if __name__ == "__main__":
+    main()
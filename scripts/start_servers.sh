@@ -11,6 +11,14 @@ if ! command -v poetry &> /dev/null; then
     exit 1
 fi
 
+# 스키마 마이그레이션은 워커 시작과 분리해 1회만 실행
+echo "Running schema migrations..."
+poetry run python -m apps.sqlalchemy_app.migrate || exit 1
+poetry run python -m apps.tortoise_app.migrate || exit 1
+
+# 워커는 스키마 초기화 없이 바로 기동
+export SKIP_SCHEMA_INIT=1
+
 # 백그라운드에서 각 서버 실행
 echo "Starting SQLAlchemy server on port 8001..."
 poetry run gunicorn apps.sqlalchemy_app.main:app --workers 4 --worker-class uvicorn.workers.UvicornWorker --bind 0.0.0.0:8001 --daemon &
@@ -15,6 +15,7 @@ class ORMPerformanceTest(HttpUser):
         """테스트 시작 시 초기 설정"""
         self.created_users = []
         self.created_posts = []
+        self.etags = {}  # URL별 마지막 ETag (조건부 재조회용)
         self.orm_type = self.detect_orm_type()
         
     def detect_orm_type(self):
@@ -43,7 +44,9 @@ class ORMPerformanceTest(HttpUser):
             "email": self.generate_email()
         }
         
-        with self.client.post("/users", json=user_data, catch_response=True, name="create_user") as response:
+        # 재시도 시 같은 키를 보내면 서버가 저장된 응답으로 처리 (IDEMPOTENCY_ENABLED=1)
+        headers = {"Idempotency-Key": str(uuid.uuid4())}
+        with self.client.post("/users", json=user_data, headers=headers, catch_response=True, name="create_user") as response:
             if response.status_code == 201 or response.status_code == 200:
                 user = response.json()
                 self.created_users.append(user)
@@ -100,7 +103,9 @@ class ORMPerformanceTest(HttpUser):
             "user_id": user["id"]
         }
         
-        with self.client.post("/posts", json=post_data, catch_response=True, name="create_post") as response:
+        # 재시도 시 같은 키를 보내면 서버가 저장된 응답으로 처리 (IDEMPOTENCY_ENABLED=1)
+        headers = {"Idempotency-Key": str(uuid.uuid4())}
+        with self.client.post("/posts", json=post_data, headers=headers, catch_response=True, name="create_post") as response:
             if response.status_code == 201 or response.status_code == 200:
                 post = response.json()
                 self.created_posts.append(post)
@@ -144,6 +149,41 @@ class ORMPerformanceTest(HttpUser):
             else:
                 response.failure(f"Failed to get user posts: {response.status_code}")
 
+    @task(3)  # 가중치 3: 캐시된 응답 재검증 (If-None-Match)
+    def revalidate_user_posts(self):
+        """ETag 재검증 테스트 (클라이언트 캐시가 있는 경우)"""
+        if not self.created_users:
+            return
+        
+        user = random.choice(self.created_users)
+        path = f"/users/{user['id']}/posts?skip=0&limit=10"
+        headers = {"If-None-Match": self.etags[path]} if path in self.etags else {}
+        
+        with self.client.get(path, headers=headers, catch_response=True, name="revalidate_user_posts") as response:
+            if response.status_code in (200, 304):
+                self.etags[path] = response.headers.get("ETag", self.etags.get(path))
+                response.success()
+            elif response.status_code == 404:
+                # 사용자가 없을 수 있음
+                response.success()
+            else:
+                response.failure(f"Failed to revalidate user posts: {response.status_code}")
+
+    @task(2)  # 가중치 2: 여러 사용자 한 번에 조회 (id 배치)
+    def get_users_batch(self):
+        """사용자 배치 조회 테스트 (?ids=, 없는 id 는 null)"""
+        if not self.created_users:
+            return
+
+        users = random.sample(self.created_users, min(len(self.created_users), 20))
+        ids = ",".join(str(user["id"]) for user in users)
+
+        with self.client.get(f"/users?ids={ids}", catch_response=True, name="get_users_batch") as response:
+            if response.status_code == 200 and len(response.json()) == len(users):
+                response.success()
+            else:
+                response.failure(f"Failed to get users batch: {response.status_code}")
+
 
 
 